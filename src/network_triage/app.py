@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import importlib.metadata
 import ipaddress
 import platform
 import sys
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +17,7 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.content import Content
 from textual.reactive import reactive
 from textual.widgets import (
     Button,
@@ -30,36 +33,22 @@ from textual.widgets import (
     Static,
     TextArea,
 )
-
-from .plugins import TUIPlugin, load_plugins
+from textual.worker import get_current_worker
 
 # Phase 4 Widgets
-try:
-    from tui.widgets import (
-        ConnectionMonitorWidget,
-        DNSResolverWidget,
-        LanBandwidthWidget,
-        LatencyAnalyzerWidget,
-        PortScannerWidget,
-        SchedulerWidget,
-        TrafficHealthWidget,
-    )
-    from tui.widgets.base import TaskCompleted
-    from tui.widgets.components import HistoryInput
-except ImportError:
-    # Fallback for local development if tui is not in path correctly
-    sys.path.append(str(sys.path[0] + "/.."))
-    from tui.widgets import (
-        ConnectionMonitorWidget,
-        DNSResolverWidget,
-        LanBandwidthWidget,
-        LatencyAnalyzerWidget,
-        PortScannerWidget,
-        SchedulerWidget,
-        TrafficHealthWidget,
-    )
-    from tui.widgets.base import TaskCompleted
-    from tui.widgets.components import HistoryInput
+from tui.widgets import (
+    ConnectionMonitorWidget,
+    DNSResolverWidget,
+    LanBandwidthWidget,
+    LatencyAnalyzerWidget,
+    PortScannerWidget,
+    SchedulerWidget,
+    TrafficHealthWidget,
+)
+from tui.widgets.base import TaskCompleted
+from tui.widgets.components import HistoryInput
+
+from .plugins import TUIPlugin, load_plugins
 
 # ----------------------------------------------------------------------------
 # OS-Agnostic Import (Selects the correct toolkit based on your OS)
@@ -77,7 +66,30 @@ match current_os:
         sys.stderr.write(f"Unsupported OS: {current_os}\n")
         sys.exit(1)
 
-net_tool: NetworkToolkit = NetworkTriageToolkit()
+
+# ContentSwitcher mounts every tool at once, and several of them start thread
+# workers that reach for the toolkit together; only one may build it.
+_NET_TOOL_LOCK = threading.Lock()
+
+
+@functools.cache
+def _build_net_tool() -> NetworkToolkit:
+    return NetworkTriageToolkit()
+
+
+def _net_tool() -> NetworkToolkit:
+    """Return the shared toolkit, creating it on first use.
+
+    Dashboard.refresh_data, ConnectionTool.refresh_connection and
+    NmapTool.detect_subnet_worker all call this from worker threads as the app
+    mounts. functools.cache alone would let each of them build a toolkit, and the
+    losers' state (cached system info, public IP, stop events) would be lost, so
+    creation is serialised behind a lock.
+    """
+    with _NET_TOOL_LOCK:
+        return _build_net_tool()
+
+
 # ----------------------------------------------------------------------------
 
 
@@ -91,19 +103,10 @@ class InfoBox(Static):
         if initial_value:
             self.value_text = initial_value
 
-    def compose(self) -> ComposeResult:
-        yield Label(self.title_text, classes="label-title")
-        yield Label(self.value_text, classes="label-value")
-
-    def watch_title_text(self, new_val: str) -> None:
-        if not self.is_mounted:
-            return
-        self.query_one(".label-title", Label).update(new_val)
-
-    def watch_value_text(self, new_val: str) -> None:
-        if not self.is_mounted:
-            return
-        self.query_one(".label-value", Label).update(new_val)
+    def render(self) -> Content:
+        # Drawn as one block of text rather than two child Labels; both reactives
+        # repaint on change. Plain Content, so values are never parsed as markup.
+        return Content(f"{self.title_text}\n{self.value_text}")
 
     def on_click(self) -> None:
         """Copy value to clipboard on click."""
@@ -116,12 +119,20 @@ class InfoBox(Static):
 
 class Dashboard(Container):
     def compose(self) -> ComposeResult:
-        yield InfoBox("Hostname", id="info_hostname")
-        yield InfoBox("Operating System", id="info_os")
-        yield InfoBox("Internal IP", id="info_internal_ip")
-        yield InfoBox("Gateway", id="info_gateway")
-        yield InfoBox("Public IP", id="info_public_ip")
-        yield InfoBox("Toolkit Health", id="info_health")
+        # Boxes keyed by the field they show, so refreshes skip selector lookups
+        self._sys_boxes = {
+            "Hostname": InfoBox("Hostname", id="info_hostname"),
+            "OS": InfoBox("Operating System", id="info_os"),
+        }
+        self._ip_boxes = {
+            "Internal IP": InfoBox("Internal IP", id="info_internal_ip"),
+            "Gateway": InfoBox("Gateway", id="info_gateway"),
+            "Public IP": InfoBox("Public IP", id="info_public_ip"),
+        }
+        self._health_box = InfoBox("Toolkit Health", id="info_health")
+        yield from self._sys_boxes.values()
+        yield from self._ip_boxes.values()
+        yield self._health_box
 
     def on_mount(self) -> None:
         self.refresh_data()
@@ -129,18 +140,19 @@ class Dashboard(Container):
 
     @work(thread=True)
     def refresh_data(self) -> None:
-        sys_info = net_tool.get_system_info()
-        ip_info = net_tool.get_ip_info()
-        health = net_tool.health_check()
+        tool = _net_tool()
+        sys_info = tool.get_system_info()
+        ip_info = tool.get_ip_info()
+        health = tool.health_check()
         self.app.call_from_thread(self._update_ui, sys_info, ip_info, health)
 
     def _update_ui(self, sys_info: dict[str, str], ip_info: dict[str, str], health: dict[str, Any]) -> None:
-        self.query_one("#info_hostname", InfoBox).value_text = sys_info.get("Hostname", "N/A")
-        self.query_one("#info_os", InfoBox).value_text = sys_info.get("OS", "N/A")
-        self.query_one("#info_internal_ip", InfoBox).value_text = ip_info.get("Internal IP", "N/A")
-        self.query_one("#info_gateway", InfoBox).value_text = ip_info.get("Gateway", "N/A")
-        self.query_one("#info_public_ip", InfoBox).value_text = ip_info.get("Public IP", "N/A")
-        self.query_one("#info_health", InfoBox).value_text = health.get("status", "N/A")
+        with self.app.batch_update():
+            for key, box in self._sys_boxes.items():
+                box.value_text = sys_info.get(key, "N/A")
+            for key, box in self._ip_boxes.items():
+                box.value_text = ip_info.get(key, "N/A")
+            self._health_box.value_text = health.get("status", "N/A")
 
 
 class ConnectionTool(Container):
@@ -151,21 +163,24 @@ class ConnectionTool(Container):
             yield Button("🔄 Refresh Connection Info", id="btn_refresh_conn", variant="default")
             yield Label("", id="conn_status")
 
+        # Boxes keyed by their connection-details field
+        self._detail_boxes = {
+            "Interface": InfoBox("Interface Name", id="iface_name"),
+            "Connection Type": InfoBox("Type", id="iface_type"),
+            "Status": InfoBox("Status", id="iface_status"),
+            "IP Address": InfoBox("IP Address", id="iface_ip"),
+            "MAC Address": InfoBox("MAC Address", id="iface_mac"),
+            "Netmask": InfoBox("Subnet Mask", id="iface_mask"),
+            "Speed": InfoBox("Speed", id="iface_speed"),
+            "MTU": InfoBox("MTU", id="iface_mtu"),
+            "DNS Servers": InfoBox("DNS Servers", id="iface_dns"),
+            "SSID": InfoBox("Wi-Fi SSID", id="wifi_ssid"),
+            "Channel": InfoBox("Channel", id="wifi_channel"),
+            "Signal": InfoBox("Signal", id="wifi_signal"),
+            "Noise": InfoBox("Noise", id="wifi_noise"),
+        }
         with Container(id="conn_grid"):
-            yield InfoBox("Interface Name", id="iface_name")
-            yield InfoBox("Type", id="iface_type")
-            yield InfoBox("Status", id="iface_status")
-            yield InfoBox("IP Address", id="iface_ip")
-            yield InfoBox("MAC Address", id="iface_mac")
-            yield InfoBox("Subnet Mask", id="iface_mask")
-            yield InfoBox("Speed", id="iface_speed")
-            yield InfoBox("MTU", id="iface_mtu")
-            yield InfoBox("DNS Servers", id="iface_dns")
-
-            yield InfoBox("Wi-Fi SSID", id="wifi_ssid")
-            yield InfoBox("Channel", id="wifi_channel")
-            yield InfoBox("Signal", id="wifi_signal")
-            yield InfoBox("Noise", id="wifi_noise")
+            yield from self._detail_boxes.values()
 
     def on_mount(self) -> None:
         self.refresh_connection()
@@ -178,28 +193,14 @@ class ConnectionTool(Container):
     @work(thread=True)
     def refresh_connection(self) -> None:
         self.app.call_from_thread(self.query_one("#conn_status", Label).update, "Scanning interface...")
-        details = net_tool.get_connection_details()
+        details = _net_tool().get_connection_details()
         self.app.call_from_thread(self.update_ui, details)
 
     def update_ui(self, details: dict[str, str]) -> None:
-        self.query_one("#conn_status", Label).update("Updated.")
-
-        def set_val(widget_id: str, key: str) -> None:
-            self.query_one(f"#{widget_id}", InfoBox).value_text = details.get(key, "N/A")
-
-        set_val("iface_name", "Interface")
-        set_val("iface_type", "Connection Type")
-        set_val("iface_status", "Status")
-        set_val("iface_ip", "IP Address")
-        set_val("iface_mac", "MAC Address")
-        set_val("iface_mask", "Netmask")
-        set_val("iface_speed", "Speed")
-        set_val("iface_mtu", "MTU")
-        set_val("iface_dns", "DNS Servers")
-        set_val("wifi_ssid", "SSID")
-        set_val("wifi_channel", "Channel")
-        set_val("wifi_signal", "Signal")
-        set_val("wifi_noise", "Noise")
+        with self.app.batch_update():
+            self.query_one("#conn_status", Label).update("Updated.")
+            for key, box in self._detail_boxes.items():
+                box.value_text = details.get(key, "N/A")
 
 
 class PingTool(Container):
@@ -228,11 +229,10 @@ class PingTool(Container):
         self.query_one("#stop_ping_btn", Button).disabled = False
         self.query_one("#ping_input", HistoryInput).disabled = True
         self.query_one("#ping_log", Log).clear()
-        self.query_one("#ping_log", Log).write(f"--- Pinging {host} ---\n")
         self.start_ping_worker(host)
 
     def action_stop_ping(self) -> None:
-        net_tool.stop_ping()
+        _net_tool().stop_ping()
         self.workers.cancel_group(self, "ping_job")
         self.query_one("#ping_log", Log).write("\n--- Stopped ---\n")
         self.query_one("#start_ping_btn", Button).disabled = False
@@ -242,12 +242,18 @@ class PingTool(Container):
         # Ping is manually stopped, but we can still count it as a "completed" task session
         self.post_message(TaskCompleted("ping"))
 
-    @work(thread=True, group="ping_job")
-    def start_ping_worker(self, host: str) -> None:
+    @work(group="ping_job")
+    async def start_ping_worker(self, host: str) -> None:
+        ping_log = self.query_one("#ping_log", Log)
+
         def write_to_log(line: str) -> None:
-            self.app.call_from_thread(self.query_one("#ping_log", Log).write, line)
+            ping_log.write(line)
 
-        net_tool.continuous_ping(host, write_to_log)
+        # Resolve once here (cached, off the UI thread) so ping itself starts
+        # without a resolver round trip.
+        ip = await _net_tool().resolve_host_async(host)
+        ping_log.write(f"--- Pinging {host} ---\n" if ip == host else f"--- Pinging {host} ({ip}) ---\n")
+        await _net_tool().continuous_ping_async(ip, write_to_log)
 
 
 class LLDPTool(Container):
@@ -282,7 +288,7 @@ class LLDPTool(Container):
 
     def action_stop_scan(self) -> None:
         self.scan_active = False
-        net_tool.stop_discovery_capture()
+        _net_tool().stop_discovery_capture()
         self.query_one("#lldp_status", Label).update("Stopped.")
         self.query_one("#btn_lldp_start", Button).disabled = False
         self.query_one("#btn_lldp_stop", Button).disabled = True
@@ -302,7 +308,7 @@ class LLDPTool(Container):
                 )
             self.app.call_from_thread(self.update_log, line)
 
-        net_tool.start_discovery_capture(write_to_log, timeout=60)
+        _net_tool().start_discovery_capture(write_to_log, timeout=60)
 
         if self.scan_active:
             self.app.call_from_thread(self.scan_finished)
@@ -318,60 +324,89 @@ class LLDPTool(Container):
 
 class SpeedTestTool(Container):
     def compose(self) -> ComposeResult:
-        yield Button("🚀 Run Speed Test", id="btn_speed", variant="primary")
+        with Horizontal(classes="tool_header"):
+            yield Button("🚀 Run Speed Test", id="btn_speed", variant="primary")
+            yield Button("Stop", id="btn_speed_stop", variant="error", disabled=True)
         # Indeterminate progress bar (total=None means it pulses)
         yield ProgressBar(id="speed_progress", total=None, show_eta=False, classes="hidden")
         yield Label("", id="speed_status")
 
+        # Boxes keyed by their speed test result field
+        self._result_boxes = {
+            "Download": InfoBox("Download", id="spd_download"),
+            "Upload": InfoBox("Upload", id="spd_upload"),
+            "Ping": InfoBox("Ping", id="spd_ping"),
+            "ISP": InfoBox("ISP", id="spd_isp"),
+            "Server": InfoBox("Server", id="spd_server"),
+        }
         with Container(id="speed_results"):
-            yield InfoBox("Download", id="spd_download")
-            yield InfoBox("Upload", id="spd_upload")
-            yield InfoBox("Ping", id="spd_ping")
-            yield InfoBox("ISP", id="spd_isp")
-            yield InfoBox("Server", id="spd_server")
+            yield from self._result_boxes.values()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn_speed":
-            self.start_test()
+        match event.button.id:
+            case "btn_speed":
+                self.start_test()
+            case "btn_speed_stop":
+                self.action_stop_test()
 
     def start_test(self) -> None:
-        self.query_one("#btn_speed", Button).disabled = True
-        self.query_one("#speed_status", Label).update("Running test (this may take 20-30s)...")
+        with self.app.batch_update():
+            self.query_one("#btn_speed", Button).disabled = True
+            self.query_one("#btn_speed_stop", Button).disabled = False
+            self.query_one("#speed_status", Label).update("Running test (this may take 20-30s)...")
 
-        # Show and start animation
-        bar = self.query_one("#speed_progress", ProgressBar)
-        bar.remove_class("hidden")
+            # Show and start animation
+            bar = self.query_one("#speed_progress", ProgressBar)
+            bar.remove_class("hidden")
 
-        for w in self.query(InfoBox):
-            w.value_text = "..."
+            for box in self._result_boxes.values():
+                box.value_text = "..."
         self.run_speedtest_worker()
 
-    @work(thread=True)
+    def action_stop_test(self) -> None:
+        # Cancelling the worker alone would leave speedtest transferring in its
+        # thread; the stop event makes the download and upload threads exit.
+        _net_tool().stop_speed_test()
+        self.workers.cancel_group(self, "speedtest_job")
+        # Run stays disabled until the worker has left the transfer: a new run
+        # would clear the stop event and share the speedtest client with it.
+        with self.app.batch_update():
+            self.query_one("#btn_speed_stop", Button).disabled = True
+            self.query_one("#speed_status", Label).update("Stopping...")
+            for box in self._result_boxes.values():
+                box.value_text = "N/A"
+
+    @work(thread=True, exclusive=True, group="speedtest_job")
     def run_speedtest_worker(self) -> None:
-        results = net_tool.run_speed_test()
-        self.app.call_from_thread(self.display_results, results)
+        results = _net_tool().run_speed_test()
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.display_results, results)
+        elif self.is_attached:
+            # Stopped while running; drop the partial results
+            self.app.call_from_thread(self.stop_finished)
+
+    def stop_finished(self) -> None:
+        with self.app.batch_update():
+            self.query_one("#btn_speed", Button).disabled = False
+            self.query_one("#speed_progress", ProgressBar).add_class("hidden")
+            self.query_one("#speed_status", Label).update("Stopped.")
 
     def display_results(self, results: dict[str, str]) -> None:
-        self.query_one("#btn_speed", Button).disabled = False
+        with self.app.batch_update():
+            self.query_one("#btn_speed", Button).disabled = False
+            self.query_one("#btn_speed_stop", Button).disabled = True
 
-        # Hide animation
-        bar = self.query_one("#speed_progress", ProgressBar)
-        bar.add_class("hidden")
-
-        self.query_one("#speed_status", Label).update("Done.")
-        if "Error" in results:
-            self.notify(results["Error"], severity="error")
-            return
+            # Hide animation
+            bar = self.query_one("#speed_progress", ProgressBar)
+            bar.add_class("hidden")
 
-        # Helper to set values
-        def set_val(uid: str, key: str) -> None:
-            self.query_one(f"#{uid}", InfoBox).value_text = results.get(key, "N/A")
+            self.query_one("#speed_status", Label).update("Done.")
+            if "Error" in results:
+                self.notify(results["Error"], severity="error")
+                return
 
-        set_val("spd_download", "Download")
-        set_val("spd_upload", "Upload")
-        set_val("spd_ping", "Ping")
-        set_val("spd_isp", "ISP")
-        set_val("spd_server", "Server")
+            for key, box in self._result_boxes.items():
+                box.value_text = results.get(key, "N/A")
 
 
 class NmapTool(Container):
@@ -444,7 +479,7 @@ class NmapTool(Container):
 
     @work(thread=True)
     def detect_subnet_worker(self) -> None:
-        details = net_tool.get_connection_details()
+        details = _net_tool().get_connection_details()
         ip = details.get("IP Address")
         mask = details.get("Netmask")
 
@@ -482,7 +517,7 @@ class NmapTool(Container):
 
     @work(thread=True)
     def run_scan_worker(self, target: str, args: str) -> None:
-        results = net_tool.run_network_scan(target, args)
+        results = _net_tool().run_network_scan(target, args)
         self.app.call_from_thread(self.display_results, results)
 
     def display_results(self, results: list[dict[str, str]]) -> None:
@@ -560,7 +595,7 @@ class TracerouteTool(Container):
 
     @work(thread=True)
     def run_trace_worker(self, host: str) -> None:
-        result = net_tool.traceroute_test(host)
+        result = _net_tool().traceroute_test(host)
         self.app.call_from_thread(self.display_result, result)
 
     def display_result(self, result: str) -> None:
@@ -708,6 +743,11 @@ class NetworkTriageApp(App[None]):
     def on_mount(self) -> None:
         self.query_one("#tab_dashboard").add_class("-active")
 
+    def on_unmount(self) -> None:
+        # Nothing to tear down if no tool ever touched the backend
+        if _build_net_tool.cache_info().currsize:
+            _net_tool().close()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
         if btn_id and btn_id.startswith("tab_"):
@@ -69,7 +69,7 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
             "components": components,
         }
 
-    def get_system_info(self) -> dict[str, str]:
+    def _read_system_info(self) -> dict[str, str]:
         """Get system information (OS, hostname, etc).
 
         Retrieves system-level information using Linux commands:
@@ -77,6 +77,8 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
         - uname for kernel version
         - hostname for system hostname
 
+        Runs once per toolkit; ``get_system_info`` serves the cached result.
+
         Returns:
             dict: System information with keys:
                 - OS: Linux distribution name and version
@@ -163,10 +165,13 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
             # Extract gateway from route output
             gateway = parts[2] if len(parts) >= 3 else "Unknown"
 
-            # Get public IP via HTTP
-            try:
+            # Get public IP via HTTP, reusing a recent answer for the same network
+            def _fetch_public_ip() -> str:
                 public_data = safe_http_request("https://api.ipify.org?format=json", timeout=5)
-                public_ip = str(public_data.get("ip", "Unavailable"))
+                return str(public_data.get("ip", "Unavailable"))
+
+            try:
+                public_ip = self._cached_public_ip(internal_ip, gateway, _fetch_public_ip)
             except Exception as e:
                 logger.warning(f"Could not get public IP: {e}")
                 public_ip = "Unavailable"
@@ -449,16 +454,16 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
                 if "*" in line:
                     hop_info["Status"] = "No response"
                 else:
-                    hostname_ip_match = re.search(r"([\\w\\-.]+)\\s+\\(([\\d.]+)\\)", line)
+                    hostname_ip_match = re.search(r"([\w\-.]+)\s+\(([\d.]+)\)", line)
                     if hostname_ip_match:
                         hop_info["Hostname"] = hostname_ip_match.group(1)
                         hop_info["IP"] = hostname_ip_match.group(2)
                     else:
-                        ip_match = re.search(r"(\\d+\\.\\d+\\.\\d+\\.\\d+)", line)
+                        ip_match = re.search(r"(\d+\.\d+\.\d+\.\d+)", line)
                         if ip_match:
                             hop_info["IP"] = ip_match.group(1)
 
-                    latencies = re.findall(r"([\\d.]+)\\s+ms", line)
+                    latencies = re.findall(r"([\d.]+)\s+ms", line)
                     if latencies:
                         hop_info["Latencies"] = [float(lat) for lat in latencies]
                         hop_info["Avg Latency"] = sum(hop_info["Latencies"]) / len(hop_info["Latencies"])
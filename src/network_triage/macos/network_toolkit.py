@@ -68,6 +68,8 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
     def get_system_info(self) -> dict[str, str]:
         """Gather basic system information with macOS-specific name resolution.
 
+        The lookup runs once per toolkit and later calls reuse it.
+
         Returns:
             dict: Contains 'OS' (with marketing name) and 'Hostname'
 
@@ -76,49 +78,52 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
 
         """
         try:
-            os_string = f"{platform.system()} {platform.release()}"
-            hostname = socket.gethostname()
+            return super().get_system_info()
+        except Exception as e:
+            log_exception(e, context="get_system_info")
+            return {"OS": "N/A", "Hostname": "N/A"}
 
-            try:
-                # Get marketing name from system
-                product_name = safe_subprocess_run(
-                    ["sw_vers", "-productName"],
-                    timeout=5,
-                    check_command_exists=False,
-                )
-                product_version = safe_subprocess_run(
-                    ["sw_vers", "-productVersion"],
-                    timeout=5,
-                    check_command_exists=False,
-                )
+    def _read_system_info(self) -> dict[str, str]:
+        """Resolve the OS marketing name and hostname; cached by the base class."""
+        os_string = f"{platform.system()} {platform.release()}"
+        hostname = socket.gethostname()
 
-                # Parse major version and map to marketing name
-                major_version = int(product_version.split(".")[0])
-                marketing_names = {
-                    15: "Sequoia",
-                    14: "Sonoma",
-                    13: "Ventura",
-                    12: "Monterey",
-                    11: "Big Sur",
-                    10: "Catalina",
-                }
-                marketing_name = marketing_names.get(major_version, "")
-
-                if marketing_name:
-                    os_string = f"{product_name} {marketing_name} ({platform.system()} {platform.release()})"
-                else:
-                    os_string = f"{product_name} ({platform.system()} {platform.release()})"
+        try:
+            # Get marketing name from system
+            product_name = safe_subprocess_run(
+                ["sw_vers", "-productName"],
+                timeout=5,
+                check_command_exists=False,
+            )
+            product_version = safe_subprocess_run(
+                ["sw_vers", "-productVersion"],
+                timeout=5,
+                check_command_exists=False,
+            )
 
-            except (CommandNotFoundError, NetworkCommandError, ParseError) as e:
-                logger.debug(f"Could not resolve macOS marketing name: {e}. Using fallback.")
-                # Fallback to generic Darwin version
-                os_string = f"macOS ({platform.system()} {platform.release()})"
+            # Parse major version and map to marketing name
+            major_version = int(product_version.split(".")[0])
+            marketing_names = {
+                15: "Sequoia",
+                14: "Sonoma",
+                13: "Ventura",
+                12: "Monterey",
+                11: "Big Sur",
+                10: "Catalina",
+            }
+            marketing_name = marketing_names.get(major_version, "")
 
-            return {"OS": os_string, "Hostname": hostname}
+            if marketing_name:
+                os_string = f"{product_name} {marketing_name} ({platform.system()} {platform.release()})"
+            else:
+                os_string = f"{product_name} ({platform.system()} {platform.release()})"
 
-        except Exception as e:
-            log_exception(e, context="get_system_info")
-            return {"OS": "N/A", "Hostname": "N/A"}
+        except (CommandNotFoundError, NetworkCommandError, ParseError) as e:
+            logger.debug(f"Could not resolve macOS marketing name: {e}. Using fallback.")
+            # Fallback to generic Darwin version
+            os_string = f"macOS ({platform.system()} {platform.release()})"
+
+        return {"OS": os_string, "Hostname": hostname}
 
     def get_ip_info(self) -> dict[str, str]:
         """Fetch local IP, public IP, and gateway information.
@@ -176,10 +181,13 @@ class NetworkTriageToolkit(NetworkTriageToolkitBase):
             logger.debug(f"Could not get gateway: {e}")
             info["Gateway"] = "Could not determine"
 
-        # Get public IP via HTTP request
-        try:
+        # Get public IP via HTTP request, reusing a recent answer for the same network
+        def _fetch_public_ip() -> str:
             data = safe_http_request("https://ipinfo.io/json", timeout=5, retries=2)
-            info["Public IP"] = data.get("ip", "N/A")
+            return str(data.get("ip", "N/A"))
+
+        try:
+            info["Public IP"] = self._cached_public_ip(info["Internal IP"], info["Gateway"], _fetch_public_ip)
         except NetworkConnectivityError as e:
             logger.debug(f"Could not get public IP: {e}")
             info["Public IP"] = "Error fetching public IP"
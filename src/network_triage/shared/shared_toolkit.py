@@ -1,22 +1,480 @@
+import asyncio
+import errno
 import functools
+import io
+import locale
+import multiprocessing
 import os
 import platform
+import selectors
 import shutil
 import socket
 import struct
 import subprocess
+import tempfile
 import threading
+import time
 import xml.etree.ElementTree as ET
-from collections.abc import Callable
-from typing import Any, Protocol, runtime_checkable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import IO, Any, Protocol, cast, runtime_checkable
 
 import speedtest
-from scapy.all import inet_ntoa, sniff
-from scapy.contrib.cdp import CDPAddrRecord, CDPMsg
+from scapy.all import AsyncSniffer, conf
 from scapy.contrib.lldp import LLDPDU
 
 from ..utils import monitor_long_running, track_performance
 
+# Ethernet II header length, plus the 802.1Q tag that may follow the source MAC.
+_ETHER_HEADER_LEN = 14
+_VLAN_TAG_LEN = 4
+_ETHERTYPE_VLAN = b"\x81\x00"
+
+# ping output is read as raw bytes and decoded once per batch of complete lines. Windows
+# console tools write in the OEM code page (e.g. CP437), not the ANSI one text mode used.
+_PING_READ_SIZE = 8192
+_PING_ENCODING = "oem" if platform.system() == "Windows" else locale.getpreferredencoding(False)
+# Windows ping stops after four echoes unless given -t; elsewhere ping runs until stopped.
+_PING_COMMAND = ("ping", "-t") if platform.system() == "Windows" else ("ping",)
+
+# Kernel-side capture filter for LLDP (EtherType 0x88cc) and CDP (Cisco multicast MAC) frames.
+_DISCOVERY_BPF_FILTER = "ether proto 0x88cc or ether dst 01:00:0c:cc:cc:cc"
+# LLDP TLV header: 7-bit type and 9-bit length packed into one big-endian short.
+_LLDP_TLV_HDR = struct.Struct("!H")
+# Fixed-width LLDP records: capabilities (available, enabled bitmaps), the OUI and
+# subtype that open every organizationally specific TLV, and the 802.1 Port VLAN ID.
+_LLDP_CAPABILITIES = struct.Struct("!HH")
+_LLDP_ORG_HDR = struct.Struct("!3sB")
+_LLDP_PORT_VLAN = struct.Struct("!H")
+
+# CDP rides in 802.3 frames to a Cisco multicast MAC, behind an 8-byte LLC/SNAP header
+# (DSAP, SSAP, control, OUI, protocol ID 0x2000) and a 4-byte version/TTL/checksum header.
+_CDP_MULTICAST = b"\x01\x00\x0c\xcc\xcc\xcc"
+_CDP_SNAP = b"\xaa\xaa\x03\x00\x00\x0c\x20\x00"
+_CDP_HEADER_LEN = 4
+# CDP TLV header: type and length (header included), both big-endian shorts.
+_CDP_TLV_HDR = struct.Struct("!HH")
+_CDP_ADDR_COUNT = struct.Struct("!I")
+_CDP_ADDR_LEN = struct.Struct("!H")
+_CDP_DEVICE_ID = 0x0001
+_CDP_ADDRESSES = 0x0002
+_CDP_PORT_ID = 0x0003
+_CDP_PLATFORM = 0x0006
+
+# nmap output left unread after a parse error is discarded in chunks of this size.
+_NMAP_DRAIN_SIZE = 64 * 1024
+
+# How long a speedtest.net best-server pick is reused before re-probing all candidates.
+_SPEEDTEST_SERVER_TTL = 300.0
+
+# How long a public IP lookup is reused while the local address and gateway are unchanged.
+_PUBLIC_IP_TTL = 900.0
+
+# Resolved names are reused for a minute and failures for a few seconds; the cache is
+# swept of expired entries once it grows past _DNS_CACHE_SWEEP_SIZE.
+_DNS_POSITIVE_TTL = 60.0
+_DNS_NEGATIVE_TTL = 5.0
+_DNS_CACHE_SWEEP_SIZE = 1024
+_DNS_CACHE: dict[str, tuple[float, str | socket.gaierror]] = {}
+# Same, for lookups that take whichever address family the resolver prefers.
+_HOST_ADDRESS_CACHE: dict[str, tuple[float, str | socket.gaierror]] = {}
+_ADDRINFO_CACHE: dict[str, tuple[float, tuple[tuple[int, str], ...] | socket.gaierror]] = {}
+
+# Sockets in flight per port_scan round; keeps well under select()'s FD_SETSIZE and
+# macOS's default 256-descriptor limit.
+_PORT_SCAN_BATCH = 128
+_CONNECT_IN_PROGRESS = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    errno.EALREADY,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+}
+
+
+def _dns_cache_get[T](cache: dict[str, tuple[float, T | socket.gaierror]], domain: str) -> T | None:
+    """Return the cached answer for a domain, or None on a miss.
+
+    Raises:
+        socket.gaierror: If a recent lookup of the domain failed.
+
+    """
+    entry = cache.get(domain)
+    if entry is None:
+        return None
+    expires, result = entry
+    if expires <= time.monotonic():
+        cache.pop(domain, None)
+        return None
+    if isinstance(result, socket.gaierror):
+        raise result
+    return result
+
+
+def _dns_cache_put[T](cache: dict[str, tuple[float, T | socket.gaierror]], domain: str, result: T | socket.gaierror) -> None:
+    """Store a lookup result, with the shorter TTL for failures."""
+    now = time.monotonic()
+    if len(cache) > _DNS_CACHE_SWEEP_SIZE:
+        for name in [name for name, (expires, _) in cache.items() if expires <= now]:
+            del cache[name]
+    ttl = _DNS_NEGATIVE_TTL if isinstance(result, socket.gaierror) else _DNS_POSITIVE_TTL
+    cache[domain] = (now + ttl, result)
+
+
+def _dns_lookup_cached(domain: str) -> str:
+    """Resolve a domain to an IPv4 address through the module-level TTL cache."""
+    cached = _dns_cache_get(_DNS_CACHE, domain)
+    if cached is not None:
+        return cached
+    try:
+        ip = socket.gethostbyname(domain)
+    except socket.gaierror as e:
+        _dns_cache_put(_DNS_CACHE, domain, e)
+        raise
+    _dns_cache_put(_DNS_CACHE, domain, ip)
+    return ip
+
+
+async def _dns_lookup_cached_async(domain: str, family: int = socket.AF_INET) -> str:
+    """Resolve a domain on the running loop, through the TTL cache.
+
+    Returns an IPv4 address by default; with ``socket.AF_UNSPEC`` it returns the
+    resolver's first answer, which may be IPv6.
+    """
+    cache = _DNS_CACHE if family == socket.AF_INET else _HOST_ADDRESS_CACHE
+    cached = _dns_cache_get(cache, domain)
+    if cached is not None:
+        return cached
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(domain, None, family=family, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        _dns_cache_put(cache, domain, e)
+        raise
+    ip = str(infos[0][4][0])
+    _dns_cache_put(cache, domain, ip)
+    return ip
+
+
+def _resolve_stream_targets(host: str) -> tuple[tuple[int, str], ...]:
+    """Resolve a host to at most one IPv6 and one IPv4 TCP target, cached like DNS lookups.
+
+    Returns:
+        Tuple of (address family, address) pairs in the resolver's preference order.
+
+    Raises:
+        socket.gaierror: If the host cannot be resolved.
+
+    """
+    cached = _dns_cache_get(_ADDRINFO_CACHE, host)
+    if cached is not None:
+        return cached
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        _dns_cache_put(_ADDRINFO_CACHE, host, e)
+        raise
+    targets: dict[int, str] = {}
+    for family, _, _, _, sockaddr in infos:
+        if family in {socket.AF_INET, socket.AF_INET6}:
+            targets.setdefault(family, str(sockaddr[0]))
+    result = tuple(targets.items())
+    _dns_cache_put(_ADDRINFO_CACHE, host, result)
+    return result
+
+
+def _lldp_payload(packet: Any) -> memoryview:
+    """Return a view of the LLDP TLV bytes of a captured frame.
+
+    Scapy keeps the bytes it dissected in ``packet.original``; viewing those
+    skips both the recursive ``build()`` that ``bytes(packet[LLDPDU].payload)``
+    triggers and the copy a slice would make. Packets crafted in memory have no
+    ``original`` and fall back to the build path.
+    """
+    frame = getattr(packet, "original", None)
+    if not frame:
+        return memoryview(bytes(packet[LLDPDU].payload))
+    offset = _ETHER_HEADER_LEN
+    if frame[12:14] == _ETHERTYPE_VLAN:
+        offset += _VLAN_TAG_LEN
+    return memoryview(frame)[offset:]
+
+
+def _lldp_id_value(value: memoryview) -> bytes:
+    """Chassis/Port ID: drop the leading subtype byte."""
+    return value[1:].tobytes()
+
+
+def _lldp_text_value(value: memoryview) -> bytes:
+    """Port Description/System Name: the whole value is the string."""
+    return value.tobytes()
+
+
+def _lldp_mgmt_address(value: memoryview) -> str | None:
+    """Management Address: length byte, address subtype, address. Only IPv4 is decoded."""
+    if len(value) < 6 or value[1] != 1:
+        return None
+    return socket.inet_ntop(socket.AF_INET, value[2:6])
+
+
+# System Capabilities bit positions, per IEEE 802.1AB.
+_LLDP_CAPABILITY_NAMES = (
+    "Other",
+    "Repeater",
+    "Bridge",
+    "WLAN Access Point",
+    "Router",
+    "Telephone",
+    "DOCSIS Cable Device",
+    "Station Only",
+    "C-VLAN Component",
+    "S-VLAN Component",
+    "Two-port MAC Relay",
+)
+
+
+def _lldp_capabilities(value: memoryview) -> str | None:
+    """System Capabilities: names of the enabled capability bits."""
+    if len(value) < _LLDP_CAPABILITIES.size:
+        return None
+    _, enabled = _LLDP_CAPABILITIES.unpack_from(value)
+    names = [name for bit, name in enumerate(_LLDP_CAPABILITY_NAMES) if enabled & (1 << bit)]
+    return ", ".join(names) or None
+
+
+def _lldp_port_vlan(value: memoryview) -> int | None:
+    """IEEE 802.1 Port VLAN ID: the untagged (native) VLAN of the port; 0 means none."""
+    if len(value) < _LLDP_PORT_VLAN.size:
+        return None
+    (vlan,) = _LLDP_PORT_VLAN.unpack_from(value)
+    return vlan or None
+
+
+_LLDPDecoder = Callable[[memoryview], bytes | str | int | None]
+
+# TLV type -> (slot in _parse_lldp's result, value decoder). Add new TLVs here.
+_LLDP_TLV_HANDLERS: dict[int, tuple[int, _LLDPDecoder]] = {
+    1: (0, _lldp_id_value),
+    2: (1, _lldp_id_value),
+    4: (2, _lldp_text_value),
+    5: (3, _lldp_text_value),
+    7: (6, _lldp_capabilities),
+    8: (4, _lldp_mgmt_address),
+}
+# (OUI, subtype) of an organizationally specific TLV -> (slot, decoder of the data after them).
+_LLDP_ORG_HANDLERS: dict[tuple[bytes, int], tuple[int, _LLDPDecoder]] = {
+    (b"\x00\x80\xc2", 1): (5, _lldp_port_vlan),
+}
+_LLDP_TLV_END = 0
+_LLDP_TLV_ORG = 127
+
+
+def _parse_lldp(
+    buf: bytes | memoryview,
+) -> tuple[bytes | None, bytes | None, bytes | None, bytes | None, str | None, int | None, str | None]:
+    """Walk an LLDP TLV stream and pick out the fields the discovery view shows.
+
+    Args:
+        buf: LLDP TLV bytes, starting at the first (Chassis ID) TLV.
+
+    Returns:
+        Tuple of (chassis_id, port_id, port_description, system_name,
+        management_address, port_vlan, capabilities). Fields missing from the
+        packet are None.
+
+    """
+    fields: list[Any] = [None] * 7
+    mv = memoryview(buf)
+    end = len(mv)
+    i = 0
+    while i + 2 <= end:
+        (tlv_header,) = _LLDP_TLV_HDR.unpack_from(mv, i)
+        tlv_type = tlv_header >> 9
+        start = i + 2
+        i = start + (tlv_header & 0x1FF)
+        if i > end or tlv_type == _LLDP_TLV_END:
+            break
+
+        # Work in offsets; TLVs without a handler are never sliced.
+        if tlv_type == _LLDP_TLV_ORG:
+            if i - start < _LLDP_ORG_HDR.size:
+                continue
+            handler = _LLDP_ORG_HANDLERS.get(_LLDP_ORG_HDR.unpack_from(mv, start))
+            start += _LLDP_ORG_HDR.size
+        else:
+            handler = _LLDP_TLV_HANDLERS.get(tlv_type)
+        if handler is not None:
+            slot, decode = handler
+            value = decode(mv[start:i])
+            if value is not None:
+                fields[slot] = value
+
+    return fields[0], fields[1], fields[2], fields[3], fields[4], fields[5], fields[6]
+
+
+def _cdp_payload(packet: Any) -> memoryview | None:
+    """Return a view of the CDP TLV bytes of a captured frame, or None if it is not CDP."""
+    frame = getattr(packet, "original", None) or bytes(packet)
+    if frame[:6] != _CDP_MULTICAST:
+        return None
+    offset = _ETHER_HEADER_LEN
+    if frame[12:14] == _ETHERTYPE_VLAN:
+        offset += _VLAN_TAG_LEN
+    if frame[offset : offset + len(_CDP_SNAP)] != _CDP_SNAP:
+        return None
+    return memoryview(frame)[offset + len(_CDP_SNAP) + _CDP_HEADER_LEN :]
+
+
+def _cdp_first_address(value: memoryview) -> str | None:
+    """Addresses TLV: a count, then (type, proto len, proto, addr len, addr) records."""
+    if len(value) < _CDP_ADDR_COUNT.size:
+        return None
+    (count,) = _CDP_ADDR_COUNT.unpack_from(value)
+    i = _CDP_ADDR_COUNT.size
+    for _ in range(count):
+        if i + 2 > len(value):
+            break
+        i += 2 + value[i + 1]
+        if i + _CDP_ADDR_LEN.size > len(value):
+            break
+        (addr_len,) = _CDP_ADDR_LEN.unpack_from(value, i)
+        i += _CDP_ADDR_LEN.size
+        if i + addr_len > len(value):
+            break
+        if addr_len == 4:
+            return socket.inet_ntop(socket.AF_INET, value[i : i + 4])
+        if addr_len == 16:
+            return socket.inet_ntop(socket.AF_INET6, value[i : i + 16])
+        i += addr_len
+    return None
+
+
+def _parse_cdp(buf: bytes | memoryview) -> tuple[bytes | None, bytes | None, bytes | None, str | None]:
+    """Walk a CDP TLV stream and pick out the fields the discovery view shows.
+
+    Args:
+        buf: CDP TLV bytes, starting right after the CDP header.
+
+    Returns:
+        Tuple of (device_id, port_id, platform, management_address). Fields
+        missing from the packet are None.
+
+    """
+    device_id = port_id = platform_name = None
+    mgmt_address = None
+    mv = memoryview(buf)
+    end = len(mv)
+    i = 0
+    while i + _CDP_TLV_HDR.size <= end:
+        tlv_type, tlv_len = _CDP_TLV_HDR.unpack_from(mv, i)
+        start = i + _CDP_TLV_HDR.size
+        i += tlv_len
+        if tlv_len < _CDP_TLV_HDR.size or i > end:
+            break
+
+        if tlv_type == _CDP_DEVICE_ID:
+            device_id = mv[start:i].tobytes()
+        elif tlv_type == _CDP_PORT_ID:
+            port_id = mv[start:i].tobytes()
+        elif tlv_type == _CDP_PLATFORM:
+            platform_name = mv[start:i].tobytes()
+        elif tlv_type == _CDP_ADDRESSES and mgmt_address is None:
+            mgmt_address = _cdp_first_address(mv[start:i])
+
+    return device_id, port_id, platform_name, mgmt_address
+
+
+def _describe_discovery_packet(packet: Any) -> str | None:
+    """Format an LLDP or CDP frame for display, or return None for other frames."""
+    if packet.haslayer(LLDPDU):
+        try:
+            (
+                chassis_id_val,
+                port_id_val,
+                port_description_val,
+                system_name_val,
+                mgmt_address_val,
+                port_vlan_val,
+                capabilities_val,
+            ) = _parse_lldp(_lldp_payload(packet))
+
+            if not chassis_id_val or not port_id_val:
+                raise ValueError("Essential LLDP fields not found.")
+            result = "--- LLDP Packet Found ---\n"
+            if system_name_val:
+                result += f"System Name: {system_name_val.decode('utf-8', 'ignore')}\n"
+            result += f"Switch ID: {chassis_id_val.decode('utf-8', 'ignore')}\n"
+            if mgmt_address_val:
+                result += f"Management Address: {mgmt_address_val}\n"
+            if port_description_val:
+                result += f"Port Description: {port_description_val.decode('utf-8', 'ignore')}\n"
+            if port_vlan_val:
+                result += f"Native VLAN: {port_vlan_val}\n"
+            if capabilities_val:
+                result += f"Capabilities: {capabilities_val}\n"
+        except Exception as e:
+            result = f"Error parsing LLDP packet: {e}"
+        return result
+
+    cdp = _cdp_payload(packet)
+    if cdp is not None:
+        try:
+            device_id, port_id, platform_val, mgmt_address = _parse_cdp(cdp)
+            if not device_id or not port_id:
+                raise ValueError("Essential CDP fields not found.")
+            platform_str = platform_val.decode("utf-8", "ignore") if platform_val else "N-A"
+            result = (
+                f"--- CDP Packet Found ---\n"
+                f"Device ID: {device_id.decode('utf-8', 'ignore')}\n"
+                f"Management Address: {mgmt_address or 'N-A'}\n"
+                f"Port ID: {port_id.decode('utf-8', 'ignore')}\n"
+                f"Platform: {platform_str}"
+            )
+        except Exception as e:
+            result = f"Error parsing CDP packet: {e}"
+        return result
+    return None
+
+
+def _discovery_worker(conn: "Connection[tuple[str, str | None], int | None]") -> None:
+    """Entry point of the capture process.
+
+    Each timeout received on ``conn`` runs one scan on a filtered listen socket
+    that is opened once and kept for later scans. The first LLDP/CDP frame is
+    sent back as ``("packet", text)``, failures as ``("error", message)``, and
+    every scan ends with ``("done", None)``. ``None`` shuts the process down.
+    """
+    sock: Any = None
+
+    def _packet_callback(packet: Any) -> bool:
+        text = _describe_discovery_packet(packet)
+        if text is None:
+            return False
+        conn.send(("packet", text))
+        return True
+
+    try:
+        while (timeout := conn.recv()) is not None:
+            try:
+                if sock is None or sock.closed:
+                    sock = conf.L2listen(filter=_DISCOVERY_BPF_FILTER)
+                # store=False: nothing is kept once the callback has seen a frame.
+                sniffer = AsyncSniffer(opened_socket=sock, stop_filter=_packet_callback, timeout=timeout, store=False)
+                sniffer.start()
+                sniffer.join()
+            except Exception as e:
+                if sock is not None:
+                    sock.close()
+                    sock = None
+                conn.send(("error", str(e)))
+            conn.send(("done", None))
+    except (EOFError, BrokenPipeError):
+        pass  # The toolkit went away without calling close().
+    finally:
+        if sock is not None:
+            sock.close()
+
 
 @runtime_checkable
 class NetworkToolkit(Protocol):
@@ -26,6 +484,10 @@ class NetworkToolkit(Protocol):
         """Pings a host continuously."""
         ...
 
+    async def continuous_ping_async(self, host: str, callback: Callable[[str], None]) -> None:
+        """Pings a host continuously on the running event loop."""
+        ...
+
     def stop_ping(self) -> None:
         """Signals the continuous ping to stop."""
         ...
@@ -34,10 +496,26 @@ class NetworkToolkit(Protocol):
         """Tests DNS resolution."""
         ...
 
+    async def dns_resolution_test_async(self, domain: str) -> str:
+        """Tests DNS resolution without blocking the event loop."""
+        ...
+
+    async def resolve_host_async(self, host: str) -> str:
+        """Resolves a host name to an address, falling back to the name itself."""
+        ...
+
+    def clear_dns_cache(self) -> None:
+        """Forgets cached DNS answers."""
+        ...
+
     def port_connectivity_test(self, host: str, port: int | str) -> str:
         """Tests if a specific port is open."""
         ...
 
+    def port_scan(self, host: str, ports: Iterable[int], timeout: float = 2.0) -> dict[int, bool]:
+        """Tests several TCP ports on one host concurrently."""
+        ...
+
     def start_discovery_capture(self, callback: Callable[[str], None], timeout: int = 60) -> None:
         """Starts a thread to capture LLDP or CDP packets."""
         ...
@@ -46,10 +524,18 @@ class NetworkToolkit(Protocol):
         """Signals the packet capture thread to stop."""
         ...
 
-    def run_speed_test(self) -> dict[str, str]:
+    def close(self) -> None:
+        """Releases long-lived resources such as the capture process."""
+        ...
+
+    def run_speed_test(self, parallel: bool = False) -> dict[str, str]:
         """Performs a network speed test."""
         ...
 
+    def stop_speed_test(self) -> None:
+        """Signals a running speed test to stop."""
+        ...
+
     def run_network_scan(
         self, target: str, arguments: str = "-F", callback: Callable[[str], None] | None = None
     ) -> list[dict[str, Any]]:
@@ -86,41 +572,142 @@ class NetworkTriageToolkitBase:
 
     def __init__(self) -> None:
         self.stop_ping_event = threading.Event()
+        # One stop event per running continuous_ping_async, so stop_ping reaches them all
+        self._ping_stop_events: set[asyncio.Event] = set()
         self.discovery_thread: threading.Thread | None = None
         self.stop_discovery: bool = False
-        self.nmap_process: subprocess.Popen[str] | None = None
+        self.nmap_process: subprocess.Popen[bytes] | None = None
+        self.stop_speedtest_event = threading.Event()
+        self._speedtest_client: speedtest.Speedtest | None = None
+        self._speedtest_server_cache: tuple[float, dict[str, Any]] | None = None
+        self._public_ip_cache: tuple[float, tuple[str, str], str] | None = None
+        self._discovery_process: BaseProcess | None = None
+        self._discovery_conn: Connection[int | None, tuple[str, str | None]] | None = None
+        self._discovery_wakeup: Connection[None, None] | None = None
 
     def continuous_ping(self, host: str, callback: Callable[[str], None]) -> None:
         """Pings a host continuously and sends output to a callback."""
         self.stop_ping_event.clear()
-        command = ["ping", host]
+        command = [*_PING_COMMAND, host]
 
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-            )
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
             if process.stdout is None:
                 callback("Error: Could not open subprocess stdout.")
                 return
-            for line in iter(process.stdout.readline, ""):
+            # Read raw chunks into one reused buffer and decode only complete lines.
+            stdout = cast("io.FileIO", process.stdout)  # bufsize=0 gives the raw pipe
+            buf = bytearray(_PING_READ_SIZE)
+            view = memoryview(buf)
+            pending = bytearray()
+            while n := stdout.readinto(buf):
                 if self.stop_ping_event.is_set():
                     process.terminate()
                     break
-                callback(line)
+                pending += view[:n]
+                end = pending.rfind(b"\n") + 1
+                if end:
+                    for line in pending[:end].decode(_PING_ENCODING, "replace").splitlines():
+                        callback(line + "\n")
+                    del pending[:end]
+            else:
+                if pending:
+                    callback(pending.decode(_PING_ENCODING, "replace"))
             process.stdout.close()
         except FileNotFoundError:
             callback("Ping command not found. Is it in your system's PATH?")
         except Exception as e:
             callback(f"An error occurred: {e}\n")
 
+    async def continuous_ping_async(self, host: str, callback: Callable[[str], None]) -> None:
+        """Pings a host continuously without a dedicated reader thread.
+
+        Lines are read from an ``asyncio`` subprocess, so any number of pings can
+        share one event loop. The ping stops when ``stop_ping`` is called from the
+        loop's thread or when the awaiting task is cancelled.
+        """
+        stop_event = asyncio.Event()
+        self._ping_stop_events.add(stop_event)
+        try:
+            await self._ping_until_stopped(host, callback, stop_event)
+        finally:
+            self._ping_stop_events.discard(stop_event)
+
+    async def _ping_until_stopped(self, host: str, callback: Callable[[str], None], stop_event: asyncio.Event) -> None:
+        """Runs one ping subprocess, relaying its lines until EOF or ``stop_event`` is set."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *_PING_COMMAND, host, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+            )
+        except FileNotFoundError:
+            callback("Ping command not found. Is it in your system's PATH?")
+            return
+        except Exception as e:
+            callback(f"An error occurred: {e}\n")
+            return
+        if process.stdout is None:
+            callback("Error: Could not open subprocess stdout.")
+            return
+
+        stopped = asyncio.ensure_future(stop_event.wait())
+        read: asyncio.Future[bytes] | None = None
+        try:
+            while True:
+                read = asyncio.ensure_future(process.stdout.readline())
+                await asyncio.wait({read, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                if not read.done():
+                    break
+                line = read.result()
+                if not line:
+                    break
+                callback(line.decode(_PING_ENCODING, "replace").rstrip("\r\n") + "\n")
+        except Exception as e:
+            callback(f"An error occurred: {e}\n")
+        finally:
+            stopped.cancel()
+            if read is not None:
+                read.cancel()
+            if process.returncode is None:
+                try:
+                    process.terminate()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+
     def stop_ping(self) -> None:
-        """Signals the continuous ping to stop."""
+        """Signals every running continuous ping to stop."""
         self.stop_ping_event.set()
+        for stop_event in self._ping_stop_events:
+            stop_event.set()
+
+    def get_system_info(self) -> dict[str, str]:
+        """Gets basic system information, gathered once per toolkit."""
+        return dict(self._system_info)
+
+    @functools.cached_property
+    def _system_info(self) -> dict[str, str]:
+        # OS and hostname are fixed for the life of the process; a failed read raises
+        # and is retried on the next call.
+        return self._read_system_info()
+
+    def _read_system_info(self) -> dict[str, str]:
+        """Collects OS and hostname details. Platform toolkits override this."""
+        return {"OS": f"{platform.system()} {platform.release()}", "Hostname": socket.gethostname()}
+
+    def _cached_public_ip(self, internal_ip: str, gateway: str, fetch: Callable[[], str]) -> str:
+        """Return the public IP, calling ``fetch`` only when the cached one is stale.
+
+        A successful lookup is reused for ``_PUBLIC_IP_TTL`` seconds as long as the
+        internal IP and gateway match, so switching networks refetches at once.
+        Failures raise from ``fetch`` and are not cached.
+        """
+        network = (internal_ip, gateway)
+        cached = self._public_ip_cache
+        if cached and cached[1] == network and time.monotonic() - cached[0] < _PUBLIC_IP_TTL:
+            return cached[2]
+        public_ip = fetch()
+        self._public_ip_cache = (time.monotonic(), network, public_ip)
+        return public_ip
 
     def health_check(self) -> dict[str, Any]:
         """Performs a health check of common dependencies.
@@ -160,23 +747,53 @@ class NetworkTriageToolkitBase:
     def dns_resolution_test(self, domain: str) -> str:
         """Tests DNS resolution for a specific domain."""
         try:
-            ip = socket.gethostbyname(domain)
+            ip = _dns_lookup_cached(domain)
             return f"DNS resolution for {domain}: {ip}"
         except socket.gaierror:
             return f"DNS resolution failed for {domain}. Check your DNS settings."
         except Exception as e:
             return f"An error occurred during DNS resolution: {e}"
 
+    async def dns_resolution_test_async(self, domain: str) -> str:
+        """Tests DNS resolution for a domain without blocking the event loop.
+
+        Awaits the running loop's ``getaddrinfo`` so callers on Textual's loop
+        can keep several lookups in flight at once.
+        """
+        try:
+            ip = await _dns_lookup_cached_async(domain)
+            return f"DNS resolution for {domain}: {ip}"
+        except socket.gaierror:
+            return f"DNS resolution failed for {domain}. Check your DNS settings."
+        except Exception as e:
+            return f"An error occurred during DNS resolution: {e}"
+
+    async def resolve_host_async(self, host: str) -> str:
+        """Resolves a host name to an address, or returns it unchanged if that fails.
+
+        Takes the resolver's first answer of either family, so IPv6-only hosts
+        resolve and dual-stack hosts follow the system's address preference. Lets a
+        long-running tool such as ping be handed an address, so it does not wait on
+        the system resolver itself at startup.
+        """
+        try:
+            return await _dns_lookup_cached_async(host, socket.AF_UNSPEC)
+        except (OSError, UnicodeError):
+            return host
+
+    def clear_dns_cache(self) -> None:
+        """Forgets all cached DNS answers so the next lookups hit the resolver."""
+        _DNS_CACHE.clear()
+        _HOST_ADDRESS_CACHE.clear()
+        _ADDRINFO_CACHE.clear()
+
     def port_connectivity_test(self, host: str, port: int | str) -> str:
         """Tests if a specific port is open on a given host."""
         try:
             port_num = int(port)
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(2)
-                result = sock.connect_ex((host, port_num))
-                if result == 0:
-                    return f"Port {port_num} on {host} is OPEN."
-                return f"Port {port_num} on {host} is CLOSED or filtered."
+            if self.port_scan(host, [port_num])[port_num]:
+                return f"Port {port_num} on {host} is OPEN."
+            return f"Port {port_num} on {host} is CLOSED or filtered."
         except ValueError:
             return "Invalid port number. Please enter an integer."
         except socket.gaierror:
@@ -184,8 +801,90 @@ class NetworkTriageToolkitBase:
         except Exception as e:
             return f"An error occurred: {e}"
 
+    def port_scan(self, host: str, ports: Iterable[int], timeout: float = 2.0) -> dict[int, bool]:
+        """Tests several TCP ports on one host concurrently.
+
+        Every connect is issued non-blocking and the pending sockets are waited on
+        through one selector, so a round takes about ``timeout`` at worst rather
+        than ``timeout`` per port.
+
+        Args:
+            host: Hostname, IPv4 or IPv6 address to probe.
+            ports: TCP ports to test.
+            timeout: Seconds to wait for each round of connects.
+
+        Returns:
+            Dictionary mapping each port to True if it accepted a connection.
+
+        Raises:
+            socket.gaierror: If the host cannot be resolved.
+
+        """
+        targets = _resolve_stream_targets(host)
+        port_list = list(ports)
+        results = dict.fromkeys(port_list, False)
+        batch = max(1, _PORT_SCAN_BATCH // max(1, len(targets)))
+        for start in range(0, len(port_list), batch):
+            results.update(self._connect_batch(targets, port_list[start : start + batch], timeout))
+        return results
+
+    @staticmethod
+    def _connect_batch(targets: tuple[tuple[int, str], ...], ports: list[int], timeout: float) -> dict[int, bool]:
+        """Run one round of non-blocking connects and collect which ports opened.
+
+        Each port is tried on every target address at once (IPv6 and IPv4 side by
+        side, as in Happy Eyeballs); the first success settles the port and closes
+        its other attempts, so a black-holed family does not hold up the round.
+        """
+        results = dict.fromkeys(ports, False)
+        with selectors.DefaultSelector() as sel:
+
+            def settle(port: int) -> None:
+                results[port] = True
+                for key in [key for key in sel.get_map().values() if key.data == port]:
+                    sel.unregister(key.fileobj)
+                    cast("socket.socket", key.fileobj).close()
+
+            try:
+                for port in ports:
+                    for family, address in targets:
+                        if results[port]:
+                            break
+                        sock = socket.socket(family, socket.SOCK_STREAM)
+                        sock.setblocking(False)
+                        err = sock.connect_ex((address, port))
+                        if err in _CONNECT_IN_PROGRESS:
+                            sel.register(sock, selectors.EVENT_WRITE, port)
+                            continue
+                        sock.close()
+                        if err == 0:
+                            settle(port)
+
+                deadline = time.monotonic() + timeout
+                while sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in sel.select(remaining):
+                        if results[key.data]:
+                            continue  # Closed by settle() earlier in this batch of events.
+                        ready = cast("socket.socket", key.fileobj)
+                        opened = ready.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                        sel.unregister(ready)
+                        ready.close()
+                        if opened:
+                            settle(key.data)
+            finally:
+                for key in list(sel.get_map().values()):
+                    cast("socket.socket", key.fileobj).close()
+        return results
+
     def start_discovery_capture(self, callback: Callable[[str], None], timeout: int = 60) -> None:
-        """Starts a thread to capture LLDP or CDP packets."""
+        """Starts a scan for LLDP or CDP packets.
+
+        Capture and parsing run in a separate process so Scapy's dissection never
+        holds this process's GIL; a thread here only waits on the result pipe.
+        """
         if self.discovery_thread and self.discovery_thread.is_alive():
             callback("A scan is already in progress.")
             return
@@ -195,109 +894,129 @@ class NetworkTriageToolkitBase:
         self.discovery_thread.start()
 
     def stop_discovery_capture(self) -> None:
-        """Signals the packet capture thread to stop."""
+        """Signals the packet capture thread to stop, waking it if it is waiting."""
         self.stop_discovery = True
+        wakeup = self._discovery_wakeup
+        if wakeup is not None:
+            try:
+                wakeup.send(None)
+            except OSError:
+                pass  # The scan finished and closed the pipe in the meantime.
+
+    def _discovery_connection(self) -> "Connection[int | None, tuple[str, str | None]]":
+        """Return the pipe to the capture process, starting the process on first use.
+
+        The process outlives a single scan so its filtered listen socket is reused.
+        """
+        if self._discovery_process is None or not self._discovery_process.is_alive() or self._discovery_conn is None:
+            self._stop_discovery_process()
+            ctx = multiprocessing.get_context("spawn")
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_discovery_worker, args=(child_conn,), name="discovery-capture", daemon=True)
+            process.start()
+            child_conn.close()
+            self._discovery_process, self._discovery_conn = process, parent_conn
+        return self._discovery_conn
+
+    def _stop_discovery_process(self) -> None:
+        """Terminate the capture process, if any, and close its pipe."""
+        if self._discovery_process is not None:
+            self._discovery_process.terminate()
+            self._discovery_process.join(timeout=1)
+            self._discovery_process = None
+        if self._discovery_conn is not None:
+            self._discovery_conn.close()
+            self._discovery_conn = None
+
+    def close(self) -> None:
+        """Stops any running speed test and shuts down the discovery capture process."""
+        self.stop_speedtest_event.set()
+        if self._discovery_conn is not None and self._discovery_process is not None:
+            try:
+                self._discovery_conn.send(None)
+                self._discovery_process.join(timeout=1)
+            except OSError:
+                pass
+        self._stop_discovery_process()
 
     def _run_discovery_capture(self, callback: Callable[[str], None], timeout: int) -> None:
-        """The actual packet sniffing logic."""
+        """Runs one scan in the capture process and relays what it reports."""
         if platform.system() != "Windows" and os.geteuid() != 0:
             callback("Packet capture requires administrator privileges. Please run with 'sudo'.")
             return
 
-        packet_found = [False]
-
-        def _packet_callback(packet: Any) -> bool:
-            """This function is called for every captured packet."""
-            if self.stop_discovery or packet_found[0]:
-                return True
-
-            result = ""
-            if packet.haslayer(LLDPDU):
-                packet_found[0] = True
-                try:
-                    chassis_id_val, port_id_val, port_description_val, system_name_val, mgmt_address_val = (None,) * 5
-                    raw_payload = bytes(packet[LLDPDU].payload)
-                    i = 0
-                    while i < len(raw_payload):
-                        if i + 2 > len(raw_payload):
-                            break
-                        tlv_header = struct.unpack("!H", raw_payload[i : i + 2])[0]
-                        tlv_type, tlv_len = tlv_header >> 9, tlv_header & 0x1FF
-                        if i + 2 + tlv_len > len(raw_payload):
-                            break
-                        value_bytes = raw_payload[i + 2 : i + 2 + tlv_len]
-
-                        match tlv_type:
-                            case 1:
-                                chassis_id_val = value_bytes[1:]
-                            case 2:
-                                port_id_val = value_bytes[1:]
-                            case 4:
-                                port_description_val = value_bytes
-                            case 5:
-                                system_name_val = value_bytes
-                            case 8 if len(value_bytes) > 1 and value_bytes[1] == 1:
-                                mgmt_address_val = inet_ntoa(value_bytes[2:6])
-                            case 0:
-                                break
-                        i += 2 + tlv_len
-
-                    if not chassis_id_val or not port_id_val:
-                        raise ValueError("Essential LLDP fields not found.")
-                    result = "--- LLDP Packet Found ---\n"
-                    if system_name_val:
-                        result += f"System Name: {system_name_val.decode('utf-8', 'ignore')}\n"
-                    result += f"Switch ID: {chassis_id_val.decode('utf-8', 'ignore')}\n"
-                    if mgmt_address_val:
-                        result += f"Management Address: {mgmt_address_val}\n"
-                    if port_description_val:
-                        result += f"Port Description: {port_description_val.decode('utf-8', 'ignore')}\n"
-                except Exception as e:
-                    result = f"Error parsing LLDP packet: {e}"
-                callback(result)
-                return True
-
-            if packet.haslayer(CDPMsg):
-                packet_found[0] = True
-                try:
-                    device_id = packet[CDPMsg].device_id.decode()
-                    port_id = packet[CDPMsg].port_id.decode()
-                    platform_str = packet[CDPMsg].platform.decode()
-                    mgmt_address = next((addr.addr for addr in packet[CDPMsg].addr if isinstance(addr, CDPAddrRecord)), "N-A")
-                    result = (
-                        f"--- CDP Packet Found ---\n"
-                        f"Device ID: {device_id}\n"
-                        f"Management Address: {mgmt_address}\n"
-                        f"Port ID: {port_id}\n"
-                        f"Platform: {platform_str}"
-                    )
-                except Exception as e:
-                    result = f"Error parsing CDP packet: {e}"
-                callback(result)
-                return True
-            return False
-
+        packet_found = False
+        # stop_discovery_capture() writes to this pipe so the wait below returns at once.
+        wake_reader, wake_writer = multiprocessing.Pipe(duplex=False)
+        self._discovery_wakeup = wake_writer
         try:
-            sniff(
-                filter="ether proto 0x88cc or ether dst 01:00:0c:cc:cc:cc",
-                stop_filter=_packet_callback,
-                timeout=timeout,
-            )
-        except Exception as e:
+            conn = self._discovery_connection()
+            conn.send(timeout)
+            while not self.stop_discovery:
+                if conn not in wait([conn, wake_reader]):
+                    continue
+                kind, text = conn.recv()
+                if kind == "done":
+                    break
+                if kind == "packet":
+                    packet_found = True
+                    callback(cast("str", text))
+                else:
+                    callback(f"An error occurred during packet capture: {text}")
+            else:
+                # Killing the process is the only way to interrupt a capture in progress.
+                self._stop_discovery_process()
+        except (EOFError, OSError) as e:
+            self._stop_discovery_process()
             callback(f"An error occurred during packet capture: {e}")
         finally:
-            if not packet_found[0] and not self.stop_discovery:
+            self._discovery_wakeup = None
+            wake_writer.close()
+            wake_reader.close()
+            if not packet_found and not self.stop_discovery:
                 callback(f"\nScan complete. No LLDP or CDP packets found in {timeout} seconds.")
 
     @track_performance
     @monitor_long_running(threshold_seconds=10.0)
-    def run_speed_test(self) -> dict[str, str]:
-        """Performs a network speed test and returns the results."""
+    def run_speed_test(self, parallel: bool = False) -> dict[str, str]:
+        """Performs a network speed test and returns the results.
+
+        Args:
+            parallel: Run the download and upload phases at the same time. This
+                roughly halves the test duration on full-duplex links, but the
+                two directions then compete for the link, so the measured rates
+                are not comparable with a sequential run (default: False).
+
+        """
+        self.stop_speedtest_event.clear()
         try:
-            st = speedtest.Speedtest(secure=True)
-            st.get_best_server()
-            st.download()
-            st.upload(pre_allocate=False)
+            st = self._speedtest_client
+            if st is None:
+                # Building the client fetches the speedtest.net configuration;
+                # keep it so later runs skip that round trip.
+                st = speedtest.Speedtest(secure=True, shutdown_event=self.stop_speedtest_event)
+                self._speedtest_client = st
+            else:
+                # Results (including the share URL) are only reset by the constructor.
+                st.results = speedtest.SpeedtestResults(client=st.config["client"], opener=st._opener, secure=True)
+            cached = self._speedtest_server_cache
+            if cached and time.monotonic() - cached[0] < _SPEEDTEST_SERVER_TTL:
+                # Re-ping only the cached server; this skips the server list
+                # fetch and latency probes against every nearby candidate.
+                st.get_best_server([dict(cached[1])])
+            else:
+                self._speedtest_server_cache = (time.monotonic(), st.get_best_server())
+            if parallel:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    download = pool.submit(st.download)
+                    upload = pool.submit(st.upload, pre_allocate=False)
+                    download.result()
+                    upload.result()
+            else:
+                st.download()
+                st.upload(pre_allocate=False)
+            if self.stop_speedtest_event.is_set():
+                return {"Error": "Speed test cancelled"}
             results = st.results.dict()
             packet_loss = results.get("packetLoss")
             return {
@@ -311,8 +1030,14 @@ class NetworkTriageToolkitBase:
                 "Result URL": st.results.share() or "N/A",
             }
         except Exception as e:
+            self._speedtest_client = None
+            self._speedtest_server_cache = None
             return {"Error": f"Speed test failed: {e}"}
 
+    def stop_speed_test(self) -> None:
+        """Signals a running speed test to stop; its transfer threads exit early."""
+        self.stop_speedtest_event.set()
+
     @staticmethod
     @functools.cache
     def _get_nmap_path() -> str | None:
@@ -347,63 +1072,109 @@ class NetworkTriageToolkitBase:
                 },
             ]
 
+        process: subprocess.Popen[bytes] | None = None
         try:
             command = [nmap_path, *arguments.split(), target, "-oX", "-"]
 
-            process = subprocess.run(command, capture_output=True, text=True, check=False)
-
-            if process.returncode != 0:
-                return [
-                    {
-                        "ip": "Error",
-                        "hostname": "Nmap Error",
-                        "status": process.stderr.strip() or "Unknown Error",
-                        "mac": "",
-                        "vendor": "",
-                        "details": {},
-                    },
-                ]
-
-            # ... (The rest of your XML parsing logic remains exactly the same) ...
-            root = ET.fromstring(process.stdout)
-            results: list[dict[str, Any]] = []
-
-            for host in root.findall("host"):
-                status_elem = host.find("status")
-                status = status_elem.get("state") if status_elem is not None else "unknown"
-
-                if status != "up":
-                    continue
-
-                addr_elem = host.find("address[@addrtype='ipv4']")
-                ip_addr = addr_elem.get("addr") if addr_elem is not None else "N/A"
+            # stderr goes to a temporary file rather than a second pipe: nothing reads
+            # it until stdout hits EOF, and a full stderr pipe would stall nmap.
+            with (
+                tempfile.TemporaryFile() as errors,
+                subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors) as process,
+            ):
+                self.nmap_process = process
+                stdout = cast("IO[bytes]", process.stdout)  # stdout=PIPE, so never None
 
-                mac_elem = host.find("address[@addrtype='mac']")
-                mac_addr = mac_elem.get("addr") if mac_elem is not None else ""
-                vendor = mac_elem.get("vendor") if mac_elem is not None else ""
-
-                hostname_elem = host.find("hostnames/hostname")
-                hostname = hostname_elem.get("name") if hostname_elem is not None else ""
+                # Parse nmap's XML incrementally as it arrives, so a large scan
+                # never has to sit in memory as one string before parsing. Each
+                # <host> is dropped from the <nmaprun> root once read, so the tree
+                # does not grow with the number of hosts.
+                results: list[dict[str, Any]] = []
+                parse_error: ET.ParseError | None = None
+                root: ET.Element | None = None
+                try:
+                    for event, elem in ET.iterparse(stdout, events=("start", "end")):
+                        if root is None:
+                            root = elem
+                        elif event == "end" and elem.tag == "host":
+                            host_details = self._parse_nmap_host(elem)
+                            if host_details is not None:
+                                results.append(host_details)
+                            root.clear()
+                except ET.ParseError as e:
+                    parse_error = e
+                    # Drain the pipe so nmap can exit, without holding what is left
+                    while stdout.read(_NMAP_DRAIN_SIZE):
+                        pass
 
-                host_details: dict[str, Any] = {
-                    "ip": ip_addr,
-                    "hostname": hostname,
-                    "status": status,
-                    "mac": mac_addr,
-                    "vendor": vendor,
-                    "details": {},
-                }
-                # ... (keep existing port parsing logic) ...
-                results.append(host_details)
+                returncode = process.wait()
+                if self.nmap_process is not process:
+                    # stop_network_scan terminated nmap; keep the hosts found so far
+                    return results
+                if returncode != 0:
+                    errors.seek(0)
+                    stderr = errors.read().decode("utf-8", "replace")
+                    return [
+                        {
+                            "ip": "Error",
+                            "hostname": "Nmap Error",
+                            "status": stderr.strip() or "Unknown Error",
+                            "mac": "",
+                            "vendor": "",
+                            "details": {},
+                        },
+                    ]
 
+            if parse_error is not None:
+                raise parse_error
             return results
 
         except Exception as e:
             return [{"ip": "Error", "hostname": "Exception", "status": str(e), "mac": "", "vendor": "", "details": {}}]
+        finally:
+            # A newer scan may have started meanwhile; leave its handle alone
+            if self.nmap_process is process:
+                self.nmap_process = None
+
+    @staticmethod
+    def _parse_nmap_host(host: ET.Element) -> dict[str, Any] | None:
+        """Extract the summary fields of an up host from an nmap ``<host>`` element."""
+        status_elem = host.find("status")
+        status = status_elem.get("state") if status_elem is not None else "unknown"
+
+        if status != "up":
+            return None
+
+        addr_elem = host.find("address[@addrtype='ipv4']")
+        ip_addr = addr_elem.get("addr") if addr_elem is not None else "N/A"
+
+        mac_elem = host.find("address[@addrtype='mac']")
+        mac_addr = mac_elem.get("addr") if mac_elem is not None else ""
+        vendor = mac_elem.get("vendor") if mac_elem is not None else ""
+
+        hostname_elem = host.find("hostnames/hostname")
+        hostname = hostname_elem.get("name") if hostname_elem is not None else ""
+
+        return {
+            "ip": ip_addr,
+            "hostname": hostname,
+            "status": status,
+            "mac": mac_addr,
+            "vendor": vendor,
+            "details": {},
+        }
 
     def stop_network_scan(self) -> str:
-        """Stops a running Nmap scan."""
-        return "Scan stopping is not directly supported with this method."
+        """Stops a running Nmap scan; run_network_scan then returns the hosts found so far."""
+        process = self.nmap_process
+        if process is None:
+            return "No scan is running."
+        self.nmap_process = None
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass  # nmap already exited
+        return "Scan stopped."
 
 
 class RouterConnection:
@@ -7,7 +7,7 @@ from ..shared.shared_toolkit import NetworkTriageToolkitBase
 class NetworkTriageToolkit(NetworkTriageToolkitBase):
     """Windows-specific network troubleshooting functions."""
 
-    def get_system_info(self) -> dict[str, str]:
+    def _read_system_info(self) -> dict[str, str]:
         return {"OS": f"{platform.system()} {platform.release()} (Windows Support Pending)", "Hostname": socket.gethostname()}
 
     def get_ip_info(self) -> dict[str, str]:
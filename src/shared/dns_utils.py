@@ -11,7 +11,7 @@ License: MIT
 import asyncio
 import socket
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -51,9 +51,21 @@ class DNSLookupResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        result = asdict(self)
-        result["status"] = self.status.value
-        result["records"] = [{**asdict(r), "status": r.status.value} for r in self.records]
+        # Built field by field: asdict() would deep-copy every record only for
+        # each one to be rebuilt below with its status flattened.
+        result: dict[str, Any] = {
+            "hostname": self.hostname,
+            "ipv4_addresses": list(self.ipv4_addresses),
+            "ipv6_addresses": list(self.ipv6_addresses),
+            "reverse_dns": self.reverse_dns,
+            "lookup_time_ms": self.lookup_time_ms,
+            "status": self.status.value,
+            "error_message": self.error_message,
+            "records": [
+                {"record_type": r.record_type, "value": r.value, "query_time_ms": r.query_time_ms, "status": r.status.value}
+                for r in self.records
+            ],
+        }
         return {k: v for k, v in result.items() if v is not None}
 
 
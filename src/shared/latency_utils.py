@@ -13,7 +13,7 @@ import re
 import statistics
 import subprocess
 from collections.abc import AsyncGenerator
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -49,10 +49,20 @@ class PingStatistics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        result = asdict(self)
-        result["status"] = self.status.value
-        # Keep rtt_values for reference but limit size
-        result["rtt_values"] = self.rtt_values[:100] if self.rtt_values else []
+        result: dict[str, Any] = {
+            "host": self.host,
+            "packets_sent": self.packets_sent,
+            "packets_received": self.packets_received,
+            "packet_loss_percent": self.packet_loss_percent,
+            "min_ms": self.min_ms,
+            "avg_ms": self.avg_ms,
+            "max_ms": self.max_ms,
+            "stddev_ms": self.stddev_ms,
+            "status": self.status.value,
+            # Keep rtt_values for reference but limit size
+            "rtt_values": self.rtt_values[:100] if self.rtt_values else [],
+            "error_message": self.error_message,
+        }
         return {k: v for k, v in result.items() if v is not None}
 
 
@@ -74,7 +84,15 @@ class TracerouteHop:
         return sum(times) / len(times) if times else None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "hop_number": self.hop_number,
+            "hostname": self.hostname,
+            "ip_address": self.ip_address,
+            "rtt1_ms": self.rtt1_ms,
+            "rtt2_ms": self.rtt2_ms,
+            "rtt3_ms": self.rtt3_ms,
+            "status": self.status,
+        }
 
 
 def ping_statistics(
@@ -10,9 +10,12 @@ License: MIT
 import asyncio
 import functools
 import socket
+import struct
+import sys
 import time
+from collections import Counter
 from collections.abc import AsyncGenerator
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -20,6 +23,19 @@ from network_triage.logging import get_logger
 
 logger = get_logger(__name__)
 
+# SO_LINGER value with linger on and a zero timeout: closing a connected probe
+# socket sends RST instead of FIN, so open ports don't leave the scanner's
+# ephemeral ports in TIME_WAIT. Windows' struct linger uses u_short fields.
+_LINGER_RESET = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)
+
+
+def _reset_on_close(sock: socket.socket) -> None:
+    """Make closing a connected probe socket abort the connection."""
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+    except OSError:
+        pass  # Best effort; a normal close is still correct
+
 
 class PortStatus(Enum):
     """Port status indicators."""
@@ -79,8 +95,15 @@ class PortCheckResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        result = asdict(self)
-        result["status"] = self.status.value
+        result: dict[str, Any] = {
+            "host": self.host,
+            "port": self.port,
+            "status": self.status.value,
+            "service_name": self.service_name,
+            "response_time_ms": self.response_time_ms,
+            "error_message": self.error_message,
+            "banner": self.banner,
+        }
         return {k: v for k, v in result.items() if v is not None}
 
 
@@ -126,6 +149,7 @@ def check_port_open(host: str, port: int, timeout: int = 3, grab_banner: bool =
             # Attempt connection
             sock.connect((host, port))
             result.status = PortStatus.OPEN
+            _reset_on_close(sock)
 
             # Optionally grab banner
             if grab_banner:
@@ -174,6 +198,75 @@ def check_port_open(host: str, port: int, timeout: int = 3, grab_banner: bool =
     return result
 
 
+async def _resolve_ipv4(host: str) -> str:
+    """Resolve a host to the IPv4 address ``check_port_open`` would connect to."""
+    infos = await asyncio.get_running_loop().getaddrinfo(host, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+    return str(infos[0][4][0])
+
+
+async def _probe_port(host: str, address: str, port: int, timeout_secs: float) -> PortCheckResult:
+    """Probe one port with a non-blocking connect driven by the event loop.
+
+    Mirrors the status mapping of ``check_port_open`` without tying up a
+    thread for the duration of the connect.
+
+    Args:
+        host: Hostname reported on the result
+        address: Pre-resolved IPv4 address of ``host``
+        port: Port number (1-65535)
+        timeout_secs: Connection timeout in seconds
+
+    Returns:
+        PortCheckResult with status and metrics
+
+    """
+    start_time = time.perf_counter()
+    result = PortCheckResult(
+        host=host,
+        port=port,
+        status=PortStatus.ERROR,
+        service_name=COMMON_SERVICE_PORTS.get(port),
+        response_time_ms=0,
+        error_message=None,
+    )
+
+    if not (1 <= port <= 65535):
+        result.error_message = f"Invalid port: {port}"
+        return result
+
+    loop = asyncio.get_running_loop()
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError as e:
+        result.error_message = f"Socket creation error: {e!s}"
+        return result
+
+    with sock:
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (address, port)), timeout_secs)
+            result.status = PortStatus.OPEN
+            _reset_on_close(sock)
+
+        except TimeoutError:
+            # Timeout indicates filtered (likely firewall)
+            result.status = PortStatus.FILTERED
+            result.error_message = f"Connection timeout after {timeout_secs}s"
+
+        except ConnectionRefusedError:
+            # Refused indicates port is closed (host responds with RST)
+            result.status = PortStatus.CLOSED
+
+        except OSError as e:
+            # Other OS errors (host unreachable, etc.)
+            if "Network is unreachable" in str(e) or "No route to host" in str(e):
+                result.status = PortStatus.FILTERED
+            result.error_message = str(e)
+
+    result.response_time_ms = (time.perf_counter() - start_time) * 1000
+    return result
+
+
 async def check_multiple_ports_stream(
     host: str,
     ports: list[int],
@@ -182,34 +275,53 @@ async def check_multiple_ports_stream(
 ) -> AsyncGenerator[PortCheckResult]:
     """Check connectivity to multiple ports and yield results as they complete.
 
+    The host is resolved once, then every port is probed with a non-blocking
+    connect on the running event loop, so no worker threads are involved.
+
     Args:
         host: Hostname or IP address
         ports: List of port numbers to check
         timeout_secs: Connection timeout per port in seconds
-        max_workers: Concurrent workers
+        max_workers: Maximum number of connects in flight at once
 
     Yields:
         PortCheckResult objects as they complete
 
     """
-
-    def check_port_wrapper(port: int) -> PortCheckResult:
-        return check_port_open(host, port, timeout_secs)
+    try:
+        address = await _resolve_ipv4(host)
+    except (socket.gaierror, UnicodeError) as e:
+        for port in ports:
+            yield PortCheckResult(
+                host=host,
+                port=port,
+                status=PortStatus.ERROR,
+                service_name=COMMON_SERVICE_PORTS.get(port),
+                response_time_ms=0,
+                error_message=f"DNS resolution failed: {e!s}",
+            )
+        return
 
     semaphore = asyncio.Semaphore(max_workers)
 
     async def sem_check_port(port: int) -> PortCheckResult:
         async with semaphore:
-            return await asyncio.to_thread(check_port_wrapper, port)
+            return await _probe_port(host, address, port, timeout_secs)
 
     # Use as_completed to yield results as they finish
     tasks = [asyncio.create_task(sem_check_port(port)) for port in ports]
 
-    for future in asyncio.as_completed(tasks):
-        try:
-            yield await future
-        except Exception as e:
-            logger.error(f"Error in port scan stream: {e}")
+    try:
+        for future in asyncio.as_completed(tasks):
+            try:
+                yield await future
+            except Exception as e:
+                logger.error(f"Error in port scan stream: {e}")
+    finally:
+        # Don't leave probes running if the consumer stops early (e.g. the
+        # scan worker is cancelled).
+        for task in tasks:
+            task.cancel()
 
 
 async def check_multiple_ports(
@@ -353,23 +465,21 @@ def summarize_port_scan(results: list[PortCheckResult]) -> dict[str, Any]:
         >>> print(summary['open_count'])
 
     """
-    open_ports = [r for r in results if r.status == PortStatus.OPEN]
-    closed_ports = [r for r in results if r.status == PortStatus.CLOSED]
-    filtered_ports = [r for r in results if r.status == PortStatus.FILTERED]
-    timeout_ports = [r for r in results if r.status == PortStatus.TIMEOUT]
-    error_ports = [r for r in results if r.status == PortStatus.ERROR]
+    # Count every status in one pass rather than filtering once per status
+    status_counts = Counter(r.status for r in results)
+    open_ports = [(r.port, r.service_name) for r in results if r.status is PortStatus.OPEN]
 
     response_times = [r.response_time_ms for r in results if r.response_time_ms > 0]
     avg_response_time = sum(response_times) / len(response_times) if response_times else 0
 
     return {
         "total_scanned": len(results),
-        "open_count": len(open_ports),
-        "closed_count": len(closed_ports),
-        "filtered_count": len(filtered_ports),
-        "timeout_count": len(timeout_ports),
-        "error_count": len(error_ports),
-        "open_ports": [(r.port, r.service_name) for r in open_ports],
+        "open_count": status_counts[PortStatus.OPEN],
+        "closed_count": status_counts[PortStatus.CLOSED],
+        "filtered_count": status_counts[PortStatus.FILTERED],
+        "timeout_count": status_counts[PortStatus.TIMEOUT],
+        "error_count": status_counts[PortStatus.ERROR],
+        "open_ports": open_ports,
         "avg_response_time_ms": avg_response_time,
         "min_response_time_ms": min(response_times) if response_times else 0,
         "max_response_time_ms": max(response_times) if response_times else 0,
@@ -11,9 +11,10 @@ All widgets should inherit from BaseWidget to ensure consistency in:
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from textual.containers import Container, Vertical
 from textual.message import Message
@@ -70,21 +71,23 @@ class AsyncOperationMixin:
     - Operation cancellation
     - Error handling
     - Progress tracking
-    - Result caching
+    - Result caching (least recently used entries are evicted past ``CACHE_MAX_ENTRIES``)
 
     Usage:
         class MyWidget(BaseWidget, AsyncOperationMixin):
             async def perform_operation(self) -> OperationResult:
                 try:
-                    result = await self.run_in_thread(some_function)
+                    result = await asyncio.to_thread(some_function)
                     return OperationResult(success=True, data=result)
                 except Exception as e:
                     return self.handle_error(e)
     """
 
+    CACHE_MAX_ENTRIES = 256
+
     def __init__(self) -> None:
         self._active_workers: dict[str, Any] = {}
-        self._operation_cache: dict[str, Any] = {}
+        self._operation_cache: OrderedDict[str, Any] = OrderedDict()
         self._cache_enabled = True
 
     def enable_cache(self, enabled: bool = True) -> None:
@@ -94,6 +97,7 @@ class AsyncOperationMixin:
     def get_cached(self, key: str) -> Any | None:
         """Get cached result if available."""
         if self._cache_enabled and key in self._operation_cache:
+            self._operation_cache.move_to_end(key)
             return self._operation_cache[key]
         return None
 
@@ -101,6 +105,9 @@ class AsyncOperationMixin:
         """Cache an operation result."""
         if self._cache_enabled:
             self._operation_cache[key] = result
+            self._operation_cache.move_to_end(key)
+            if len(self._operation_cache) > self.CACHE_MAX_ENTRIES:
+                self._operation_cache.popitem(last=False)
 
     def clear_cache(self, key: str | None = None) -> None:
         """Clear cache entries."""
@@ -226,6 +233,20 @@ class BaseWidget(Container, AsyncOperationMixin):
         safe_message = message.encode("ascii", "replace").decode("ascii")
         logger.info(f"[{self.widget_name}] {safe_message}")
 
+    def batch_status(self, level: Literal["error", "success"], message: str, status: str = "") -> None:
+        """Report an outcome and update the status line in a single repaint.
+
+        Shows ``message`` through display_error() or display_success(), then sets
+        ``status`` if given; otherwise the "Error"/"Ready" status those leave stands.
+        """
+        with self.app.batch_update():
+            if level == "error":
+                self.display_error(message)
+            else:
+                self.display_success(message)
+            if status:
+                self.set_status(status)
+
     def show_loading(self, message: str = "Processing...") -> None:
         """Show loading state."""
         self.is_loading = True
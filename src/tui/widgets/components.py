@@ -7,18 +7,52 @@ Provides common UI elements that all Phase 4 widgets use:
 - ErrorDisplay: Consistent error message display
 """
 
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import DataTable, Input, Label, ProgressBar, Static
 from textual.widgets.data_table import RowKey
 
-
-@dataclass(slots=True)
+# Fastest rate ProgressWidget.update() pushes ticks to the screen (20 Hz).
+_PROGRESS_MIN_INTERVAL_NS = 1_000_000_000 // 20
+
+# Status styling shared by every results table and indicator; read-only so the
+# single instance can be handed out as a class attribute.
+_STATUS_COLORS = MappingProxyType(
+    {
+        "open": "green",
+        "closed": "red",
+        "filtered": "yellow",
+        "success": "green",
+        "error": "red",
+        "warning": "yellow",
+        "pending": "blue",
+    }
+)
+_STATUS_SYMBOLS = MappingProxyType(
+    {
+        "success": "✅",
+        "error": "❌",
+        "warning": "⚠️",
+        "pending": "⏳",
+        "open": "🟢",
+        "closed": "🔴",
+        "filtered": "🟡",
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ResultColumn:
     """Definition for a results table column."""
 
@@ -26,6 +60,9 @@ class ResultColumn:
     key: str
     width: int | None = None
     cell_width: int | None = None
+    # Set when callers always pass str for this column, so rows skip the str() cast.
+    # A non-str value that slips through is still cast, at the cost of a type check.
+    is_str: bool = False
 
 
 class HistoryInput(Input):
@@ -126,19 +163,29 @@ class ResultsWidget(DataTable[Any]):
                 self.results_widget.add_result_row(**data)
     """
 
-    def __init__(self, columns: list[ResultColumn], *args: Any, **kwargs: Any) -> None:
+    status_colors = _STATUS_COLORS
+
+    def __init__(self, columns: Sequence[ResultColumn], *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.columns_def = columns
+        # A private tuple copy: later edits to the caller's list cannot desync the
+        # table from the key tuple and getter derived from it below.
+        self.columns_def = tuple(columns)
+        # Column keys are fixed for the table's lifetime, so the per-row value
+        # extraction is built once instead of walking columns_def for every row.
+        self._col_keys = tuple(col.key for col in self.columns_def)
+        self._empty_row: dict[str, Any] = dict.fromkeys(self._col_keys, "")
+        self._col_getter = self._build_col_getter(self._col_keys)
+        self._all_str = all(col.is_str for col in self.columns_def)
         self.result_count = 0
-        self.status_colors = {
-            "open": "green",
-            "closed": "red",
-            "filtered": "yellow",
-            "success": "green",
-            "error": "red",
-            "warning": "yellow",
-            "pending": "blue",
-        }
+        # Column store: one list per column holding every result, so filtering and
+        # sorting scan a single list instead of rebuilding a dict per row. Table
+        # row key str(i + 1) always refers to store index i.
+        self._cols: dict[str, list[Any]] = {key: [] for key in self._col_keys}
+        self._col_lists = tuple(self._cols.values())
+        self._filter: tuple[str, str] | None = None
+        self._sort: tuple[str, bool] | None = None
+        # Store indices on screen, in display order; None means all, unsorted.
+        self._view: list[int] | None = None
         self._setup_columns()
 
     def _setup_columns(self) -> None:
@@ -146,41 +193,160 @@ class ResultsWidget(DataTable[Any]):
         for col in self.columns_def:
             self.add_column(col.name, key=col.key, width=col.cell_width or 20)
 
-    def add_result_row(self, **data: Any) -> RowKey:
-        """Add a result row."""
-        values = [str(data.get(col.key, "")) for col in self.columns_def]
+    @staticmethod
+    def _build_col_getter(keys: tuple[str, ...]) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
+        """Return a callable extracting ``keys`` from a row dict, always as a tuple."""
+        if len(keys) > 1:
+            return itemgetter(*keys)
+        if keys:
+            key = keys[0]
+            return lambda row: (row[key],)
+        return lambda _row: ()
+
+    def _row_values(self, data: dict[str, Any]) -> tuple[str, ...]:
+        """Return the display strings for ``data`` in column order."""
+        values = self._col_getter(self._empty_row | data)
+        if self._all_str and all(isinstance(value, str) for value in values):
+            return values
+        return tuple(map(str, values))
+
+    def _store_row(self, values: tuple[Any, ...]) -> int:
+        """Append ``values`` to the column store and return the new row's index."""
+        for column, value in zip(self._col_lists, values, strict=True):
+            column.append(value)
+        index = self.result_count
         self.result_count += 1
-        return super().add_row(*values, key=str(self.result_count))
+        return index
+
+    def _matches_filter(self, index: int) -> bool:
+        """Return whether store row ``index`` passes the active filter."""
+        if self._filter is None:
+            return True
+        column_key, value = self._filter
+        return value in self._cols[column_key][index]
+
+    def add_result_row(self, **data: Any) -> RowKey | None:
+        """Add a result row.
+
+        While a filter or sort is active, the row is appended to the view only if it
+        matches the filter; call sort_by() again to re-sort it into place.
+
+        Returns:
+            The table key of the new row, or None if the active filter hides it
+            (the row is still kept and shows up once the filter changes).
+
+        """
+        values = self._row_values(data)
+        index = self._store_row(values)
+        key = str(index + 1)
+        if self._view is not None:
+            if not self._matches_filter(index):
+                return None
+            self._view.append(index)
+        return super().add_row(*values, key=key)
+
+    def _batch_update(self) -> AbstractContextManager[None]:
+        """Hold the app's repaints, or do nothing when not running inside an app."""
+        return self.app.batch_update() if self.is_attached else nullcontext()
 
     def add_result_rows(self, rows: list[dict[str, Any]]) -> None:
-        """Add multiple result rows."""
-        for row in rows:
-            self.add_result_row(**row)
+        """Add multiple result rows, repainting once for the whole batch."""
+        if self._view is not None:
+            with self._batch_update():
+                for row in rows:
+                    self.add_result_row(**row)
+            return
+        add_row = super().add_row
+        store_row = self._store_row
+        row_values = self._row_values
+        with self._batch_update():
+            for row in rows:
+                values = row_values(row)
+                add_row(*values, key=str(store_row(values) + 1))
+
+    def sync_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Make the table show exactly ``rows``, rewriting only the cells that changed.
+
+        Unlike clear_results() followed by add_result_rows(), rows that are already
+        on screen stay put, so repeated lookups keep the scroll position and skip
+        the relayout a full clear causes.
+        """
+        new_values = [self._row_values(row) for row in rows]
+        old_count = self.result_count
+        if self._view is None:
+            with self._batch_update():
+                for index, values in enumerate(new_values[:old_count]):
+                    for col_key, column, new in zip(self._col_keys, self._col_lists, values, strict=True):
+                        if column[index] != new:
+                            self.update_cell(str(index + 1), col_key, new)
+                for index in range(len(new_values), old_count):
+                    self.remove_row(str(index + 1))
+                # Keys stay "1".."N": rows are only ever trimmed or appended at the tail.
+                for index in range(old_count, len(new_values)):
+                    super().add_row(*new_values[index], key=str(index + 1))
+        for position, column in enumerate(self._col_lists):
+            column[:] = [values[position] for values in new_values]
+        self.result_count = len(new_values)
+        if self._view is not None:
+            self._apply_view()
 
     def get_results(self) -> list[dict[str, Any]]:
-        """Get all results as list of dicts."""
-        results: list[dict[str, Any]] = []
-        for row_key in getattr(self, "rows", {}):
-            row_data = {}
-            for i, col in enumerate(self.columns_def):
-                value = self.get_cell(row_key, str(i))  # Assuming column indices are strings or using cell access correctly
-                row_data[col.key] = value
-            results.append(row_data)
-        return results
+        """Get the results currently shown, in display order, as a list of dicts."""
+        keys = self._col_keys
+        columns = self._col_lists
+        indices = range(self.result_count) if self._view is None else self._view
+        return [dict(zip(keys, [column[i] for column in columns], strict=True)) for i in indices]
 
     def get_summary(self) -> str:
         """Get results summary statistics."""
         return f"Total results: {self.result_count}"
 
     def filter_by(self, column_key: str, value: str) -> None:
-        """Filter results by column value."""
-        # Custom filtering implementation as Textual DataTable lacks built-in filtering
-        # This would be implemented with a custom filter in subclasses
+        """Show only rows whose ``column_key`` cell contains ``value``; empty shows all."""
+        self._filter = (column_key, value) if value else None
+        self._apply_view()
+
+    def sort_by(self, column_key: str, reverse: bool = False) -> None:
+        """Order the shown rows by the ``column_key`` cell text."""
+        self._sort = (column_key, reverse)
+        self._apply_view()
+
+    def reset_view(self) -> None:
+        """Drop any filter and sort, showing every row in insertion order."""
+        self._filter = None
+        self._sort = None
+        self._apply_view()
+
+    def _apply_view(self) -> None:
+        """Recompute the shown indices from the store and repopulate the table."""
+        indices: list[int] | None = None
+        if self._filter is not None:
+            column_key, value = self._filter
+            indices = [i for i, cell in enumerate(self._cols[column_key]) if value in cell]
+        if self._sort is not None:
+            column_key, reverse = self._sort
+            indices = sorted(
+                range(self.result_count) if indices is None else indices,
+                key=self._cols[column_key].__getitem__,
+                reverse=reverse,
+            )
+        self._view = indices
+        add_row = super().add_row
+        columns = self._col_lists
+        with self._batch_update():
+            self.clear()
+            for i in range(self.result_count) if indices is None else indices:
+                add_row(*[column[i] for column in columns], key=str(i + 1))
 
     def clear_results(self) -> None:
         """Clear all results from table."""
         self.clear()
         self.result_count = 0
+        for column in self._col_lists:
+            column.clear()
+        self._filter = None
+        self._sort = None
+        self._view = None
 
 
 class ProgressWidget(Container):
@@ -208,6 +374,17 @@ class ProgressWidget(Container):
     total = reactive(100)
     description = reactive("Processing...")
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._bar: ProgressBar | None = None
+        self._stats_label: Label | None = None
+        self._desc_label: Label | None = None
+        self._last_pct = -1
+        self._last_total = -1
+        self._last_render_ns = 0
+        self._pending: tuple[int, int, str] | None = None
+        self._flush_timer: Timer | None = None
+
     def compose(self) -> ComposeResult:
         yield Vertical(
             Label(id="progress-description"),
@@ -215,28 +392,76 @@ class ProgressWidget(Container):
             Label(id="progress-stats"),
         )
 
+    def on_mount(self) -> None:
+        """Look up the child widgets once instead of on every progress tick."""
+        self._bar = self.query_one("#progress-bar", ProgressBar)
+        self._stats_label = self.query_one("#progress-stats", Label)
+        self._desc_label = self.query_one("#progress-description", Label)
+        self._last_pct = -1
+        self._last_total = -1
+        self.watch_progress(self.progress)
+        self.watch_description(self.description)
+
     def update(self, current: int, total: int, description: str = "") -> None:
-        """Update progress display."""
-        self.progress = current
+        """Update progress display.
+
+        Calls arriving faster than 20 Hz are coalesced: the latest values are held
+        and shown by a short timer, while the final tick is always shown at once.
+        """
+        now = time.monotonic_ns()
+        wait_ns = self._last_render_ns + _PROGRESS_MIN_INTERVAL_NS - now
+        if current != total and wait_ns > 0 and self.is_mounted:
+            if not description and self._pending is not None:
+                description = self._pending[2]
+            self._pending = (current, total, description)
+            if self._flush_timer is None:
+                self._flush_timer = self.set_timer(wait_ns / 1e9, self._flush_pending)
+            return
+        self._apply_progress(current, total, description, now)
+
+    def _flush_pending(self) -> None:
+        """Show the values held back by update()."""
+        self._flush_timer = None
+        if self._pending is not None:
+            self._apply_progress(*self._pending, time.monotonic_ns())
+
+    def _apply_progress(self, current: int, total: int, description: str, now_ns: int) -> None:
+        """Write the reactives that drive the display."""
+        self._pending = None
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._last_render_ns = now_ns
+        # total first, so the progress watcher computes against the new total.
         self.total = total
+        self.progress = current
         if description:
             self.description = description
 
     def watch_progress(self, progress: int) -> None:
-        """Update progress bar and stats label when progress changes."""
-        # Update progress bar
-        bar = self.query_one("#progress-bar", ProgressBar)
-        percentage = (progress / self.total * 100) if self.total > 0 else 0
-        bar.progress = percentage
+        """Update progress bar and stats label when progress changes.
+
+        Ticks that move less than a whole percent against an unchanged total are
+        skipped, except the last one.
+        """
+        if self._bar is None or self._stats_label is None:
+            return
+        percentage = progress * 100 // self.total if self.total > 0 else 0
+        if percentage == self._last_pct and self.total == self._last_total and progress != self.total:
+            return
+        self._last_pct = percentage
+        self._last_total = self.total
+        self._bar.progress = percentage
+        self._stats_label.update(f"{progress}/{self.total} ({percentage}%)")
 
-        # Update stats label
-        stats_label = self.query_one("#progress-stats", Label)
-        stats_label.update(f"{progress}/{self.total} ({percentage:.1f}%)")
+    def watch_total(self, total: int) -> None:
+        """Redraw the stats label, which shows the total, when the total changes."""
+        self.watch_progress(self.progress)
 
     def watch_description(self, description: str) -> None:
         """Update description label."""
-        label = self.query_one("#progress-description", Label)
-        label.update(description)
+        if self._desc_label is not None:
+            self._desc_label.update(description)
 
 
 class StatusIndicator(Static):
@@ -257,20 +482,17 @@ class StatusIndicator(Static):
         self.status = status
         self.text = text
         self.details = details
+        # (status, text) last drawn, so repeated set_status calls skip the re-render.
+        self._rendered: tuple[str, str] | None = None
         self._update_display()
 
     def _update_display(self) -> None:
         """Update the status display."""
-        status_symbols = {
-            "success": "✅",
-            "error": "❌",
-            "warning": "⚠️",
-            "pending": "⏳",
-            "open": "🟢",
-            "closed": "🔴",
-            "filtered": "🟡",
-        }
-        symbol = status_symbols.get(self.status, "●")
+        shown = (self.status, self.text)
+        if shown == self._rendered:
+            return
+        self._rendered = shown
+        symbol = _STATUS_SYMBOLS.get(self.status, "●")
         self.update(f"{symbol} {self.text}")
 
     def set_status(self, status: str, text: str = "", details: str = "") -> None:
@@ -302,33 +524,41 @@ class ErrorDisplay(Static):
     error_details = reactive("")
     is_visible = reactive(False)
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Styled once here; showing and clearing only toggle display, so no style
+        # recomputation happens per error.
+        self.styles.border = ("solid", "red")
+        self.styles.padding = (1, 2)
+        self.display = False
+        self._rendered = ""
+
     def show_error(self, message: str, details: str = "") -> None:
         """Display an error."""
-        self.error_message = message
-        self.error_details = details
         self.is_visible = True
+        self.error_details = details
+        self.error_message = message
         self._update_display()
 
     def clear_error(self) -> None:
         """Clear the error display."""
+        self.is_visible = False
         self.error_message = ""
         self.error_details = ""
-        self.is_visible = False
-        self.update("")
+        self._update_display()
 
     def _update_display(self) -> None:
         """Update error display."""
-        if not self.is_visible or not self.error_message:
-            self.update("")
-            return
-
-        display = f"❌ {self.error_message}"
-        if self.error_details:
-            display += f"\n  Details: {self.error_details}"
+        text = ""
+        if self.is_visible and self.error_message:
+            text = f"❌ {self.error_message}"
+            if self.error_details:
+                text += f"\n  Details: {self.error_details}"
 
-        self.update(display)
-        self.styles.border = ("solid", "red")
-        self.styles.padding = (1, 2)
+        self.display = bool(text)
+        if text != self._rendered:
+            self._rendered = text
+            self.update(text)
 
     def watch_error_message(self, message: str) -> None:
         """React to error message changes."""
@@ -353,26 +583,40 @@ class SummaryWidget(Static):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.stats: dict[str, dict[str, Any]] = {}
+        # Rendered markup per stat, so an add formats only its own line.
+        self._lines: dict[str, str] = {}
+        self._batch_depth = 0
 
     def add_stat(self, name: str, value: str, color: str | None = None) -> None:
         """Add a statistic."""
         self.stats[name] = {"value": value, "color": color}
-        self._update_display()
+        self._lines[name] = f"{name}: [{color}]{value}[/{color}]" if color else f"{name}: {value}"
+        if not self._batch_depth:
+            self._update_display()
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Hold redraws while adding several stats, then render once on exit.
+
+        Usage:
+            with summary.batch_update():
+                for name, value in totals.items():
+                    summary.add_stat(name, value)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._update_display()
 
     def _update_display(self) -> None:
         """Update the summary display."""
-        lines = []
-        for name, data in self.stats.items():
-            value = data["value"]
-            color = data.get("color", "")
-            if color:
-                lines.append(f"{name}: [{color}]{value}[/{color}]")
-            else:
-                lines.append(f"{name}: {value}")
-
-        self.update("\n".join(lines))
+        self.update("\n".join(self._lines.values()))
 
     def clear_stats(self) -> None:
         """Clear all statistics."""
         self.stats.clear()
+        self._lines.clear()
         self.update("")
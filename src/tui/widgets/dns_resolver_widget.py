@@ -5,21 +5,20 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from textual import work
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Input, Label, Select, Static
 
 from network_triage.exports import export_to_csv, export_to_json
 
-# Import DNS utilities
-from shared.dns_utils import DNSStatus
-from shared.dns_utils import resolve_hostname as resolve_dns_hostname
-
 from .base import BaseWidget, TaskCompleted
 from .components import HistoryInput, ResultColumn, ResultsWidget
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+    from shared.dns_utils import DNSLookupResult
+
 
 class DNSResolverWidget(BaseWidget):
     """DNS Resolver Widget - resolves hostnames to IP addresses."""
@@ -28,6 +27,8 @@ class DNSResolverWidget(BaseWidget):
         super().__init__(*args, **kwargs)
         self.widget_name = "DNSResolverWidget"
         self._last_results: list[dict[str, Any]] = []
+        # Bumped per lookup (and on clear) so late worker results are dropped.
+        self._resolve_token = 0
 
     def compose(self) -> ComposeResult:
         """Compose the widget UI."""
@@ -41,11 +42,14 @@ class DNSResolverWidget(BaseWidget):
         with Vertical(id="input-section"):
             # Hostname input
             yield Label("Hostname:")
-            yield HistoryInput(id="hostname-input", placeholder="example.com", tooltip="Enter hostname to resolve")
+            self._hostname_input = HistoryInput(
+                id="hostname-input", placeholder="example.com", tooltip="Enter hostname to resolve"
+            )
+            yield self._hostname_input
 
             # Query type select
             yield Label("Query Type:")
-            yield Select(
+            self._query_type_select: Select[str] = Select(
                 [
                     ("A Records (IPv4)", "A"),
                     ("AAAA Records (IPv6)", "AAAA"),
@@ -56,14 +60,16 @@ class DNSResolverWidget(BaseWidget):
                 id="query-type-select",
                 value="A",
             )
+            yield self._query_type_select
 
             # DNS server input (optional)
             yield Label("DNS Server (optional):")
-            yield Input(
+            self._dns_server_input = Input(
                 id="dns-server-input",
                 placeholder="Leave blank for system DNS",
                 tooltip="Optional: specify custom DNS server",
             )
+            yield self._dns_server_input
 
             # Action buttons
             with Horizontal(id="button-section"):
@@ -76,15 +82,16 @@ class DNSResolverWidget(BaseWidget):
 
         # Results table
         columns = [
-            ResultColumn("Type", "type", width=10),
-            ResultColumn("Value", "value", width=40),
-            ResultColumn("Time (ms)", "time", width=12),
+            ResultColumn("Type", "type", width=10, is_str=True),
+            ResultColumn("Value", "value", width=40, is_str=True),
+            ResultColumn("Time (ms)", "time", width=12, is_str=True),
         ]
         self.results_widget = ResultsWidget(columns=columns)
         yield self.results_widget
 
         # Status section
-        yield Label("", id="status-label")
+        self._status_label = Label("", id="status-label")
+        yield self._status_label
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -100,102 +107,126 @@ class DNSResolverWidget(BaseWidget):
         """Resolve the hostname using Phase 3 DNS utilities."""
         try:
             # Get hostname from input
-            hostname_input = self.query_one("#hostname-input", HistoryInput)
+            hostname_input = self._hostname_input
             hostname = hostname_input.value.strip()
 
             # Validate input
             if not hostname:
-                self.display_error("Please enter a hostname")
-                self.set_status("Error: No hostname entered")
+                self.batch_status("error", "Please enter a hostname", "Error: No hostname entered")
                 return
 
             # Push to history
             hostname_input.push_history(hostname)
 
             # Get query type from select
-            query_type_select = self.query_one("#query-type-select", Select)
-            query_type = query_type_select.value or "A"
+            query_type = self._query_type_select.value or "A"
 
             # Show loading state
             self.show_loading(f"Resolving {hostname}...")
             self.set_status(f"Resolving {hostname}...")
 
-            # Clear previous results
-            self.results_widget.clear_results()
+            # Look up on a worker thread; a 5 s timeout must not freeze the UI.
+            self._resolve_token += 1
+            self._resolve_worker(hostname, query_type, self._resolve_token)
+
+        except Exception as e:
+            self.batch_status("error", f"Error: {e!s}", f"Error: {e!s}")
 
-            # Perform DNS resolution using Phase 3 utility
-            # This is synchronous, so it works in the main thread
+    @work(thread=True, exclusive=True, group="dns_job")
+    def _resolve_worker(self, hostname: str, query_type: str, token: int) -> None:
+        """Run the blocking DNS lookup on a background thread."""
+        # Imported on first lookup rather than at startup; later calls hit sys.modules.
+        from shared.dns_utils import resolve_hostname as resolve_dns_hostname
+
+        try:
             result = resolve_dns_hostname(hostname, timeout=5, include_reverse_dns=True)
+            self.app.call_from_thread(self._on_resolve_complete, hostname, query_type, token, result)
+        except Exception as e:
+            self.app.call_from_thread(self._on_resolve_error, token, str(e))
+
+    def _on_resolve_complete(self, hostname: str, query_type: str, token: int, result: DNSLookupResult) -> None:
+        """Render a finished lookup (UI thread), unless a newer one superseded it."""
+        if token != self._resolve_token:
+            return
+        from shared.dns_utils import DNSStatus
+
+        try:
             self._last_results = []
 
             # Check if resolution was successful
             match result.status:
                 case DNSStatus.NOT_FOUND:
-                    self.display_error(f"Could not resolve {hostname}")
-                    self.set_status(f"Failed to resolve {hostname}")
+                    self.results_widget.clear_results()
+                    self.batch_status("error", f"Could not resolve {hostname}", f"Failed to resolve {hostname}")
                     return
                 case DNSStatus.TIMEOUT:
-                    self.display_error("DNS resolution timeout")
-                    self.set_status("Timeout - no response from DNS server")
+                    self.results_widget.clear_results()
+                    self.batch_status("error", "DNS resolution timeout", "Timeout - no response from DNS server")
                     return
                 case DNSStatus.ERROR:
-                    self.display_error(f"Error: {result.error_message}")
-                    self.set_status(f"Error: {result.error_message}")
+                    self.results_widget.clear_results()
+                    self.batch_status("error", f"Error: {result.error_message}", f"Error: {result.error_message}")
                     return
                 case _:
                     pass
 
-            # Display results based on query type
-            record_count = 0
+            # Index record timings once, already formatted, so each address is a
+            # dict lookup rather than a rescan of result.records. The first record
+            # per (type, value) wins, as the original next() scan did.
+            time_by_key: dict[tuple[str, str], str] = {}
+            ptr_time = "N/A"
+            for r in result.records:
+                key = (r.record_type, r.value)
+                if key not in time_by_key:
+                    time_by_key[key] = f"{r.query_time_ms:.2f}"
+                    if r.record_type == "PTR" and ptr_time == "N/A":
+                        ptr_time = time_by_key[key]
+
+            # Display results based on query type; rows are added in one batch
+            rows: list[dict[str, Any]] = []
 
             # Add A records (IPv4)
             if query_type in ["A", "BOTH", "ALL"] and result.ipv4_addresses:
-                for ip in result.ipv4_addresses:
-                    # Find the record with this IP to get timing
-                    record = next((r for r in result.records if r.value == ip and r.record_type == "A"), None)
-                    self.results_widget.add_result_row(
-                        type="A",
-                        value=ip,
-                        time=f"{record.query_time_ms:.2f}" if record else "N/A",
-                    )
-                    record_count += 1
+                rows.extend(
+                    {"type": "A", "value": ip, "time": time_by_key.get(("A", ip), "N/A")} for ip in result.ipv4_addresses
+                )
 
             # Add AAAA records (IPv6)
             if query_type in ["AAAA", "BOTH", "ALL"] and result.ipv6_addresses:
-                for ip in result.ipv6_addresses:
-                    # Find the record with this IP to get timing
-                    record = next((r for r in result.records if r.value == ip and r.record_type == "AAAA"), None)
-                    self.results_widget.add_result_row(
-                        type="AAAA",
-                        value=ip,
-                        time=f"{record.query_time_ms:.2f}" if record else "N/A",
-                    )
-                    record_count += 1
+                rows.extend(
+                    {"type": "AAAA", "value": ip, "time": time_by_key.get(("AAAA", ip), "N/A")} for ip in result.ipv6_addresses
+                )
 
             # Add PTR record (Reverse DNS)
             if query_type in ["PTR", "ALL"] and result.reverse_dns:
-                record = next((r for r in result.records if r.record_type == "PTR"), None)
-                self.results_widget.add_result_row(
-                    type="PTR",
-                    value=result.reverse_dns,
-                    time=f"{record.query_time_ms:.2f}" if record else "N/A",
-                )
-                record_count += 1
+                rows.append({"type": "PTR", "value": result.reverse_dns, "time": ptr_time})
+
+            # Previous rows stay visible during the lookup; diff them into place
+            self.results_widget.sync_rows(rows)
+            record_count = len(rows)
 
             # Show success message
             if record_count > 0:
-                self.display_success(f"Resolved {hostname} - Found {record_count} record(s) in {result.lookup_time_ms:.2f}ms")
-                self.set_status(f"✓ Resolved {hostname} - {record_count} records found")
+                self.batch_status(
+                    "success",
+                    f"Resolved {hostname} - Found {record_count} record(s) in {result.lookup_time_ms:.2f}ms",
+                    f"✓ Resolved {hostname} - {record_count} records found",
+                )
             else:
-                self.display_error(f"No records found for {hostname}")
-                self.set_status(f"No records found for {hostname}")
+                self.batch_status("error", f"No records found for {hostname}", f"No records found for {hostname}")
 
             # Notify app that task is complete (for tab badges)
             self.post_message(TaskCompleted(self.id))
 
         except Exception as e:
-            self.display_error(f"Error: {e!s}")
-            self.set_status(f"Error: {e!s}")
+            self.batch_status("error", f"Error: {e!s}", f"Error: {e!s}")
+
+    def _on_resolve_error(self, token: int, error_msg: str) -> None:
+        """Report a failed lookup (UI thread), unless a newer one superseded it."""
+        if token != self._resolve_token:
+            return
+        self.results_widget.clear_results()
+        self.batch_status("error", f"Error: {error_msg}", f"Error: {error_msg}")
 
     def export_results(self) -> None:
         """Export current results to CSV and JSON in the user's home directory."""
@@ -226,23 +257,19 @@ class DNSResolverWidget(BaseWidget):
     def clear_results(self) -> None:
         """Clear all results and inputs."""
         try:
-            # Clear inputs
+            # Clear inputs, and drop any lookup still in flight
+            self._resolve_token += 1
             self._last_results = []
-            hostname_input = self.query_one("#hostname-input", Input)
-            hostname_input.value = ""
-
-            dns_server_input = self.query_one("#dns-server-input", Input)
-            dns_server_input.value = ""
+            self._hostname_input.value = ""
+            self._dns_server_input.value = ""
 
             # Clear results
             self.results_widget.clear_results()
 
             # Clear status
-            status_label = self.query_one("#status-label", Label)
-            status_label.update("")
+            self._status_label.update("")
 
-            self.set_status("Ready")
-            self.display_success("Cleared all results")
+            self.batch_status("success", "Cleared all results", "Ready")
 
         except Exception as e:
             self.display_error(f"Error clearing: {e!s}")
@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from textual import work
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Input, Label, Select, Static
 
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
 from network_triage.exports import export_to_csv, export_to_json
 from network_triage.logging import get_logger
 from shared.port_utils import (
@@ -17,7 +24,6 @@ from shared.port_utils import (
     PortCheckResult,
     PortStatus,
     check_multiple_ports_stream,
-    summarize_port_scan,
 )
 
 from .base import BaseWidget, TaskCompleted
@@ -28,6 +34,51 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Upper bound on connects in flight at once. Probes are non-blocking sockets
+# on the event loop, so the real limit is file descriptors, not threads.
+_MAX_SCAN_CONCURRENCY = 500
+
+# "start-end" port range, e.g. "1-1024" or "20 - 25"
+_RANGE_RE = re.compile(r"^(\d+)\s*-\s*(\d+)$")
+
+# Rendered Status cell for each port status, built once instead of per row
+_STATUS_MARKUP = MappingProxyType(
+    {
+        status: f"[{color}]{status.value.upper()}[/{color}]"
+        for status, color in (
+            (PortStatus.OPEN, "green"),
+            (PortStatus.CLOSED, "red"),
+            (PortStatus.FILTERED, "yellow"),
+            (PortStatus.TIMEOUT, "dim"),
+            (PortStatus.ERROR, "dim"),
+        )
+    }
+)
+
+# Ports probed by the "common services" scan mode
+_COMMON_PORTS = tuple(sorted(COMMON_SERVICE_PORTS))
+
+
+def _scan_concurrency(port_count: int) -> int:
+    """Size the scan's connect semaphore to the port count and descriptor budget."""
+    limit = _MAX_SCAN_CONCURRENCY
+    if resource is not None:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY:
+            # Leave half the descriptors for the rest of the app
+            limit = min(limit, soft // 2)
+    return max(1, min(port_count, limit))
+
+
+def _format_tally(total: int, open_count: int, closed_count: int, filtered_count: int) -> str:
+    """Format the per-status counts shown in the summary line."""
+    return (
+        f"Total: {total} | "
+        f"[green]Open: {open_count}[/green] | "
+        f"[red]Closed: {closed_count}[/red] | "
+        f"[yellow]Filtered: {filtered_count}[/yellow]"
+    )
+
 
 class PortScannerWidget(BaseWidget):
     """Port Scanner Widget - scans and detects open ports."""
@@ -36,7 +87,15 @@ class PortScannerWidget(BaseWidget):
         super().__init__(*args, **kwargs)
         self.widget_name = "PortScannerWidget"
         self.scan_in_progress = False
+        # Bumped for every scan started or cancelled; a worker only clears
+        # scan_in_progress if no newer scan has taken over since it started
+        self._scan_generation = 0
         self._current_results: list[PortCheckResult] = []
+        # Running totals for the scan in progress, updated as results arrive
+        # so the final summary needs no second pass over the results
+        self._status_counts: dict[PortStatus, int] = {}
+        self._response_time_sum = 0.0
+        self._timed_count = 0
 
     def compose(self) -> ComposeResult:
         """Compose the widget UI."""
@@ -50,11 +109,14 @@ class PortScannerWidget(BaseWidget):
         with Vertical(id="input-section"):
             # Host input
             yield Label("Target Host:")
-            yield HistoryInput(id="host-input", placeholder="localhost or 192.168.1.1", tooltip="Enter hostname or IP address")
+            self._host_input = HistoryInput(
+                id="host-input", placeholder="localhost or 192.168.1.1", tooltip="Enter hostname or IP address"
+            )
+            yield self._host_input
 
             # Scan mode select
             yield Label("Scan Mode:")
-            yield Select(
+            self._scan_mode_select: Select[str] = Select(
                 [
                     ("Common Services (30 ports)", "common"),
                     ("Single Port", "single"),
@@ -64,18 +126,23 @@ class PortScannerWidget(BaseWidget):
                 id="scan-mode-select",
                 value="common",
             )
+            yield self._scan_mode_select
 
             # Port input (conditional based on mode)
             yield Label("Ports (for single/multiple/range):")
-            yield Input(
+            self._port_input = Input(
                 id="port-input",
                 placeholder="e.g. 80 or 80,443,22 or 1-1024",
                 tooltip="Port number, comma-separated ports, or port range",
             )
+            yield self._port_input
 
             # Timeout setting
             yield Label("Timeout per port (seconds):")
-            yield Input(id="timeout-input", value="3", placeholder="3", tooltip="Connection timeout in seconds")
+            self._timeout_input = Input(
+                id="timeout-input", value="3", placeholder="3", tooltip="Connection timeout in seconds"
+            )
+            yield self._timeout_input
 
             # Action buttons
             with Horizontal(id="button-section"):
@@ -88,19 +155,21 @@ class PortScannerWidget(BaseWidget):
 
         # Results table
         columns = [
-            ResultColumn("Port", "port", width=8),
-            ResultColumn("Service", "service", width=20),
-            ResultColumn("Status", "status", width=12),
-            ResultColumn("Time (ms)", "time", width=12),
+            ResultColumn("Port", "port", width=8, is_str=True),
+            ResultColumn("Service", "service", width=20, is_str=True),
+            ResultColumn("Status", "status", width=12, is_str=True),
+            ResultColumn("Time (ms)", "time", width=12, is_str=True),
         ]
         self.results_widget = ResultsWidget(columns=columns)
         yield self.results_widget
 
         # Summary section
-        yield Label("", id="summary-label")
+        self._summary_label = Label("", id="summary-label")
+        yield self._summary_label
 
         # Status section
-        yield Label("", id="status-label")
+        self._status_label = Label("", id="status-label")
+        yield self._status_label
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -138,23 +207,20 @@ class PortScannerWidget(BaseWidget):
                         logger.warning("Empty port input")
                         return None
 
-                    ports = []
-                    for port_str in port_input.split(","):
-                        port_str = port_str.strip()
-                        if not port_str:
-                            continue
-                        port = int(port_str)
-                        if 1 <= port <= 65535:
-                            ports.append(port)
-                        else:
-                            logger.warning(f"Port {port} out of range (1-65535)")
-                            return None
-
+                    # Skip blank segments; int() tolerates surrounding whitespace.
+                    # The set dedupes while parsing, so range checks only need
+                    # the extremes.
+                    ports = set(map(int, filter(str.strip, port_input.split(","))))
                     if not ports:
                         logger.warning("No valid ports provided")
                         return None
 
-                    return sorted(set(ports))  # Remove duplicates and sort
+                    low, high = min(ports), max(ports)
+                    if low < 1 or high > 65535:
+                        logger.warning(f"Port {low if low < 1 else high} out of range (1-65535)")
+                        return None
+
+                    return sorted(ports)
                 except ValueError as e:
                     logger.warning(f"Invalid port format: {port_input} - {e}")
                     return None
@@ -165,7 +231,7 @@ class PortScannerWidget(BaseWidget):
                     logger.warning("Empty range input")
                     return None
 
-                regex_match = re.match(r"^(\d+)\s*-\s*(\d+)$", port_input)
+                regex_match = _RANGE_RE.match(port_input)
                 if not regex_match:
                     logger.warning(f"Invalid range format: {port_input}")
                     return None
@@ -204,8 +270,7 @@ class PortScannerWidget(BaseWidget):
 
         try:
             # Get inputs
-            host_input = self.query_one("#host-input", HistoryInput)
-            host = host_input.value.strip()
+            host = self._host_input.value.strip()
 
             # Validate host
             if not host:
@@ -214,16 +279,14 @@ class PortScannerWidget(BaseWidget):
                 return
 
             # Push to history
-            host_input.push_history(host)
+            self._host_input.push_history(host)
 
             # Get scan mode
-            scan_mode_select = self.query_one("#scan-mode-select", Select)
-            scan_mode = scan_mode_select.value if isinstance(scan_mode_select.value, str) else "common"
+            scan_mode = self._scan_mode_select.value if isinstance(self._scan_mode_select.value, str) else "common"
 
             # Get timeout
-            timeout_input = self.query_one("#timeout-input", Input)
             try:
-                timeout = int(timeout_input.value.strip())
+                timeout = int(self._timeout_input.value.strip())
                 if timeout < 1 or timeout > 30:
                     self.display_error("Timeout must be between 1 and 30 seconds")
                     return
@@ -233,19 +296,17 @@ class PortScannerWidget(BaseWidget):
 
             # Clear previous results
             self.results_widget.clear_results()
-            summary_label = self.query_one("#summary-label", Label)
-            summary_label.update("")
+            self._summary_label.update("")
 
             # Parse ports based on mode
             ports_to_scan: list[int] = []
 
             if scan_mode == "common":
-                ports_to_scan = list(COMMON_SERVICE_PORTS.keys())
+                ports_to_scan = list(_COMMON_PORTS)
                 port_description = f"common services ({len(ports_to_scan)} ports)"
             else:
                 # Parse port input for other modes
-                port_input = self.query_one("#port-input", Input)
-                port_str = port_input.value.strip()
+                port_str = self._port_input.value.strip()
 
                 if not port_str:
                     self.display_error(f"Please specify ports for {scan_mode} scan")
@@ -270,9 +331,10 @@ class PortScannerWidget(BaseWidget):
             self.show_loading(f"Scanning {host} ({port_description})...")
             self.set_status(f"Scanning {host}...")
             self.scan_in_progress = True
+            self._scan_generation += 1
 
             # Start background worker
-            self._run_scan_worker(host, ports_to_scan, timeout)
+            self._run_scan_worker(host, ports_to_scan, timeout, self._scan_generation)
 
         except Exception as e:
             self.display_error(f"Scan error: {e!s}")
@@ -280,11 +342,25 @@ class PortScannerWidget(BaseWidget):
             self.scan_in_progress = False
 
     @work(group="scan_job")
-    async def _run_scan_worker(self, host: str, ports: list[int], timeout_secs: int) -> None:
-        """Run the port scan in the background with streaming updates."""
+    async def _run_scan_worker(self, host: str, ports: list[int], timeout_secs: int, generation: int) -> None:
+        """Run the port scan in the background with streaming updates.
+
+        Args:
+            host: Host to scan.
+            ports: Ports to check.
+            timeout_secs: Per-port connect timeout.
+            generation: The scan's ``_scan_generation``, checked before clearing
+                ``scan_in_progress`` so a cancelled worker cannot clear a newer scan's flag.
+
+        """
         try:
             self._current_results = []
-            async for result in check_multiple_ports_stream(host, ports, timeout_secs=timeout_secs, max_workers=20):
+            self._status_counts = dict.fromkeys(PortStatus, 0)
+            self._response_time_sum = 0.0
+            self._timed_count = 0
+            async for result in check_multiple_ports_stream(
+                host, ports, timeout_secs=timeout_secs, max_workers=_scan_concurrency(len(ports))
+            ):
                 self._current_results.append(result)
                 self._add_single_result(result)
 
@@ -293,59 +369,54 @@ class PortScannerWidget(BaseWidget):
             logger.error(f"Port scan worker error: {e}", exc_info=True)
             self.display_error(f"Scan failed: {e}")
         finally:
-            self.scan_in_progress = False
+            if generation == self._scan_generation:
+                self.scan_in_progress = False
 
     def _add_single_result(self, result: PortCheckResult) -> None:
         """Add a single result row to the UI (UI thread)."""
-        # Determine status color
-        status_str = result.status.value.upper()
-        match result.status:
-            case PortStatus.OPEN:
-                status_str = f"[green]{status_str}[/green]"
-            case PortStatus.CLOSED:
-                status_str = f"[red]{status_str}[/red]"
-            case PortStatus.FILTERED:
-                status_str = f"[yellow]{status_str}[/yellow]"
-            case _:
-                status_str = f"[dim]{status_str}[/dim]"
-
         self.results_widget.add_result_row(
             port=str(result.port),
             service=result.service_name or "Unknown",
-            status=status_str,
+            status=_STATUS_MARKUP[result.status],
             time=f"{result.response_time_ms:.1f}",
         )
 
-        # Update status with current progress
+        # Update the running tally and progress
+        counts = self._status_counts
+        counts[result.status] += 1
+        if result.response_time_ms > 0:
+            # Same rule as summarize_port_scan: untimed probes don't count
+            self._response_time_sum += result.response_time_ms
+            self._timed_count += 1
         count = len(self._current_results)
+        self._summary_label.update(
+            _format_tally(count, counts[PortStatus.OPEN], counts[PortStatus.CLOSED], counts[PortStatus.FILTERED])
+        )
         self.set_status(f"Scanning... {count} ports checked")
 
     def _finalize_scan(self, host: str) -> None:
         """Finalize the scan and display summary (UI thread)."""
-        summary_label = self.query_one("#summary-label", Label)
-        results = self._current_results
+        counts = self._status_counts
+        open_count = counts[PortStatus.OPEN]
+        closed_count = counts[PortStatus.CLOSED]
+        filtered_count = counts[PortStatus.FILTERED]
+        avg_time = self._response_time_sum / self._timed_count if self._timed_count else 0
 
-        # Generate and display summary
-        summary = summarize_port_scan(results)
+        # Display summary from the running totals
         summary_text = (
-            f"Total: {summary['total_scanned']} | "
-            f"[green]Open: {summary['open_count']}[/green] | "
-            f"[red]Closed: {summary['closed_count']}[/red] | "
-            f"[yellow]Filtered: {summary['filtered_count']}[/yellow] | "
-            f"Avg Time: {summary['avg_response_time_ms']:.1f}ms"
+            _format_tally(len(self._current_results), open_count, closed_count, filtered_count)
+            + f" | Avg Time: {avg_time:.1f}ms"
         )
-        summary_label.update(summary_text)
+        self._summary_label.update(summary_text)
 
         # Show success message
-        if summary["open_count"] > 0:
-            self.display_success(f"Scan complete! Found {summary['open_count']} open port(s) on {host}")
+        if open_count > 0:
+            self.display_success(f"Scan complete! Found {open_count} open port(s) on {host}")
         else:
             self.display_success(f"Scan complete on {host}. No open ports found.")
 
         self.set_status(
-            f"✓ Scanned {host} - {summary['open_count']} open, "
-            f"{summary['closed_count']} closed, "
-            f"{summary['filtered_count']} filtered",
+            f"✓ Scanned {host} - {open_count} open, {closed_count} closed, {filtered_count} filtered",
         )
 
         # Notify app that task is complete (for tab badges)
@@ -381,24 +452,25 @@ class PortScannerWidget(BaseWidget):
             self.display_error(f"Export error: {e!s}")
 
     def clear_results(self) -> None:
-        """Clear all results and inputs."""
+        """Clear all results and inputs, cancelling any scan in progress."""
         try:
+            # Stop an in-flight scan so it doesn't keep adding rows
+            if self.scan_in_progress:
+                self.workers.cancel_group(self, "scan_job")
+                self.scan_in_progress = False
+                self._scan_generation += 1
+
             # Clear inputs
             self._current_results = []
-            host_input = self.query_one("#host-input", Input)
-            host_input.value = ""
-
-            port_input = self.query_one("#port-input", Input)
-            port_input.value = ""
+            self._host_input.value = ""
+            self._port_input.value = ""
 
             # Clear results and summary
             self.results_widget.clear_results()
-            summary_label = self.query_one("#summary-label", Label)
-            summary_label.update("")
+            self._summary_label.update("")
 
             # Clear status
-            status_label = self.query_one("#status-label", Label)
-            status_label.update("")
+            self._status_label.update("")
 
             self.set_status("Ready")
             self.display_success("Cleared all results")
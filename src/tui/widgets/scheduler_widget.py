@@ -60,13 +60,13 @@ class SchedulerWidget(BaseWidget):
         yield Label("[bold]Active Tasks[/bold]", id="results-title")
 
         columns = [
-            ResultColumn("ID", "id", width=5),
-            ResultColumn("Target", "target", width=20),
-            ResultColumn("Type", "type", width=10),
-            ResultColumn("Interval", "interval", width=10),
-            ResultColumn("Last Run", "last_run", width=15),
-            ResultColumn("Status", "status", width=15),
-            ResultColumn("Result", "result", width=30),
+            ResultColumn("ID", "id", width=5, is_str=True),
+            ResultColumn("Target", "target", width=20, is_str=True),
+            ResultColumn("Type", "type", width=10, is_str=True),
+            ResultColumn("Interval", "interval", width=10, is_str=True),
+            ResultColumn("Last Run", "last_run", width=15, is_str=True),
+            ResultColumn("Status", "status", width=15, is_str=True),
+            ResultColumn("Result", "result", width=30, is_str=True),
         ]
         self.results_widget = ResultsWidget(columns=columns)
         yield self.results_widget
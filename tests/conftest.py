@@ -20,6 +20,27 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 
+# Markers that keep a test out of the default run, and the option that opts in.
+_OPT_IN_MARKERS = {"slow": "--run-slow", "network": "--run-network"}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the options that enable opt-in test groups."""
+    parser.addoption("--run-slow", action="store_true", default=False, help="run tests marked slow")
+    parser.addoption("--run-network", action="store_true", default=False, help="run tests marked network")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip slow and network tests unless their option was given."""
+    for marker, option in _OPT_IN_MARKERS.items():
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=f"needs {option}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
 @pytest.fixture
 def mock_socket(mocker: MockerFixture) -> Any:
     """Generic socket mock fixture."""
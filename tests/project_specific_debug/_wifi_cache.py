@@ -0,0 +1,77 @@
+"""Short-lived on-disk cache for the Wi-Fi inspectors' command output.
+
+The inspectors shell out to the same slow macOS tools (system_profiler, wdutil,
+airport, networksetup). Running them back to back reuses each command's output
+for a few seconds instead of paying for it again. Tool paths are looked up
+once per process too.
+
+The output names the current network (SSID, BSSID and more), so the cache is
+readable by its owner only. Set NETTRIAGE_WIFI_CACHE_TTL=0 to skip it, e.g.
+when rerunning an inspector right after switching networks.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "nettriage"
+
+# Seconds a command's output is reused; 0 always runs the command
+DEFAULT_TTL = float(os.environ.get("NETTRIAGE_WIFI_CACHE_TTL", "30"))
+
+# airport is not on PATH; it lives inside a private framework
+AIRPORT_PATH = "/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport"
+
+
+@functools.cache
+def find_tool(name: str, *extra_paths: str) -> str | None:
+    """Return the path to a command-line tool, or None, looking it up once per process.
+
+    PATH is searched first, then ``extra_paths`` for tools installed outside it.
+    """
+    return shutil.which(name) or next((path for path in extra_paths if os.access(path, os.X_OK)), None)
+
+
+def run_cached(command: list[str], ttl: float | None = None, timeout: float | None = None) -> subprocess.CompletedProcess[str]:
+    """Run a command like ``subprocess.run(..., capture_output=True, text=True, check=True)``.
+
+    Output of a successful run is reused for ``ttl`` seconds (DEFAULT_TTL when
+    None); a ttl of 0 or less neither reads nor writes the cache. Failures raise
+    as usual and are never cached. Output is captured as bytes and decoded once as
+    UTF-8 (the tools print several hundred KB), rather than through a text-mode pipe.
+    """
+    if ttl is None:
+        ttl = DEFAULT_TTL
+    path = CACHE_DIR / hashlib.sha256("\0".join(command).encode()).hexdigest()
+    if ttl > 0:
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return subprocess.CompletedProcess(command, 0, path.read_bytes().decode("utf-8", "replace"), "")
+        except OSError:
+            pass  # Not cached yet
+
+    raw = subprocess.run(command, capture_output=True, timeout=timeout)
+    process = subprocess.CompletedProcess(
+        command, raw.returncode, raw.stdout.decode("utf-8", "replace"), raw.stderr.decode("utf-8", "replace")
+    )
+    process.check_returncode()
+    if ttl <= 0:
+        return process
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        CACHE_DIR.chmod(0o700)  # mkdir leaves an existing directory's mode alone
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(raw.stdout)
+        tmp.replace(path)
+    except OSError:
+        pass  # Caching is best effort
+    return process
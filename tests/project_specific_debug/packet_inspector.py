@@ -1,56 +1,77 @@
+import argparse
 import os
 import platform
 
-from scapy.all import sniff, wrpcap
-from scapy.contrib.cdp import CDPMsg
-from scapy.contrib.lldp import LLDPDU
+_CAPTURE_FILTER = (
+    "ether proto 0x88cc"  # LLDP
+    " or (ether dst 01:00:0c:cc:cc:cc and ether[20:2] = 0x2000)"  # CDP
+)
 
 
-def inspect_packet():
-    """Captures a single LLDP/CDP packet and prints its structure."""
+def inspect_packet(verbose=False):
+    """Captures a single LLDP/CDP packet, saves it to a pcap, and prints a summary.
+
+    With ``verbose`` the full dissected packet tree is printed as well.
+    """
     if platform.system() != "Windows" and os.geteuid() != 0:
         print("This script requires administrator privileges. Please run with 'sudo'.")
         return
 
-    print("Starting packet capture... waiting for one LLDP or CDP packet.")
-
-    packet_found = False
-
-    def packet_callback(packet):
-        nonlocal packet_found
-        if packet_found:
-            return True  # Stop sniffing after one packet is processed
-
-        if packet.haslayer(LLDPDU) or packet.haslayer(CDPMsg):
-            packet_found = True
-            print("\n" + "=" * 50)
-            print("Packet Captured!")
-            print("=" * 50)
-
-            # The .show() method prints a detailed breakdown of the packet
-            packet.show()
+    # scapy takes the better part of a second to import, so only load it once
+    # we are actually going to capture (not for --help or a missing sudo).
+    try:
+        from scapy.all import sniff, wrpcap
+        from scapy.contrib.cdp import CDPMsg
+        from scapy.contrib.lldp import LLDPDU
+    except ImportError:
+        print("This script requires scapy. Please run: pip install scapy")
+        return
 
-            # Save the packet to a file for analysis in Wireshark
-            pcap_file = "captured_packet.pcap"
-            wrpcap(pcap_file, packet)
-            print("\n" + "=" * 50)
-            print(f"Packet details printed above. Packet also saved to '{pcap_file}'")
-            print("=" * 50)
-            return True  # Tell sniff to stop
-        return False
+    print("Starting packet capture... waiting for one LLDP or CDP packet.")
 
     try:
-        sniff(
-            filter="ether proto 0x88cc or ether dst 01:00:0c:cc:cc:cc",
-            stop_filter=packet_callback,
+        # The BPF filter runs in the kernel and only passes LLDP frames and CDP
+        # frames (SNAP protocol ID 0x2000, which excludes VTP/DTP sent to the
+        # same Cisco multicast address), so the first match is the one we want.
+        packets = sniff(
+            filter=_CAPTURE_FILTER,
+            count=1,
             timeout=60,  # Stop after 60 seconds if no packet is found
         )
-        if not packet_found:
-            print("\nNo LLDP or CDP packets were found in 60 seconds.")
-
     except Exception as e:
         print(f"\nAn error occurred: {e}")
+        return
+
+    if not packets:
+        print("\nNo LLDP or CDP packets were found in 60 seconds.")
+        return
+
+    packet = packets[0]
+    print("\n" + "=" * 50)
+    if packet.haslayer(LLDPDU):
+        print("LLDP Packet Captured!")
+    elif packet.haslayer(CDPMsg):
+        print("CDP Packet Captured!")
+    else:
+        print("Packet Captured!")
+    print("=" * 50)
+
+    # .show() formats every field of the dissected packet, so only do
+    # it on request; the one-line summary is enough to confirm a hit.
+    if verbose:
+        packet.show()
+    else:
+        print(packet.summary())
+
+    # Save the packet to a file for analysis in Wireshark
+    pcap_file = "captured_packet.pcap"
+    wrpcap(pcap_file, packet)
+    print("\n" + "=" * 50)
+    print(f"Packet saved to '{pcap_file}' for analysis in Wireshark")
+    print("=" * 50)
 
 
 if __name__ == "__main__":
-    inspect_packet()
+    parser = argparse.ArgumentParser(description=inspect_packet.__doc__.splitlines()[0])
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every field of the captured packet")
+    inspect_packet(verbose=parser.parse_args().verbose)
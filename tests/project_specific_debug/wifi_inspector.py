@@ -1,7 +1,8 @@
-import os
 import platform
 import subprocess
 
+from _wifi_cache import AIRPORT_PATH, find_tool, run_cached
+
 
 def inspect_wifi_output():
     """Runs the native OS command for Wi-Fi details and prints the raw output."""
@@ -9,14 +10,14 @@ def inspect_wifi_output():
     print(f"--- Running Wi-Fi inspection for {system} ---")
 
     if system == "Darwin":  # macOS
-        airport_path = "/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport"
-        if not os.path.exists(airport_path):
+        airport_path = find_tool("airport", AIRPORT_PATH)
+        if airport_path is None:
             print("Error: Airport utility not found at the expected path.")
             return
 
         command = [airport_path, "-I"]
         try:
-            process = subprocess.run(command, capture_output=True, text=True, check=True)
+            process = run_cached(command)
             print("\n--- Raw Airport Output ---")
             print(process.stdout)
             print("--------------------------")
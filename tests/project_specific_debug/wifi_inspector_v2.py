@@ -1,6 +1,38 @@
 import json
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from _wifi_cache import run_cached
+
+
+def find_wifi_service(profile_json):
+    """Return the first SPNetworkDataType service with Wi-Fi details, or None.
+
+    Services are decoded one at a time and decoding stops at the Wi-Fi one, so
+    the rest of the (large) system_profiler document is never turned into
+    Python objects.
+    """
+    decoder = json.JSONDecoder()
+    key_at = profile_json.find('"SPNetworkDataType"')
+    if key_at == -1:
+        return None
+    pos = profile_json.find("[", key_at) + 1
+    while pos:
+        pos = skip_json_separators(profile_json, pos)
+        if pos >= len(profile_json) or profile_json[pos] == "]":
+            return None
+        service, pos = decoder.raw_decode(profile_json, pos)
+        if "spnetwork_airport_information" in service:
+            return service
+    return None
+
+
+def skip_json_separators(text, pos):
+    """Advance past whitespace and commas between array items."""
+    while pos < len(text) and text[pos] in " \t\r\n,":
+        pos += 1
+    return pos
 
 
 def inspect_wifi_output_v2():
@@ -13,64 +45,64 @@ def inspect_wifi_output_v2():
     print("This script will run several commands to help debug Wi-Fi data collection.")
     print("Please copy and paste the entire output back for analysis.")
 
-    # --- Test 1: networksetup ---
-    print("\n\n--- Test 1: networksetup -getairportnetwork en0 ---")
-    try:
-        command = ["networksetup", "-getairportnetwork", "en0"]
-        process = subprocess.run(command, capture_output=True, text=True, check=True)
-        print("--- Raw Output ---")
-        print(process.stdout)
-        print("------------------")
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"Error running command: {e}")
-        if hasattr(e, "stderr") and e.stderr:
-            print("--- Stderr ---")
-            print(e.stderr)
-            print("--------------")
-
-    # --- Test 2: wdutil ---
-    print("\n\n--- Test 2: wdutil info ---")
-    try:
-        command = ["wdutil", "info"]
-        process = subprocess.run(command, capture_output=True, text=True, check=True)
-        print("--- Raw Output ---")
-        print(process.stdout)
-        print("------------------")
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"Error running command: {e}")
-        if hasattr(e, "stderr") and e.stderr:
-            print("--- Stderr ---")
-            print(e.stderr)
-            print("--------------")
-
-    # --- Test 3: system_profiler ---
-    print("\n\n--- Test 3: system_profiler SPNetworkDataType -json (Wi-Fi section only) ---")
-    try:
-        command = ["system_profiler", "SPNetworkDataType", "-json"]
-        process = subprocess.run(command, capture_output=True, text=True, check=True, timeout=15)
-        network_data = json.loads(process.stdout)
-        wifi_info_found = False
-        for service in network_data.get("SPNetworkDataType", []):
-            if "spnetwork_airport_information" in service:
-                wifi_info_found = True
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        # The three probes are independent, so run them together; output is
+        # still printed in order.
+        airport_network = pool.submit(run_cached, ["networksetup", "-getairportnetwork", "en0"])
+        wdutil_info = pool.submit(run_cached, ["wdutil", "info"])
+        network_profile = pool.submit(run_cached, ["system_profiler", "SPNetworkDataType", "-json"], timeout=15)
+
+        # --- Test 1: networksetup ---
+        print("\n\n--- Test 1: networksetup -getairportnetwork en0 ---")
+        try:
+            process = airport_network.result()
+            print("--- Raw Output ---")
+            print(process.stdout)
+            print("------------------")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"Error running command: {e}")
+            if hasattr(e, "stderr") and e.stderr:
+                print("--- Stderr ---")
+                print(e.stderr)
+                print("--------------")
+
+        # --- Test 2: wdutil ---
+        print("\n\n--- Test 2: wdutil info ---")
+        try:
+            process = wdutil_info.result()
+            print("--- Raw Output ---")
+            print(process.stdout)
+            print("------------------")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"Error running command: {e}")
+            if hasattr(e, "stderr") and e.stderr:
+                print("--- Stderr ---")
+                print(e.stderr)
+                print("--------------")
+
+        # --- Test 3: system_profiler ---
+        print("\n\n--- Test 3: system_profiler SPNetworkDataType -json (Wi-Fi section only) ---")
+        try:
+            process = network_profile.result()
+            service = find_wifi_service(process.stdout)
+            if service is not None:
                 print("--- Raw JSON Output (Wi-Fi Part) ---")
                 print(json.dumps(service, indent=2))
                 print("------------------------------------")
-                break
-        if not wifi_info_found:
-            print("No Wi-Fi information found in system_profiler output.")
-
-    except (
-        subprocess.CalledProcessError,
-        FileNotFoundError,
-        json.JSONDecodeError,
-        subprocess.TimeoutExpired,
-    ) as e:
-        print(f"Error running command: {e}")
-        if hasattr(e, "stderr") and e.stderr:
-            print("--- Stderr ---")
-            print(e.stderr)
-            print("--------------")
+            else:
+                print("No Wi-Fi information found in system_profiler output.")
+
+        except (
+            subprocess.CalledProcessError,
+            FileNotFoundError,
+            json.JSONDecodeError,
+            subprocess.TimeoutExpired,
+        ) as e:
+            print(f"Error running command: {e}")
+            if hasattr(e, "stderr") and e.stderr:
+                print("--- Stderr ---")
+                print(e.stderr)
+                print("--------------")
 
 
 if __name__ == "__main__":
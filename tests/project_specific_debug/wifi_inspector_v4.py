@@ -1,12 +1,5 @@
 import platform
 
-# Attempt to import the CoreWLAN framework for macOS
-try:
-    if platform.system() == "Darwin":
-        import CoreWLAN
-except ImportError:
-    CoreWLAN = None
-
 
 def inspect_wifi_library_output():
     """Directly queries the CoreWLAN library to see exactly what interfaces
@@ -20,29 +13,29 @@ def inspect_wifi_library_output():
     print("This script will directly query the native Wi-Fi library.")
     print("Please copy and paste the entire output back for analysis.")
 
-    if CoreWLAN is None:
+    # Import the CoreWLAN framework only once we know we are on macOS
+    try:
+        import CoreWLAN
+    except ImportError:
         print("\nERROR: The 'pyobjc-framework-CoreWLAN' library is not installed.")
         print("Please run: pip install pyobjc-framework-CoreWLAN")
         return
 
     try:
-        # Get all available Wi-Fi interface names from the library
-        interface_names = CoreWLAN.CWInterface.interfaceNames()
+        # One call returns the materialized CWInterface objects, rather than
+        # fetching the names and then looking each one up over the bridge
+        interfaces = CoreWLAN.CWWiFiClient.sharedWiFiClient().interfaces()
 
-        if not interface_names:
+        if not interfaces:
             print("\n>>> CoreWLAN reports: No Wi-Fi hardware interfaces found at all. <<<")
             return
 
-        print(f"\nCoreWLAN found the following interfaces: {list(interface_names)}")
+        names = [interface.interfaceName() for interface in interfaces]
+        print(f"\nCoreWLAN found the following interfaces: {names}")
 
         # Loop through each interface and print its details
-        for name in interface_names:
+        for name, interface in zip(names, interfaces):
             print(f"\n--- Checking interface: {name} ---")
-            interface = CoreWLAN.CWInterface.interfaceWithName_(name)
-
-            if not interface:
-                print(f"Result: Could not get an interface object for '{name}'.")
-                continue
 
             ssid = interface.ssid()
             bssid = interface.bssid()
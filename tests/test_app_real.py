@@ -5,8 +5,11 @@ Verifies the main UI components and tab switching functionality.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import TYPE_CHECKING, Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -26,8 +29,9 @@ mock_toolkit.get_ip_info.return_value = {
 mock_toolkit.get_connection_details.return_value = {"Interface": "lo0", "Status": "Up"}
 mock_toolkit.health_check.return_value = {"status": "healthy", "components": {"ping": True}}
 
-# Apply the mock to the module-level variable
-network_triage.app.net_tool = mock_toolkit
+# Serve the mock from the module-level toolkit accessor
+_real_net_tool = network_triage.app._net_tool
+network_triage.app._net_tool = MagicMock(return_value=mock_toolkit)
 
 from network_triage.app import NetworkTriageApp
 
@@ -37,6 +41,8 @@ async def test_app_startup() -> None:
     """Test that the app starts up and displays core components."""
     from textual.widgets import ContentSwitcher, Footer, Header
 
+    from network_triage.app import InfoBox
+
     app = NetworkTriageApp()
     async with app.run_test() as pilot:
         # Give background tasks time to complete
@@ -50,6 +56,14 @@ async def test_app_startup() -> None:
         # Verify mocked data is displayed
         hostname_box: Any = app.query_one("#info_hostname")
         assert hostname_box.value_text == "Test-Host"
+        assert app.query_one("#info_os", InfoBox).value_text == "Test OS"
+        assert app.query_one("#info_public_ip", InfoBox).value_text == "1.1.1.1"
+        assert app.query_one("#info_health", InfoBox).value_text == "healthy"
+
+        # Connection details fill their boxes; missing fields fall back to N/A
+        assert app.query_one("#iface_name", InfoBox).value_text == "lo0"
+        assert app.query_one("#iface_status", InfoBox).value_text == "Up"
+        assert app.query_one("#iface_mtu", InfoBox).value_text == "N/A"
 
 
 @pytest.mark.asyncio
@@ -97,3 +111,132 @@ async def test_info_box_click_clipboard(mocker: MockerFixture) -> None:
 
         mock_copy.assert_called_with("192.168.1.1")
         mock_notify.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_speed_test_results_fill_boxes() -> None:
+    """Speed test results land in their boxes and re-enable the button."""
+    from textual.widgets import Button
+
+    from network_triage.app import InfoBox, SpeedTestTool
+
+    mock_toolkit.run_speed_test.return_value = {"Download": "100 Mbps", "Upload": "20 Mbps", "Ping": "12 ms"}
+    app = NetworkTriageApp()
+    async with app.run_test() as pilot:
+        tool = app.query_one(SpeedTestTool)
+        tool.start_test()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app.query_one("#spd_download", InfoBox).value_text == "100 Mbps"
+        assert app.query_one("#spd_ping", InfoBox).value_text == "12 ms"
+        assert app.query_one("#spd_isp", InfoBox).value_text == "N/A"
+        assert app.query_one("#btn_speed", Button).disabled is False
+
+
+@pytest.mark.asyncio
+async def test_speed_test_stop_ends_transfer(mocker: MockerFixture) -> None:
+    """Stop signals the toolkit, and Run is re-enabled once the blocked transfer returns."""
+    from textual.widgets import Button, Label
+
+    from network_triage.app import InfoBox, SpeedTestTool
+
+    started = threading.Event()
+    stopped = threading.Event()
+    finished = threading.Event()
+
+    def transfer() -> dict[str, str]:
+        started.set()
+        # Stands in for speedtest's transfer threads, which poll the stop event
+        try:
+            if not stopped.wait(timeout=5):
+                return {"Download": "100 Mbps"}
+            return {"Error": "Speed test cancelled"}
+        finally:
+            finished.set()
+
+    mocker.patch.object(mock_toolkit, "run_speed_test", side_effect=transfer)
+    mocker.patch.object(mock_toolkit, "stop_speed_test", side_effect=stopped.set)
+    app = NetworkTriageApp()
+    async with app.run_test() as pilot:
+        tool = app.query_one(SpeedTestTool)
+        tool.start_test()
+        await asyncio.to_thread(started.wait, 5)
+        assert app.query_one("#btn_speed_stop", Button).disabled is False
+
+        tool.action_stop_test()
+        # Run waits for the stopped transfer to end before it can start again
+        assert app.query_one("#btn_speed", Button).disabled is True
+        assert await asyncio.to_thread(finished.wait, 1)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert stopped.is_set()
+        assert app.query_one("#spd_download", InfoBox).value_text == "N/A"
+        assert app.query_one("#btn_speed", Button).disabled is False
+        assert app.query_one("#btn_speed_stop", Button).disabled is True
+        assert str(app.query_one("#speed_status", Label).render()) == "Stopped."
+
+
+@pytest.mark.asyncio
+async def test_ping_uses_resolved_address() -> None:
+    """Ping is started against the pre-resolved address, shown in the log header."""
+    from textual.widgets import Log
+
+    from network_triage.app import PingTool
+    from tui.widgets.components import HistoryInput
+
+    mock_toolkit.resolve_host_async = AsyncMock(return_value="93.184.216.34")
+    mock_toolkit.continuous_ping_async = AsyncMock()
+    app = NetworkTriageApp()
+    async with app.run_test() as pilot:
+        tool = app.query_one(PingTool)
+        app.query_one("#ping_input", HistoryInput).value = "example.com"
+        tool.action_start_ping()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        mock_toolkit.resolve_host_async.assert_awaited_once_with("example.com")
+        assert mock_toolkit.continuous_ping_async.await_args.args[0] == "93.184.216.34"
+        assert "--- Pinging example.com (93.184.216.34) ---" in "\n".join(app.query_one("#ping_log", Log).lines)
+
+
+@pytest.mark.asyncio
+async def test_info_box_renders_value_literally() -> None:
+    """InfoBox draws title and value itself, without parsing the value as markup."""
+    from network_triage.app import InfoBox
+
+    app = NetworkTriageApp()
+    async with app.run_test():
+        box = app.query_one("#info_gateway", InfoBox)
+        box.value_text = "[Errno 101] Network is unreachable"
+
+        assert not box.children
+        assert box.render().plain == "Gateway\n[Errno 101] Network is unreachable"
+
+
+def test_net_tool_built_once_under_concurrent_first_use(mocker: MockerFixture) -> None:
+    """Workers racing on the first call all get the same toolkit, built once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    barrier = threading.Barrier(4)
+
+    def slow_toolkit() -> object:
+        time.sleep(0.05)
+        return object()
+
+    build = mocker.patch.object(network_triage.app, "NetworkTriageToolkit", side_effect=slow_toolkit)
+    network_triage.app._build_net_tool.cache_clear()
+
+    def first_use() -> object:
+        barrier.wait()
+        return _real_net_tool()
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            toolkits = list(pool.map(lambda _: first_use(), range(4)))
+    finally:
+        network_triage.app._build_net_tool.cache_clear()
+
+    build.assert_called_once()
+    assert all(toolkit is toolkits[0] for toolkit in toolkits)
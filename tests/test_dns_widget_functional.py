@@ -1,5 +1,9 @@
 """Functional tests for DNSResolverWidget using Textual's test framework."""
 
+import subprocess
+import sys
+import threading
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -32,7 +36,7 @@ async def test_dns_resolution_success():
         records=[DNSRecord("A", "93.184.216.34", 10.5, DNSStatus.SUCCESS)],
     )
 
-    with patch("tui.widgets.dns_resolver_widget.resolve_dns_hostname", return_value=mock_result):
+    with patch("shared.dns_utils.resolve_hostname", return_value=mock_result):
         async with app.run_test() as pilot:
             widget = app.query_one(DNSResolverWidget)
 
@@ -42,6 +46,8 @@ async def test_dns_resolution_success():
 
             # Click Resolve
             await pilot.click("#resolve-btn")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
 
             # Verify results widget has rows
             assert widget.results_widget.row_count == 1
@@ -102,11 +108,129 @@ async def test_dns_resolution_not_found():
         status=DNSStatus.NOT_FOUND,
     )
 
-    with patch("tui.widgets.dns_resolver_widget.resolve_dns_hostname", return_value=mock_result):
+    with patch("shared.dns_utils.resolve_hostname", return_value=mock_result):
         async with app.run_test() as pilot:
             widget = app.query_one(DNSResolverWidget)
             widget.query_one("#hostname-input").value = "nonexistent.local"
 
             await pilot.click("#resolve-btn")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
 
             assert widget.results_widget.row_count == 0
+
+
+@pytest.mark.asyncio
+async def test_dns_resolution_all_matches_record_timings():
+    """Test ALL queries pair each address and the PTR name with their own record timing."""
+    app = DNSMockApp()
+
+    mock_result = DNSLookupResult(
+        hostname="example.com",
+        ipv4_addresses=["93.184.216.34", "93.184.216.35"],
+        ipv6_addresses=["2606:2800:220:1::1"],
+        reverse_dns="edge.example.com",
+        lookup_time_ms=12.0,
+        status=DNSStatus.SUCCESS,
+        records=[
+            DNSRecord("A", "93.184.216.35", 2.0, DNSStatus.SUCCESS),
+            DNSRecord("AAAA", "2606:2800:220:1::1", 3.0, DNSStatus.SUCCESS),
+            DNSRecord("A", "93.184.216.34", 1.0, DNSStatus.SUCCESS),
+            DNSRecord("A", "93.184.216.34", 9.0, DNSStatus.SUCCESS),
+            DNSRecord("PTR", "edge.example.com", 4.0, DNSStatus.SUCCESS),
+        ],
+    )
+
+    with patch("shared.dns_utils.resolve_hostname", return_value=mock_result):
+        async with app.run_test() as pilot:
+            widget = app.query_one(DNSResolverWidget)
+            widget.query_one("#hostname-input").value = "example.com"
+            widget.query_one("#query-type-select").value = "ALL"
+
+            await pilot.click("#resolve-btn")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            table = widget.results_widget
+            assert table.row_count == 4
+            assert [table.get_cell(str(i), "time") for i in range(1, 5)] == ["1.00", "2.00", "3.00", "4.00"]
+            assert table.get_cell("4", "value") == "edge.example.com"
+
+
+@pytest.mark.asyncio
+async def test_dns_clear_drops_lookup_in_flight():
+    """Test a lookup that finishes after Clear does not repopulate the table."""
+    app = DNSMockApp()
+    release = threading.Event()
+
+    def slow_resolve(*_args: object, **_kwargs: object) -> DNSLookupResult:
+        release.wait(5)
+        return DNSLookupResult(
+            hostname="example.com",
+            ipv4_addresses=["93.184.216.34"],
+            ipv6_addresses=[],
+            reverse_dns=None,
+            lookup_time_ms=10.5,
+            status=DNSStatus.SUCCESS,
+            records=[DNSRecord("A", "93.184.216.34", 10.5, DNSStatus.SUCCESS)],
+        )
+
+    with patch("shared.dns_utils.resolve_hostname", side_effect=slow_resolve):
+        async with app.run_test() as pilot:
+            widget = app.query_one(DNSResolverWidget)
+            widget.query_one("#hostname-input").value = "example.com"
+
+            await pilot.click("#resolve-btn")
+            assert widget.is_loading
+
+            widget.clear_results()
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert widget.results_widget.row_count == 0
+
+
+@pytest.mark.asyncio
+async def test_dns_repeat_lookup_updates_rows_in_place():
+    """Test a repeated lookup diffs into the existing rows instead of clearing the table."""
+    app = DNSMockApp()
+
+    def lookup(time_ms: float) -> DNSLookupResult:
+        return DNSLookupResult(
+            hostname="example.com",
+            ipv4_addresses=["93.184.216.34"],
+            ipv6_addresses=[],
+            reverse_dns=None,
+            lookup_time_ms=time_ms,
+            status=DNSStatus.SUCCESS,
+            records=[DNSRecord("A", "93.184.216.34", time_ms, DNSStatus.SUCCESS)],
+        )
+
+    with patch("shared.dns_utils.resolve_hostname", side_effect=[lookup(1.0), lookup(2.0)]):
+        async with app.run_test() as pilot:
+            widget = app.query_one(DNSResolverWidget)
+            widget.query_one("#hostname-input").value = "example.com"
+
+            widget.resolve_hostname()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            with patch.object(widget.results_widget, "clear", wraps=widget.results_widget.clear) as clear:
+                widget.resolve_hostname()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+            clear.assert_not_called()
+            assert widget.results_widget.row_count == 1
+            assert widget.results_widget.get_cell("1", "time") == "2.00"
+
+
+def test_dns_utils_imported_on_first_lookup_only():
+    """Test importing the widget module does not load the DNS utilities up front."""
+    code = "import sys, tui.widgets.dns_resolver_widget; print('shared.dns_utils' in sys.modules)"
+    src = Path(__file__).parent.parent / "src"
+
+    proc = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip() == "False"
@@ -15,16 +15,68 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from network_triage.linux import network_toolkit
 from network_triage.linux.network_toolkit import NetworkTriageToolkit
 
+# Canned `traceroute -m 30 8.8.8.8` output: a named hop, a silent hop, and the target
+TRACEROUTE_OUTPUT = """traceroute to 8.8.8.8 (8.8.8.8), 30 hops max, 60 byte packets
+ 1  router.lan (192.168.1.1)  0.512 ms  0.470 ms  0.455 ms
+ 2  * * *
+ 3  dns.google (8.8.8.8)  12.101 ms  11.987 ms  12.240 ms
+"""
+
 
 @pytest.mark.skipif(sys.platform != "linux", reason="Linux toolkit tests only")
 class TestLinuxNetworkTriageToolkit:
     """Test Linux network toolkit functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.toolkit = NetworkTriageToolkit()
+    @classmethod
+    def setup_class(cls) -> None:
+        """Set up one toolkit shared by every test in the class.
+
+        The tests only read from it; sharing it also lets a successful public IP
+        lookup be reused by the later get_ip_info tests.
+        """
+        cls.toolkit = NetworkTriageToolkit()
+
+    @pytest.fixture(autouse=True)
+    def _canned_traceroute(self, monkeypatch):
+        """Answer traceroute from TRACEROUTE_OUTPUT; other commands still run for real.
+
+        A real traceroute takes up to 30 seconds per call; see
+        test_traceroute_real_network for the opt-in end-to-end run.
+        """
+        real_run = network_toolkit.safe_subprocess_run
+
+        def fake_run(command, *args, **kwargs: object):
+            if command[0] == "traceroute":
+                return TRACEROUTE_OUTPUT
+            return real_run(command, *args, **kwargs)
+
+        monkeypatch.setattr(network_toolkit, "safe_subprocess_run", fake_run)
+
+    # Each query runs several commands and the tests only inspect the result, so
+    # it is computed once per class rather than once per test.
+
+    @pytest.fixture(scope="class")
+    def system_info(self):
+        """Result of get_system_info(), shared by the class's tests."""
+        return self.toolkit.get_system_info()
+
+    @pytest.fixture(scope="class")
+    def ip_info(self):
+        """Result of get_ip_info(), shared by the class's tests."""
+        return self.toolkit.get_ip_info()
+
+    @pytest.fixture(scope="class")
+    def connection_details(self):
+        """Result of get_connection_details(), shared by the class's tests."""
+        return self.toolkit.get_connection_details()
+
+    @pytest.fixture(scope="class")
+    def adapters(self):
+        """Result of network_adapter_info(), shared by the class's tests."""
+        return self.toolkit.network_adapter_info()
 
     def test_toolkit_initialization(self):
         """Test toolkit initializes without errors."""
@@ -40,50 +92,43 @@ class TestLinuxNetworkTriageToolkit:
     # get_system_info() Tests
     # ============================================================
 
-    def test_get_system_info_returns_dict(self):
+    def test_get_system_info_returns_dict(self, system_info):
         """Test get_system_info returns a dictionary."""
-        result = self.toolkit.get_system_info()
-        assert isinstance(result, dict)
+        assert isinstance(system_info, dict)
 
-    def test_get_system_info_has_required_keys(self):
+    def test_get_system_info_has_required_keys(self, system_info):
         """Test get_system_info has all required keys."""
-        result = self.toolkit.get_system_info()
         required_keys = ["OS", "Hostname", "Kernel", "Arch"]
         for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
+            assert key in system_info, f"Missing required key: {key}"
 
-    def test_get_system_info_values_not_empty(self):
+    def test_get_system_info_values_not_empty(self, system_info):
         """Test get_system_info returns non-empty values."""
-        result = self.toolkit.get_system_info()
-        for key, value in result.items():
+        for key, value in system_info.items():
             assert value != "", f"Key {key} has empty value"
 
-    def test_get_system_info_contains_linux(self):
+    def test_get_system_info_contains_linux(self, system_info):
         """Test get_system_info OS contains 'Linux'."""
-        result = self.toolkit.get_system_info()
         # Should contain 'Linux' or graceful fallback
-        assert isinstance(result["OS"], str)
+        assert isinstance(system_info["OS"], str)
 
     # ============================================================
     # get_ip_info() Tests
     # ============================================================
 
-    def test_get_ip_info_returns_dict(self):
+    def test_get_ip_info_returns_dict(self, ip_info):
         """Test get_ip_info returns a dictionary."""
-        result = self.toolkit.get_ip_info()
-        assert isinstance(result, dict)
+        assert isinstance(ip_info, dict)
 
-    def test_get_ip_info_has_required_keys(self):
+    def test_get_ip_info_has_required_keys(self, ip_info):
         """Test get_ip_info has all required keys."""
-        result = self.toolkit.get_ip_info()
         required_keys = ["Internal IP", "Public IP", "Gateway"]
         for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
+            assert key in ip_info, f"Missing required key: {key}"
 
-    def test_get_ip_info_internal_ip_format(self):
+    def test_get_ip_info_internal_ip_format(self, ip_info):
         """Test get_ip_info internal IP is valid format."""
-        result = self.toolkit.get_ip_info()
-        internal_ip = result["Internal IP"]
+        internal_ip = ip_info["Internal IP"]
         # Should be IP or 'Unknown'
         if internal_ip != "Unknown":
             parts = internal_ip.split(".")
@@ -91,10 +136,9 @@ class TestLinuxNetworkTriageToolkit:
             for part in parts:
                 assert part.isdigit(), f"Non-numeric IP part: {part}"
 
-    def test_get_ip_info_gateway_format(self):
+    def test_get_ip_info_gateway_format(self, ip_info):
         """Test get_ip_info gateway is valid format."""
-        result = self.toolkit.get_ip_info()
-        gateway = result["Gateway"]
+        gateway = ip_info["Gateway"]
         # Should be IP or 'Unknown'
         if gateway != "Unknown":
             parts = gateway.split(".")
@@ -104,37 +148,32 @@ class TestLinuxNetworkTriageToolkit:
     # get_connection_details() Tests
     # ============================================================
 
-    def test_get_connection_details_returns_dict(self):
+    def test_get_connection_details_returns_dict(self, connection_details):
         """Test get_connection_details returns a dictionary."""
-        result = self.toolkit.get_connection_details()
-        assert isinstance(result, dict)
+        assert isinstance(connection_details, dict)
 
-    def test_get_connection_details_has_required_keys(self):
+    def test_get_connection_details_has_required_keys(self, connection_details):
         """Test get_connection_details has all required keys."""
-        result = self.toolkit.get_connection_details()
         required_keys = ["Interface", "IP Address", "MAC Address", "Netmask", "Speed", "MTU", "Gateway"]
         for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
+            assert key in connection_details, f"Missing required key: {key}"
 
-    def test_get_connection_details_interface_not_empty(self):
+    def test_get_connection_details_interface_not_empty(self, connection_details):
         """Test get_connection_details interface name is not empty."""
-        result = self.toolkit.get_connection_details()
-        assert result["Interface"] != "Unknown"
-        assert result["Interface"] != ""
+        assert connection_details["Interface"] != "Unknown"
+        assert connection_details["Interface"] != ""
 
-    def test_get_connection_details_mac_format(self):
+    def test_get_connection_details_mac_format(self, connection_details):
         """Test get_connection_details MAC address format."""
-        result = self.toolkit.get_connection_details()
-        mac = result["MAC Address"]
+        mac = connection_details["MAC Address"]
         # MAC should be in format XX:XX:XX:XX:XX:XX or Unknown
         if mac != "Unknown":
             parts = mac.split(":")
             assert len(parts) == 6, f"Invalid MAC format: {mac}"
 
-    def test_get_connection_details_mtu_is_numeric(self):
+    def test_get_connection_details_mtu_is_numeric(self, connection_details):
         """Test get_connection_details MTU is numeric."""
-        result = self.toolkit.get_connection_details()
-        mtu = result["MTU"]
+        mtu = connection_details["MTU"]
         if mtu != "Unknown":
             assert mtu.isdigit(), f"MTU not numeric: {mtu}"
 
@@ -142,52 +181,45 @@ class TestLinuxNetworkTriageToolkit:
     # network_adapter_info() Tests
     # ============================================================
 
-    def test_network_adapter_info_returns_dict(self):
+    def test_network_adapter_info_returns_dict(self, adapters):
         """Test network_adapter_info returns a dictionary."""
-        result = self.toolkit.network_adapter_info()
-        assert isinstance(result, dict)
+        assert isinstance(adapters, dict)
 
-    def test_network_adapter_info_not_empty(self):
+    def test_network_adapter_info_not_empty(self, adapters):
         """Test network_adapter_info returns adapters."""
-        result = self.toolkit.network_adapter_info()
-        assert len(result) > 0, "No adapters found"
+        assert len(adapters) > 0, "No adapters found"
 
-    def test_network_adapter_info_has_loopback(self):
+    def test_network_adapter_info_has_loopback(self, adapters):
         """Test network_adapter_info includes loopback interface."""
-        result = self.toolkit.network_adapter_info()
-        assert "lo" in result, "Loopback interface not found"
+        assert "lo" in adapters, "Loopback interface not found"
 
-    def test_network_adapter_info_adapter_structure(self):
+    def test_network_adapter_info_adapter_structure(self, adapters):
         """Test each adapter has required fields."""
-        result = self.toolkit.network_adapter_info()
         required_fields = ["Status", "Type", "MAC", "MTU"]
-        for adapter_name, adapter_info in result.items():
+        for adapter_name, adapter_info in adapters.items():
             if not adapter_name.startswith("error"):
                 for field in required_fields:
                     assert field in adapter_info, f"Adapter {adapter_name} missing field {field}"
 
-    def test_network_adapter_info_status_valid(self):
+    def test_network_adapter_info_status_valid(self, adapters):
         """Test adapter status is valid."""
-        result = self.toolkit.network_adapter_info()
         valid_statuses = ["up", "down"]
-        for adapter_name, adapter_info in result.items():
+        for adapter_name, adapter_info in adapters.items():
             if not adapter_name.startswith("error"):
                 assert adapter_info["Status"] in valid_statuses, f"Invalid status for {adapter_name}: {adapter_info['Status']}"
 
-    def test_network_adapter_info_type_valid(self):
+    def test_network_adapter_info_type_valid(self, adapters):
         """Test adapter type is valid."""
-        result = self.toolkit.network_adapter_info()
         valid_types = ["loopback", "ethernet", "wireless", "unknown"]
-        for adapter_name, adapter_info in result.items():
+        for adapter_name, adapter_info in adapters.items():
             if not adapter_name.startswith("error"):
                 assert adapter_info["Type"] in valid_types, f"Invalid type for {adapter_name}: {adapter_info['Type']}"
 
-    def test_network_adapter_info_loopback_has_ip(self):
+    def test_network_adapter_info_loopback_has_ip(self, adapters):
         """Test loopback adapter has IP address."""
-        result = self.toolkit.network_adapter_info()
-        if "lo" in result:
-            assert "IP" in result["lo"], "Loopback missing IP"
-            assert result["lo"]["IP"] == "127.0.0.1", "Loopback IP incorrect"
+        if "lo" in adapters:
+            assert "IP" in adapters["lo"], "Loopback missing IP"
+            assert adapters["lo"]["IP"] == "127.0.0.1", "Loopback IP incorrect"
 
     # ============================================================
     # traceroute_test() Tests
@@ -230,11 +262,14 @@ class TestLinuxNetworkTriageToolkit:
     def test_traceroute_test_hops_structure(self):
         """Test each hop has required fields."""
         result = self.toolkit.traceroute_test("8.8.8.8")
-        # Only test if hops exist
-        if result["Hops"]:
-            for hop in result["Hops"]:
-                assert "Hop" in hop, "Hop missing 'Hop' field"
-                assert isinstance(hop["Hop"], int), "Hop number not int"
+        assert [hop["Hop"] for hop in result["Hops"]] == [1, 2, 3]
+        for hop in result["Hops"]:
+            assert "Hop" in hop, "Hop missing 'Hop' field"
+            assert isinstance(hop["Hop"], int), "Hop number not int"
+        assert result["Hops"][0]["Hostname"] == "router.lan"
+        assert result["Hops"][0]["IP"] == "192.168.1.1"
+        assert result["Hops"][1]["Status"] == "No response"
+        assert result["Hops"][2]["Latencies"] == [12.101, 11.987, 12.24]
 
     def test_traceroute_test_custom_destination(self):
         """Test traceroute_test with custom destination."""
@@ -276,5 +311,17 @@ class TestLinuxNetworkTriageToolkit:
         assert "Message" in result
 
 
+@pytest.mark.slow
+@pytest.mark.network
+@pytest.mark.skipif(sys.platform != "linux", reason="Linux toolkit tests only")
+def test_traceroute_real_network():
+    """Test a real traceroute run end to end (opt in with --run-slow --run-network)."""
+    result = NetworkTriageToolkit().traceroute_test("8.8.8.8")
+    assert result["Destination"] == "8.8.8.8"
+    assert isinstance(result["Hops"], list)
+    assert isinstance(result["Success"], bool)
+    assert result["Message"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
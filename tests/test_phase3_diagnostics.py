@@ -6,7 +6,9 @@ Uses modern pytest patterns, fixtures, and mocker.
 
 from __future__ import annotations
 
+import dataclasses
 import io
+import socket
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
@@ -185,17 +187,61 @@ class TestPortUtils:
     @pytest.mark.asyncio
     async def test_check_multiple_ports(self, mocker: MockerFixture) -> None:
         """Test concurrent port checking."""
-        mock_check_port = mocker.patch("shared.port_utils.check_port_open")
+        mocker.patch("shared.port_utils._resolve_ipv4", return_value="127.0.0.1")
+        mock_probe = mocker.patch("shared.port_utils._probe_port")
         results = [
             MagicMock(port=22, status=PortStatus.OPEN, service_name="SSH"),
             MagicMock(port=80, status=PortStatus.CLOSED, service_name="HTTP"),
         ]
-        mock_check_port.side_effect = results
+        mock_probe.side_effect = results
 
         result = await check_multiple_ports("localhost", [22, 80])
 
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_check_multiple_ports_local_open_and_closed(self) -> None:
+        """Non-blocking probes report a live listener as open and a freed port as closed."""
+        with socket.socket() as listener, socket.socket() as spare:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            spare.bind(("127.0.0.1", 0))
+            open_port = listener.getsockname()[1]
+            closed_port = spare.getsockname()[1]
+            spare.close()
+
+            result = await check_multiple_ports("127.0.0.1", [closed_port, open_port], timeout_secs=2)
+
+        statuses = {r.port: r.status for r in result}
+        assert statuses == {open_port: PortStatus.OPEN, closed_port: PortStatus.CLOSED}
+
+    @pytest.mark.asyncio
+    async def test_check_multiple_ports_resets_open_connections(self) -> None:
+        """Probes abort connections to open ports rather than leaving them in TIME_WAIT."""
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+
+            result = await check_multiple_ports("127.0.0.1", [port], timeout_secs=2)
+            assert result[0].status == PortStatus.OPEN
+
+            conn, _ = listener.accept()
+            with conn, pytest.raises(ConnectionResetError):
+                conn.recv(1)
+
+    @pytest.mark.asyncio
+    async def test_check_multiple_ports_resolution_failure(self, mocker: MockerFixture) -> None:
+        """A host that fails to resolve yields an error per port without probing."""
+        mocker.patch("shared.port_utils._resolve_ipv4", side_effect=socket.gaierror("no such host"))
+        mock_probe = mocker.patch("shared.port_utils._probe_port")
+
+        result = await check_multiple_ports("nonexistent.invalid", [22, 80])
+
+        assert [r.status for r in result] == [PortStatus.ERROR, PortStatus.ERROR]
+        assert all(r.error_message and "DNS resolution failed" in r.error_message for r in result)
+        mock_probe.assert_not_called()
+
     @pytest.mark.parametrize(
         ("port", "expected_name"),
         [
@@ -228,13 +274,26 @@ class TestPortUtils:
                 service_name="TELNET",
                 response_time_ms=2.1,
             ),
+            PortCheckResult(
+                host="localhost",
+                port=81,
+                status=PortStatus.FILTERED,
+                service_name=None,
+                response_time_ms=0,
+            ),
         ]
         summary = summarize_port_scan(results)
 
-        assert summary["total_scanned"] == 2
+        assert summary["total_scanned"] == 3
         assert summary["open_count"] == 1
         assert summary["closed_count"] == 1
-        assert summary["avg_response_time_ms"] > 0
+        assert summary["filtered_count"] == 1
+        assert summary["timeout_count"] == 0
+        assert summary["error_count"] == 0
+        assert summary["open_ports"] == [(22, "SSH")]
+        # Zero response times (no reply) don't drag the average down
+        assert summary["avg_response_time_ms"] == pytest.approx(8.8)
+        assert summary["min_response_time_ms"] == pytest.approx(2.1)
 
 
 class TestLatencyUtils:
@@ -391,3 +450,23 @@ class TestPhase3Integration:
         assert stats_dict["status"] == "success"
         assert stats_dict["packet_loss_percent"] == 0
         assert len(stats_dict["rtt_values"]) <= 5
+
+    def test_to_dict_covers_every_field_in_order(self) -> None:
+        """Test the hand-built to_dict() mappings stay in step with the dataclass fields."""
+        from shared.dns_utils import DNSRecord
+        from shared.latency_utils import TracerouteHop
+        from shared.port_utils import PortCheckResult
+
+        record = DNSRecord("A", "1.2.3.4", 1.0, DNSStatus.SUCCESS)
+        samples: list[Any] = [
+            DNSLookupResult("h", ["1.2.3.4"], ["::1"], "r", 1.0, DNSStatus.SUCCESS, "e", [record]),
+            PingStatistics("h", 1, 1, 0.0, 1.0, 1.0, 1.0, 0.0, LatencyStatus.SUCCESS, [1.0], "e"),
+            TracerouteHop(1, "h", "1.2.3.4", 1.0, 2.0, 3.0, "responsive"),
+            PortCheckResult("h", 22, PortStatus.OPEN, "SSH", 1.0, "e", "b"),
+        ]
+
+        for sample in samples:
+            assert list(sample.to_dict()) == [f.name for f in dataclasses.fields(sample)]
+        assert samples[0].to_dict()["records"] == [
+            {"record_type": "A", "value": "1.2.3.4", "query_time_ms": 1.0, "status": "success"}
+        ]
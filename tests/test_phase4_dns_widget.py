@@ -150,7 +150,7 @@ class TestDNSResolution:
         widget = DNSResolverWidget()
 
         # Mock the resolve_dns_hostname function
-        with patch("tui.widgets.dns_resolver_widget.resolve_dns_hostname") as mock_resolve:
+        with patch("shared.dns_utils.resolve_hostname") as mock_resolve:
             # Create mock result
             mock_result = MagicMock()
             mock_result.status = DNSStatus.SUCCESS
@@ -166,14 +166,13 @@ class TestDNSResolution:
             assert callable(widget.resolve_hostname)
 
     def test_resolve_hostname_imports_dns_utility(self):
-        """Test that resolve_hostname uses Phase 3 DNS utility."""
+        """Test that the Phase 3 DNS utility is imported on first lookup, not at module level."""
         DNSResolverWidget()
-        # Import statement is at module level
         from tui.widgets import dns_resolver_widget
 
-        # Check that the module imports the DNS utility
-        assert hasattr(dns_resolver_widget, "resolve_dns_hostname")
-        assert hasattr(dns_resolver_widget, "DNSStatus")
+        # The lookup worker imports shared.dns_utils itself when it first runs
+        assert not hasattr(dns_resolver_widget, "resolve_dns_hostname")
+        assert not hasattr(dns_resolver_widget, "DNSStatus")
 
     def test_widget_has_results_widget(self):
         """Test widget has results display widget."""
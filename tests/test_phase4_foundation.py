@@ -9,12 +9,15 @@ Tests for:
 - Result caching
 """
 
+import dataclasses
 import sys
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Label, ProgressBar
 
 # Add src to path for imports (same as conftest but explicit)
 src_path = Path(__file__).parent.parent / "src"
@@ -30,6 +33,7 @@ from tui.widgets.base import (
 )
 from tui.widgets.components import (
     ErrorDisplay,
+    ProgressWidget,
     ResultColumn,
     ResultsWidget,
     StatusIndicator,
@@ -113,6 +117,19 @@ class TestAsyncOperationMixin:
         assert mixin.get_cached("key1") is None
         assert mixin.get_cached("key2") == "value2"
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache is bounded and evicts the least recently used entry."""
+        mixin = AsyncOperationMixin()
+        mixin.CACHE_MAX_ENTRIES = 2
+        mixin.cache_result("key1", "value1")
+        mixin.cache_result("key2", "value2")
+        mixin.get_cached("key1")
+        mixin.cache_result("key3", "value3")
+
+        assert mixin.get_cached("key2") is None
+        assert mixin.get_cached("key1") == "value1"
+        assert mixin.get_cached("key3") == "value3"
+
     def test_clear_cache_all(self):
         """Test clearing all cache."""
         mixin = AsyncOperationMixin()
@@ -153,6 +170,13 @@ class TestAsyncOperationMixin:
         assert len(mixin._active_workers) == 0
 
 
+class BaseWidgetApp(App[None]):
+    """Minimal app hosting a BaseWidget."""
+
+    def compose(self) -> ComposeResult:
+        yield BaseWidget()
+
+
 class TestBaseWidget:
     """Tests for BaseWidget base class."""
 
@@ -223,6 +247,24 @@ class TestBaseWidget:
         assert "BaseWidget" in summary
         assert "Ready" in summary
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("level", "status", "expected"),
+        [("error", "Error: timeout", "Error: timeout"), ("success", "", "Ready")],
+    )
+    async def test_batch_status_reports_in_one_batch(self, mocker, level, status, expected):
+        """Test batch_status shows the outcome and sets status inside one batch update."""
+        app = BaseWidgetApp()
+        async with app.run_test():
+            widget = app.query_one(BaseWidget)
+            batch_update = mocker.spy(app, "batch_update")
+
+            widget.batch_status(level, "DNS resolution timeout", status)
+
+            batch_update.assert_called_once_with()
+            assert widget.current_status == expected
+            assert widget.error_message == ("DNS resolution timeout" if level == "error" else "")
+
     def test_inherits_async_operation_mixin(self):
         """Test that BaseWidget inherits AsyncOperationMixin methods."""
         widget = BaseWidget()
@@ -258,6 +300,17 @@ class TestWidgetTemplate:
         assert callable(template.async_operation)
 
 
+class ResultsApp(App[None]):
+    """Minimal app hosting a ResultsWidget."""
+
+    def __init__(self, columns: list[ResultColumn]) -> None:
+        super().__init__()
+        self.columns = columns
+
+    def compose(self) -> ComposeResult:
+        yield ResultsWidget(columns=self.columns)
+
+
 class TestResultsWidget:
     """Tests for ResultsWidget component."""
 
@@ -285,6 +338,14 @@ class TestResultsWidget:
         assert col.key == "status"
         assert col.width is None  # Default is None
 
+    def test_result_column_is_immutable(self):
+        """Test ResultColumn is frozen and hashable."""
+        col = ResultColumn("Port", "port")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            col.key = "service"
+        assert hash(col) == hash(ResultColumn("Port", "port"))
+
     def test_results_widget_mock_data(self):
         """Test results widget method signatures work with mocks."""
         # Test the interface without instantiating in no-app context
@@ -302,6 +363,251 @@ class TestResultsWidget:
         summary = mock_widget.get_summary()
         assert "Results" in summary
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("keys", [("port",), ("port", "service", "status")])
+    async def test_rows_fill_missing_columns_in_order(self, keys):
+        """Test single and bulk row adds map data onto columns, defaulting to empty."""
+        app = ResultsApp([ResultColumn(key.title(), key) for key in keys])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+
+            widget.add_result_row(port=22, extra="ignored")
+            widget.add_result_rows([{"status": "open", "port": 80}, {}])
+
+            assert widget.result_count == 3
+            assert widget.get_row("1") == ["22", *[""] * (len(keys) - 1)]
+            assert widget.get_row("2") == ["80", "", "open"][: len(keys)]
+            assert widget.get_row("3") == [""] * len(keys)
+
+    @pytest.mark.asyncio
+    async def test_columns_are_copied_from_caller_list(self):
+        """Test later edits to the caller's column list do not change the table schema."""
+        columns = [ResultColumn("Port", "port")]
+        app = ResultsApp(columns)
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            columns.append(ResultColumn("Status", "status"))
+
+            widget.add_result_row(port="22", status="open")
+
+            assert widget.columns_def == (ResultColumn("Port", "port"),)
+            assert widget.get_row("1") == ["22"]
+
+    @pytest.mark.asyncio
+    async def test_get_results_returns_rows_keyed_by_column(self):
+        """Test get_results maps every row back onto the column keys."""
+        app = ResultsApp([ResultColumn("Port", "port"), ResultColumn("Status", "status")])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            widget.add_result_rows([{"port": 22, "status": "open"}, {"port": 23}])
+
+            assert widget.get_results() == [
+                {"port": "22", "status": "open"},
+                {"port": "23", "status": ""},
+            ]
+
+    @pytest.mark.asyncio
+    async def test_filter_and_sort_views(self):
+        """Test filter_by and sort_by repopulate the table from the column store."""
+        app = ResultsApp([ResultColumn("Port", "port"), ResultColumn("Status", "status")])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            widget.add_result_rows(
+                [
+                    {"port": "443", "status": "open"},
+                    {"port": "23", "status": "closed"},
+                    {"port": "22", "status": "open"},
+                ]
+            )
+
+            widget.filter_by("status", "open")
+            assert widget.row_count == 2
+            assert [row["port"] for row in widget.get_results()] == ["443", "22"]
+
+            widget.sort_by("port")
+            assert [row["port"] for row in widget.get_results()] == ["22", "443"]
+            assert widget.get_row("3") == ["22", "open"]
+
+            assert widget.add_result_row(port="80", status="open") == "4"
+            assert widget.add_result_row(port="8080", status="filtered") is None
+            assert widget.row_count == 3
+            assert widget.result_count == 5
+
+            widget.filter_by("status", "")
+            assert [row["port"] for row in widget.get_results()] == ["22", "23", "443", "80", "8080"]
+
+            widget.reset_view()
+            assert [row["port"] for row in widget.get_results()] == ["443", "23", "22", "80", "8080"]
+
+    @pytest.mark.asyncio
+    async def test_sync_rows_keeps_active_filter(self):
+        """Test sync_rows re-applies an active filter and empties cleanly."""
+        app = ResultsApp([ResultColumn("Port", "port"), ResultColumn("Status", "status")])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            widget.add_result_rows([{"port": "22", "status": "open"}])
+            widget.filter_by("status", "closed")
+            assert widget.row_count == 0
+
+            widget.sync_rows([{"port": "22", "status": "closed"}, {"port": "80", "status": "open"}])
+            assert widget.get_results() == [{"port": "22", "status": "closed"}]
+
+            widget.reset_view()
+            widget.sync_rows([])
+            assert widget.row_count == 0
+            assert widget.get_results() == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_rows_share_one_batch_update(self, mocker):
+        """Test add_result_rows inserts the whole list inside a single batch update."""
+        app = ResultsApp([ResultColumn("Port", "port")])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            batch_update = mocker.spy(app, "batch_update")
+
+            widget.add_result_rows([{"port": port} for port in range(50)])
+
+            batch_update.assert_called_once_with()
+            assert widget.row_count == 50
+
+    @pytest.mark.asyncio
+    async def test_bulk_rows_on_unmounted_widget(self, mocker):
+        """Test bulk inserts and views work on a widget that is not mounted in the app."""
+        app = ResultsApp([ResultColumn("Port", "port")])
+        async with app.run_test():
+            widget = ResultsWidget(columns=[ResultColumn("Port", "port")])
+            batch_update = mocker.spy(app, "batch_update")
+
+            widget.add_result_rows([{"port": "22"}, {"port": "80"}])
+            widget.filter_by("port", "8")
+
+            batch_update.assert_not_called()
+            assert widget.get_results() == [{"port": "80"}]
+
+    @pytest.mark.asyncio
+    async def test_sync_rows_updates_changed_cells_in_place(self, mocker):
+        """Test sync_rows rewrites changed cells, appends and trims rows without clearing."""
+        app = ResultsApp([ResultColumn("Port", "port"), ResultColumn("Status", "status")])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            widget.add_result_rows([{"port": 22, "status": "open"}, {"port": 23, "status": "closed"}])
+            clear = mocker.spy(widget, "clear")
+            update_cell = mocker.spy(widget, "update_cell")
+
+            widget.sync_rows([{"port": 22, "status": "open"}, {"port": 23, "status": "open"}, {"port": 80}])
+            assert update_cell.call_count == 1
+            assert [widget.get_row(key) for key in ("1", "2", "3")] == [["22", "open"], ["23", "open"], ["80", ""]]
+
+            update_cell.reset_mock()
+            widget.sync_rows([{"port": 22, "status": "open"}])
+            update_cell.assert_not_called()
+            clear.assert_not_called()
+            assert widget.row_count == 1
+            assert widget.result_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("is_str", "kept"), [(True, True), (False, False)])
+    async def test_string_columns_skip_cast(self, is_str, kept):
+        """Test all-str schemas store values as given while other schemas are stringified."""
+
+        class Port(str):
+            __slots__ = ()
+
+        app = ResultsApp([ResultColumn("Port", "port", is_str=is_str)])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+
+            widget.add_result_row(port=Port("22"))
+            widget.add_result_rows([{"port": Port("80")}])
+
+            assert [widget.get_row(key)[0] for key in ("1", "2")] == ["22", "80"]
+            assert all(isinstance(widget.get_row(key)[0], Port) is kept for key in ("1", "2"))
+
+    @pytest.mark.asyncio
+    async def test_string_columns_cast_stray_values(self):
+        """Test a non-str value in an all-str schema is still stored as text."""
+        app = ResultsApp([ResultColumn("Port", "port", is_str=True), ResultColumn("Service", "service", is_str=True)])
+        async with app.run_test():
+            widget = app.query_one(ResultsWidget)
+            widget.add_result_row(port=8080, service="http-alt")
+            widget.add_result_rows([{"port": "22", "service": "ssh"}, {"port": 80, "service": "http"}])
+
+            widget.filter_by("port", "80")
+            assert widget.get_results() == [
+                {"port": "8080", "service": "http-alt"},
+                {"port": "80", "service": "http"},
+            ]
+
+            widget.reset_view()
+            widget.sort_by("port")
+            assert [row["port"] for row in widget.get_results()] == ["22", "80", "8080"]
+
+
+class ProgressApp(App[None]):
+    """Minimal app hosting a ProgressWidget."""
+
+    def compose(self) -> ComposeResult:
+        yield ProgressWidget()
+
+
+class TestProgressWidget:
+    """Tests for ProgressWidget rendering."""
+
+    @pytest.mark.asyncio
+    async def test_progress_renders_whole_percent_steps(self):
+        """Test sub-percent ticks are coalesced and the final tick always renders."""
+        app = ProgressApp()
+        async with app.run_test():
+            widget = app.query_one(ProgressWidget)
+            bar = widget.query_one("#progress-bar", ProgressBar)
+            stats = widget.query_one("#progress-stats", Label)
+
+            widget.update(10, 1000, "Scanning ports...")
+            assert bar.progress == 1
+            assert str(stats.render()) == "10/1000 (1%)"
+
+            widget.update(15, 1000)
+            assert str(stats.render()) == "10/1000 (1%)"
+
+            widget.update(1000, 1000)
+            assert bar.progress == 100
+            assert str(stats.render()) == "1000/1000 (100%)"
+            assert str(widget.query_one("#progress-description", Label).render()) == "Scanning ports..."
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_throttled_then_flushed(self):
+        """Test updates inside the refresh interval are held and the latest one is shown."""
+        app = ProgressApp()
+        async with app.run_test() as pilot:
+            widget = app.query_one(ProgressWidget)
+            stats = widget.query_one("#progress-stats", Label)
+
+            widget.update(10, 100, "Scanning ports...")
+            for current in range(11, 40):
+                widget.update(current, 100)
+            assert str(stats.render()) == "10/100 (10%)"
+
+            await pilot.pause(0.15)
+            assert str(stats.render()) == "39/100 (39%)"
+            assert str(widget.query_one("#progress-description", Label).render()) == "Scanning ports..."
+
+    @pytest.mark.asyncio
+    async def test_total_change_redraws_stats(self):
+        """Test a new total is shown even when the percentage or count stays the same."""
+        app = ProgressApp()
+        async with app.run_test() as pilot:
+            widget = app.query_one(ProgressWidget)
+            stats = widget.query_one("#progress-stats", Label)
+
+            widget.update(5, 100)
+            await pilot.pause(0.1)
+            widget.update(10, 200)
+            assert str(stats.render()) == "10/200 (5%)"
+
+            await pilot.pause(0.1)
+            widget.update(10, 400)
+            assert str(stats.render()) == "10/400 (2%)"
+
 
 class TestStatusIndicator:
     """Tests for StatusIndicator component."""
@@ -330,6 +636,34 @@ class TestStatusIndicator:
             # Just verify it doesn't crash
             assert indicator.status == status
 
+    def test_status_indicator_renders_symbol(self):
+        """Test known statuses render their symbol and unknown ones fall back to a dot."""
+        indicator = StatusIndicator()
+
+        indicator.set_status("open", "Port 22")
+        assert str(indicator.render()) == "🟢 Port 22"
+
+        indicator.set_status("unknown")
+        assert str(indicator.render()) == "● Port 22"
+
+    def test_status_indicator_skips_unchanged_redraw(self, mocker):
+        """Test repeating the same status and text does not re-render the indicator."""
+        indicator = StatusIndicator(status="pending", text="Scanning")
+        update = mocker.spy(indicator, "update")
+
+        indicator.set_status("pending")
+        indicator.set_status("pending", "Scanning")
+        update.assert_not_called()
+
+        indicator.set_status("success", "Done")
+        update.assert_called_once_with("✅ Done")
+
+    def test_status_colors_are_shared_and_read_only(self):
+        """Test the status color table is a single read-only mapping on the class."""
+        assert ResultsWidget.status_colors["open"] == "green"
+        with pytest.raises(TypeError):
+            ResultsWidget.status_colors["open"] = "blue"
+
 
 class TestErrorDisplay:
     """Tests for ErrorDisplay component."""
@@ -353,6 +687,21 @@ class TestErrorDisplay:
         assert display.error_details == ""
         assert display.is_visible is False
 
+    def test_error_display_toggles_display_and_renders_once(self, mocker):
+        """Test showing and clearing toggle display without restyling or duplicate renders."""
+        display = ErrorDisplay()
+        assert display.display is False
+        update = mocker.spy(display, "update")
+
+        display.show_error("Connection failed", "Unable to reach server")
+        assert display.display is True
+        update.assert_called_once_with("❌ Connection failed\n  Details: Unable to reach server")
+
+        display.clear_error()
+        assert display.display is False
+        assert update.call_args.args == ("",)
+        assert display.styles.border.top[0] == "solid"
+
 
 class TestSummaryWidget:
     """Tests for SummaryWidget component."""
@@ -382,6 +731,28 @@ class TestSummaryWidget:
 
         assert len(summary.stats) == 0
 
+    def test_summary_widget_renders_lines_in_insertion_order(self):
+        """Test updating a stat rewrites only its line and keeps the original order."""
+        summary = SummaryWidget()
+        summary.add_stat("Total", "42")
+        summary.add_stat("Failed", "2", color="red")
+        summary.add_stat("Total", "43")
+
+        assert str(summary.render()) == "Total: 43\nFailed: 2"
+
+    def test_summary_widget_batch_update_renders_once(self, mocker):
+        """Test stats added inside batch_update are drawn in a single update on exit."""
+        summary = SummaryWidget()
+        update = mocker.spy(summary, "update")
+
+        with summary.batch_update():
+            for i in range(20):
+                summary.add_stat(f"Hop {i}", str(i))
+            update.assert_not_called()
+
+        update.assert_called_once()
+        assert str(summary.render()).splitlines()[-1] == "Hop 19: 19"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
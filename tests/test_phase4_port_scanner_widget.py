@@ -5,7 +5,7 @@ Uses modern pytest patterns and parametrization.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
@@ -81,6 +81,7 @@ class TestPortParsingLogic:
             ("80,443,80,22", [22, 80, 443]),  # Deduplication
             ("  22, 80  ", [22, 80]),
             ("80,,443", [80, 443]),  # Robustness to empty segments
+            (",".join(map(str, range(5000, 0, -1))), list(range(1, 5001))),  # Large pasted list
         ],
     )
     def test_parse_multiple_ports_valid(self, widget: PortScannerWidget, port_str: str, expected: list[int]) -> None:
@@ -148,30 +149,39 @@ class TestPortScannerBehavior:
 
     def test_clear_results(self, widget: PortScannerWidget, mocker: MockerFixture) -> None:
         """Test clearing inputs and results."""
-        # Mock UI components
-        mock_host = MagicMock()
-        mock_port = MagicMock()
-        mock_summary = MagicMock()
-        mock_status = MagicMock()
-        mock_error_display = MagicMock()
-
-        # Flexible mock for query_one that handles expect_type keyword
-        def mock_query(query: str, *args: Any, **kwargs: Any) -> Any:
-            return {
-                "#host-input": mock_host,
-                "#port-input": mock_port,
-                "#summary-label": mock_summary,
-                "#status-label": mock_status,
-                "#error-display": mock_error_display,
-            }.get(query)
-
-        mocker.patch.object(widget, "query_one", side_effect=mock_query)
+        # Stand in for the handles bound in compose
+        widget._host_input = MagicMock()
+        widget._port_input = MagicMock()
+        widget._summary_label = MagicMock()
+        widget._status_label = MagicMock()
         widget.results_widget = MagicMock()
+        mocker.patch.object(widget, "display_success")
 
         widget.clear_results()
 
-        assert mock_host.value == ""
-        assert mock_port.value == ""
+        assert widget._host_input.value == ""
+        assert widget._port_input.value == ""
         widget.results_widget.clear_results.assert_called_once()
-        mock_summary.update.assert_called_with("")
-        mock_status.update.assert_called_with("")
+        widget._summary_label.update.assert_called_with("")
+        widget._status_label.update.assert_called_with("")
+
+
+class TestScanConcurrency:
+    """Tests for sizing the scan semaphore."""
+
+    @pytest.mark.parametrize(
+        ("port_count", "soft_limit", "expected"),
+        [
+            (5, 1024, 5),  # Small scans don't over-allocate
+            (1024, 1024, 500),  # Capped by the hard maximum
+            (1024, 256, 128),  # Capped at half the descriptor limit
+            (0, 1024, 1),
+        ],
+    )
+    def test_scan_concurrency(self, mocker: MockerFixture, port_count: int, soft_limit: int, expected: int) -> None:
+        """Concurrency scales with port count within the descriptor budget."""
+        from tui.widgets import port_scanner_widget
+
+        mocker.patch.object(port_scanner_widget.resource, "getrlimit", return_value=(soft_limit, soft_limit))
+
+        assert port_scanner_widget._scan_concurrency(port_count) == expected
@@ -1,10 +1,12 @@
 """Functional tests for PortScannerWidget using Textual's test framework."""
 
+import asyncio
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 from textual.app import App, ComposeResult
+from textual.widgets import Label
 
 from shared.port_utils import PortCheckResult, PortStatus
 from tui.widgets.port_scanner_widget import PortScannerWidget
@@ -49,6 +51,8 @@ async def test_port_scan_success():
             # Check cell content
             assert widget.results_widget.get_cell("1", "port") == "80"
             assert widget.results_widget.get_cell("2", "port") == "443"
+            assert widget.results_widget.get_cell("1", "status") == "[green]OPEN[/green]"
+            assert widget.results_widget.get_cell("2", "status") == "[red]CLOSED[/red]"
 
 
 @pytest.mark.asyncio
@@ -106,3 +110,108 @@ async def test_parse_ports_input_logic():
     assert widget.parse_ports_input("1-10", "range") == list(range(1, 11))
     assert widget.parse_ports_input("10-1", "range") == list(range(1, 11))
     assert widget.parse_ports_input("1-6000", "range") is None  # Too large
+
+
+@pytest.mark.asyncio
+async def test_port_scan_running_tally():
+    """The summary line tallies results while the scan is still running."""
+    app = PortScannerMockApp()
+    release = asyncio.Event()
+
+    async def mock_stream(*args, **kwargs: Any):
+        yield PortCheckResult(host="localhost", port=80, status=PortStatus.OPEN, service_name="http", response_time_ms=5.0)
+        yield PortCheckResult(host="localhost", port=81, status=PortStatus.FILTERED, service_name=None, response_time_ms=0)
+        await release.wait()
+        yield PortCheckResult(host="localhost", port=443, status=PortStatus.CLOSED, service_name="https", response_time_ms=2.0)
+
+    with patch("tui.widgets.port_scanner_widget.check_multiple_ports_stream", side_effect=mock_stream):
+        async with app.run_test() as pilot:
+            widget = app.query_one(PortScannerWidget)
+            summary = app.query_one("#summary-label", Label)
+
+            await pilot.click("#host-input")
+            await pilot.press(*"localhost")
+            await pilot.click("#scan-btn")
+            await pilot.pause()
+
+            assert widget.scan_in_progress is True
+            assert widget.results_widget.row_count == 2
+            assert "Total: 2" in str(summary.content)
+            assert "Open: 1" in str(summary.content)
+            assert "Filtered: 1" in str(summary.content)
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert widget.scan_in_progress is False
+            assert "Total: 3" in str(summary.content)
+            assert "Closed: 1" in str(summary.content)
+            # The filtered probe has no response time and is left out of the average
+            assert "Avg Time: 3.5ms" in str(summary.content)
+
+
+@pytest.mark.asyncio
+async def test_port_scanner_clear_cancels_scan():
+    """Clearing mid-scan cancels the worker so no further rows arrive."""
+    app = PortScannerMockApp()
+    release = asyncio.Event()
+
+    async def mock_stream(*args, **kwargs: Any):
+        yield PortCheckResult(host="localhost", port=80, status=PortStatus.OPEN, service_name="http", response_time_ms=5.0)
+        await release.wait()
+        yield PortCheckResult(host="localhost", port=443, status=PortStatus.CLOSED, service_name="https", response_time_ms=2.0)
+
+    with patch("tui.widgets.port_scanner_widget.check_multiple_ports_stream", side_effect=mock_stream):
+        async with app.run_test() as pilot:
+            widget = app.query_one(PortScannerWidget)
+
+            await pilot.click("#host-input")
+            await pilot.press(*"localhost")
+            await pilot.click("#scan-btn")
+            await pilot.pause()
+            assert widget.scan_in_progress is True
+
+            widget.clear_results()
+            release.set()
+            await pilot.pause()
+
+            assert all(worker.is_cancelled for worker in app.workers)
+
+            assert widget.scan_in_progress is False
+            assert widget.results_widget.row_count == 0
+
+
+@pytest.mark.asyncio
+async def test_port_scanner_cancelled_scan_keeps_new_scan_flag():
+    """A cancelled worker finishing late must not clear the flag of the scan that replaced it."""
+    app = PortScannerMockApp()
+    release = asyncio.Event()
+    calls = 0
+
+    async def mock_stream(*args, **kwargs: Any):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await asyncio.Event().wait()
+        yield PortCheckResult(host="localhost", port=80, status=PortStatus.OPEN, service_name="http", response_time_ms=5.0)
+        await release.wait()
+
+    with patch("tui.widgets.port_scanner_widget.check_multiple_ports_stream", side_effect=mock_stream):
+        async with app.run_test() as pilot:
+            widget = app.query_one(PortScannerWidget)
+
+            await pilot.click("#host-input")
+            await pilot.press(*"localhost")
+            await pilot.click("#scan-btn")
+            await pilot.pause()
+
+            # Start the next scan before the cancelled worker has unwound
+            widget.clear_results()
+            widget._host_input.value = "localhost"
+            widget.scan_ports()
+            release.set()
+            await pilot.pause()
+
+            assert calls == 2
+            assert widget.scan_in_progress is True
@@ -0,0 +1,840 @@
+"""Tests for the OS-agnostic shared network toolkit.
+
+Covers the toolkit's parsing helpers and the caching around its slow network
+operations. Packets are crafted in memory with Scapy and external tools are
+mocked, so no capture privileges or network access are needed.
+"""
+
+import asyncio
+import io
+import multiprocessing
+import socket
+import sys
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scapy.all import LLC, SNAP, Dot1Q, Dot3, Ether, raw
+from scapy.contrib.cdp import (
+    CDPAddrRecordIPv4,
+    CDPMsgAddr,
+    CDPMsgDeviceID,
+    CDPMsgPlatform,
+    CDPMsgPortID,
+    CDPv2_HDR,
+)
+from scapy.contrib.lldp import (
+    LLDPDUChassisID,
+    LLDPDUEndOfLLDPDU,
+    LLDPDUGenericOrganisationSpecific,
+    LLDPDUManagementAddress,
+    LLDPDUPortDescription,
+    LLDPDUPortID,
+    LLDPDUSystemCapabilities,
+    LLDPDUSystemName,
+    LLDPDUTimeToLive,
+)
+
+from network_triage.shared.shared_toolkit import (
+    NetworkTriageToolkitBase,
+    _cdp_payload,
+    _discovery_worker,
+    _lldp_payload,
+    _parse_cdp,
+    _parse_lldp,
+)
+
+LLDP_MULTICAST = "01:80:c2:00:00:0e"
+CDP_MULTICAST = "01:00:0c:cc:cc:cc"
+
+
+def _lldp_tlvs():
+    return (
+        LLDPDUChassisID(subtype=4, id=b"\x00\x11\x22\x33\x44\x55")
+        / LLDPDUPortID(subtype=5, id=b"ge-0/0/1")
+        / LLDPDUTimeToLive(ttl=120)
+        / LLDPDUPortDescription(description=b"uplink")
+        / LLDPDUSystemName(system_name=b"core-sw1")
+        / LLDPDUManagementAddress(management_address_subtype=1, management_address=b"\x0a\x00\x00\x01")
+        / LLDPDUEndOfLLDPDU()
+    )
+
+
+def _tlv_bytes(tlvs) -> bytes:
+    # Scapy refuses to build LLDP TLVs without an Ethernet layer underneath.
+    return raw(Ether(dst=LLDP_MULTICAST, type=0x88CC) / tlvs)[14:]
+
+
+def _cdp_frame(*msgs) -> Ether:
+    frame = Dot3(dst=CDP_MULTICAST) / LLC() / SNAP() / CDPv2_HDR(msg=list(msgs))
+    # Re-dissect so the packet carries captured bytes in ``original``.
+    return Ether(raw(frame))
+
+
+class TestLLDPPayload:
+    """Test extraction of LLDP TLV bytes from captured frames."""
+
+    def test_payload_from_captured_frame(self):
+        """Test the TLV bytes are sliced from the original wire bytes."""
+        wire = raw(Ether(dst=LLDP_MULTICAST, type=0x88CC) / _lldp_tlvs())
+        packet = Ether(wire)
+        assert _lldp_payload(packet) == wire[14:]
+
+    def test_payload_from_vlan_tagged_frame(self):
+        """Test the 802.1Q tag is skipped when present."""
+        wire = raw(Ether(dst=LLDP_MULTICAST) / Dot1Q(vlan=10, type=0x88CC) / _lldp_tlvs())
+        packet = Ether(wire)
+        assert _lldp_payload(packet) == wire[18:]
+
+    def test_payload_is_a_view_of_the_frame(self):
+        """Test no copy of the captured bytes is made."""
+        packet = Ether(raw(Ether(dst=LLDP_MULTICAST, type=0x88CC) / _lldp_tlvs()))
+        assert _lldp_payload(packet).obj is packet.original
+
+
+class TestParseLLDP:
+    """Test the LLDP TLV walker."""
+
+    def test_extracts_fields(self):
+        """Test the displayed fields are pulled out of a full TLV stream."""
+        chassis, port, description, name, mgmt, vlan, capabilities = _parse_lldp(_tlv_bytes(_lldp_tlvs()))
+        assert chassis == b"\x00\x11\x22\x33\x44\x55"
+        assert port == b"ge-0/0/1"
+        assert description == b"uplink"
+        assert name == b"core-sw1"
+        assert mgmt == "10.0.0.1"
+        assert vlan is None
+        assert capabilities is None
+
+    def test_missing_optional_fields(self):
+        """Test absent TLVs come back as None."""
+        tlvs = LLDPDUChassisID(subtype=7, id=b"sw") / LLDPDUPortID(subtype=5, id=b"p1") / LLDPDUEndOfLLDPDU()
+        assert _parse_lldp(_tlv_bytes(tlvs)) == (b"sw", b"p1", None, None, None, None, None)
+
+    def test_capabilities_and_native_vlan(self):
+        """Test enabled capabilities and the 802.1 Port VLAN ID are decoded."""
+        tlvs = (
+            LLDPDUChassisID(subtype=7, id=b"sw")
+            / LLDPDUPortID(subtype=5, id=b"p1")
+            / LLDPDUSystemCapabilities(mac_bridge_available=1, router_available=1, mac_bridge_enabled=1, router_enabled=1)
+            / LLDPDUGenericOrganisationSpecific(org_code=0x0012BB, subtype=1, data=b"\x00\x0f\x01")
+            / LLDPDUGenericOrganisationSpecific(org_code=0x0080C2, subtype=1, data=b"\x00\x0a")
+            / LLDPDUEndOfLLDPDU()
+        )
+        *_, vlan, capabilities = _parse_lldp(_tlv_bytes(tlvs))
+        assert vlan == 10
+        assert capabilities == "Bridge, Router"
+
+    def test_ipv6_management_address_ignored(self):
+        """Test only IPv4 management addresses are decoded."""
+        tlvs = (
+            LLDPDUChassisID(subtype=7, id=b"sw")
+            / LLDPDUPortID(subtype=5, id=b"p1")
+            / LLDPDUManagementAddress(management_address_subtype=2, management_address=b"\x20\x01" + bytes(14))
+            / LLDPDUEndOfLLDPDU()
+        )
+        assert _parse_lldp(_tlv_bytes(tlvs))[4] is None
+
+    def test_truncated_payload(self):
+        """Test a TLV running past the buffer end stops the walk."""
+        chassis, port, *_ = _parse_lldp(_tlv_bytes(_lldp_tlvs())[:12])
+        assert chassis == b"\x00\x11\x22\x33\x44\x55"
+        assert port is None
+
+
+class TestParseCDP:
+    """Test the raw CDP TLV walker."""
+
+    def test_extracts_fields(self):
+        """Test device, port, platform and management address are read from the frame."""
+        packet = _cdp_frame(
+            CDPMsgDeviceID(val=b"access-sw2"),
+            CDPMsgAddr(addr=[CDPAddrRecordIPv4(addr="10.0.0.2")]),
+            CDPMsgPortID(iface=b"GigabitEthernet0/1"),
+            CDPMsgPlatform(val=b"cisco WS-C2960"),
+        )
+        assert _parse_cdp(_cdp_payload(packet)) == (b"access-sw2", b"GigabitEthernet0/1", b"cisco WS-C2960", "10.0.0.2")
+
+    def test_missing_fields(self):
+        """Test absent TLVs come back as None."""
+        packet = _cdp_frame(CDPMsgDeviceID(val=b"access-sw2"))
+        assert _parse_cdp(_cdp_payload(packet)) == (b"access-sw2", None, None, None)
+
+    def test_non_cdp_frame(self):
+        """Test frames to other destinations are not treated as CDP."""
+        packet = Ether(raw(Ether(dst=LLDP_MULTICAST, type=0x88CC) / _lldp_tlvs()))
+        assert _cdp_payload(packet) is None
+
+    def test_truncated_tlv(self):
+        """Test a TLV running past the buffer stops the walk."""
+        payload = bytes(_cdp_payload(_cdp_frame(CDPMsgDeviceID(val=b"access-sw2"), CDPMsgPortID(iface=b"Gi0/1"))))
+        assert _parse_cdp(payload[:-2]) == (b"access-sw2", None, None, None)
+
+
+NMAP_XML = b"""<?xml version="1.0"?>
+<nmaprun scanner="nmap">
+<host><status state="up"/><address addr="192.168.1.1" addrtype="ipv4"/>
+<address addr="AA:BB:CC:DD:EE:FF" addrtype="mac" vendor="Acme"/>
+<hostnames><hostname name="router.lan"/></hostnames></host>
+<host><status state="down"/><address addr="192.168.1.2" addrtype="ipv4"/></host>
+<host><status state="up"/><address addr="192.168.1.3" addrtype="ipv4"/></host>
+</nmaprun>
+"""
+
+
+def _fake_nmap(mocker, stdout: bytes, stderr: bytes = b"", returncode: int = 0):
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdout = io.BytesIO(stdout)
+    process.wait.return_value = returncode
+
+    def popen(command, **kwargs: object):
+        kwargs["stderr"].write(stderr)  # The stderr temporary file
+        return process
+
+    mocker.patch.object(NetworkTriageToolkitBase, "_get_nmap_path", return_value="/usr/bin/nmap")
+    mocker.patch("network_triage.shared.shared_toolkit.subprocess.Popen", side_effect=popen)
+    return process
+
+
+class TestRunNetworkScan:
+    """Test streaming nmap XML parsing in run_network_scan."""
+
+    def test_parses_up_hosts(self, mocker):
+        """Test only up hosts are returned with their details."""
+        _fake_nmap(mocker, NMAP_XML)
+        results = NetworkTriageToolkitBase().run_network_scan("192.168.1.0/24")
+        assert [r["ip"] for r in results] == ["192.168.1.1", "192.168.1.3"]
+        assert results[0]["hostname"] == "router.lan"
+        assert results[0]["vendor"] == "Acme"
+        assert results[1]["mac"] == ""
+
+    def test_nonzero_exit_reports_stderr(self, mocker):
+        """Test a failing nmap surfaces its stderr."""
+        _fake_nmap(mocker, b"", stderr=b"Failed to resolve target\n", returncode=1)
+        results = NetworkTriageToolkitBase().run_network_scan("bad..host")
+        assert results[0]["ip"] == "Error"
+        assert results[0]["status"] == "Failed to resolve target"
+
+    def test_malformed_xml_reports_error(self, mocker):
+        """Test truncated XML is reported rather than raised."""
+        _fake_nmap(mocker, NMAP_XML[:80])
+        results = NetworkTriageToolkitBase().run_network_scan("192.168.1.0/24")
+        assert results[0]["ip"] == "Error"
+
+    def test_malformed_xml_drains_in_chunks(self, mocker):
+        """Test the output after a parse error is discarded in bounded reads."""
+
+        class RecordingPipe(io.BytesIO):
+            def __init__(self, data: bytes) -> None:
+                super().__init__(data)
+                self.sizes: list[int | None] = []
+
+            def read(self, size: int | None = -1) -> bytes:
+                self.sizes.append(size)
+                return super().read(size)
+
+        process = _fake_nmap(mocker, b"")
+        process.stdout = pipe = RecordingPipe(b"<nmaprun><host></nmaprun>" + b"x" * 500_000)
+        results = NetworkTriageToolkitBase().run_network_scan("192.168.1.0/24")
+        assert results[0]["ip"] == "Error"
+        assert pipe.tell() == len(pipe.getvalue())
+        assert all(size is not None and size > 0 for size in pipe.sizes)
+
+    def test_hosts_detached_from_root(self, mocker):
+        """Test parsed hosts do not stay attached to the <nmaprun> root."""
+        roots = []
+        iterparse = ET.iterparse
+
+        def recording_iterparse(source, events=None):
+            for event, elem in iterparse(source, events):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        mocker.patch("network_triage.shared.shared_toolkit.ET.iterparse", side_effect=recording_iterparse)
+        _fake_nmap(mocker, NMAP_XML)
+        results = NetworkTriageToolkitBase().run_network_scan("192.168.1.0/24")
+        assert [r["ip"] for r in results] == ["192.168.1.1", "192.168.1.3"]
+        assert roots[0].tag == "nmaprun"
+        assert roots[0].findall("host") == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a shebang script as nmap")
+    def test_large_stderr_does_not_stall(self, mocker, tmp_path):
+        """Test nmap writing more than a pipe buffer of warnings still completes."""
+        fake_nmap = tmp_path / "nmap"
+        fake_nmap.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "sys.stderr.write('Warning: slow DNS\\n' * 20000)\n"
+            "sys.stderr.flush()\n"
+            f"sys.stdout.write({NMAP_XML.decode()!r})\n"
+        )
+        fake_nmap.chmod(0o755)
+        mocker.patch.object(NetworkTriageToolkitBase, "_get_nmap_path", return_value=str(fake_nmap))
+
+        results = NetworkTriageToolkitBase().run_network_scan("192.168.1.0/24")
+        assert [r["ip"] for r in results] == ["192.168.1.1", "192.168.1.3"]
+
+    def test_stop_keeps_hosts_found_so_far(self, mocker):
+        """Test stop_network_scan terminates nmap and the scan returns its partial results."""
+        toolkit = NetworkTriageToolkitBase()
+        process = _fake_nmap(mocker, NMAP_XML)
+        # Stop arrives while the scan is waiting for nmap to exit
+        process.wait.side_effect = lambda: toolkit.stop_network_scan() and -15
+
+        results = toolkit.run_network_scan("192.168.1.0/24")
+        process.terminate.assert_called_once_with()
+        assert [r["ip"] for r in results] == ["192.168.1.1", "192.168.1.3"]
+        assert toolkit.stop_network_scan() == "No scan is running."
+
+    def test_late_finish_keeps_newer_scan_handle(self, mocker):
+        """Test a scan that ends after a newer one started leaves the newer handle in place."""
+        toolkit = NetworkTriageToolkitBase()
+        newer = MagicMock()
+        process = _fake_nmap(mocker, NMAP_XML)
+        process.wait.side_effect = lambda: setattr(toolkit, "nmap_process", newer) or 0
+
+        toolkit.run_network_scan("192.168.1.0/24")
+        assert toolkit.nmap_process is newer
+        assert toolkit.stop_network_scan() == "Scan stopped."
+        newer.terminate.assert_called_once_with()
+
+
+class TestRunSpeedTest:
+    """Test best-server caching in run_speed_test."""
+
+    def _mock_speedtest(self, mocker):
+        client = MagicMock()
+        client.get_best_server.return_value = {"name": "Test Server", "url": "http://example.invalid/upload.php"}
+        client.results.dict.return_value = {"ping": 10.0, "download": 1e8, "upload": 5e7, "server": {"name": "Test Server"}}
+        client.results.share.return_value = None
+        mocker.patch("network_triage.shared.shared_toolkit.speedtest.Speedtest", return_value=client)
+        mocker.patch("network_triage.shared.shared_toolkit.speedtest.SpeedtestResults", return_value=client.results)
+        return client
+
+    def test_best_server_reused_within_ttl(self, mocker):
+        """Test a second run only re-pings the cached server."""
+        client = self._mock_speedtest(mocker)
+        toolkit = NetworkTriageToolkitBase()
+
+        toolkit.run_speed_test()
+        client.get_best_server.assert_called_once_with()
+
+        result = toolkit.run_speed_test()
+        assert client.get_best_server.call_args.args == (
+            [{"name": "Test Server", "url": "http://example.invalid/upload.php"}],
+        )
+        assert result["Download"] == "100.00 Mbps"
+
+    def test_best_server_refreshed_after_ttl(self, mocker):
+        """Test an expired cache entry triggers a full server selection."""
+        client = self._mock_speedtest(mocker)
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.run_speed_test()
+        timestamp, server = toolkit._speedtest_server_cache
+        toolkit._speedtest_server_cache = (timestamp - 301, server)
+
+        toolkit.run_speed_test()
+        assert client.get_best_server.call_args.args == ()
+
+    def test_parallel_runs_both_directions(self, mocker):
+        """Test parallel mode still runs download and upload once each."""
+        client = self._mock_speedtest(mocker)
+        result = NetworkTriageToolkitBase().run_speed_test(parallel=True)
+        client.download.assert_called_once_with()
+        client.upload.assert_called_once_with(pre_allocate=False)
+        assert result["Upload"] == "50.00 Mbps"
+
+    def test_client_reused_between_runs(self, mocker):
+        """Test the configured client is built once and kept across runs."""
+        client = self._mock_speedtest(mocker)
+        speedtest_cls = mocker.patch("network_triage.shared.shared_toolkit.speedtest.Speedtest", return_value=client)
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.run_speed_test()
+        toolkit.run_speed_test()
+        speedtest_cls.assert_called_once_with(secure=True, shutdown_event=toolkit.stop_speedtest_event)
+
+    def test_stopped_run_reports_cancellation(self, mocker):
+        """Test a run stopped mid-transfer returns an error instead of partial rates."""
+        client = self._mock_speedtest(mocker)
+        toolkit = NetworkTriageToolkitBase()
+        client.download.side_effect = toolkit.stop_speed_test
+
+        result = toolkit.run_speed_test()
+        assert result == {"Error": "Speed test cancelled"}
+        client.results.dict.assert_not_called()
+
+    def test_failure_clears_cache(self, mocker):
+        """Test a failed run forgets the cached server."""
+        client = self._mock_speedtest(mocker)
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.run_speed_test()
+        client.download.side_effect = RuntimeError("connection reset")
+
+        result = toolkit.run_speed_test()
+        assert "Error" in result
+        assert toolkit._speedtest_server_cache is None
+        assert toolkit._speedtest_client is None
+
+
+class TestPublicIpCache:
+    """Test public IP reuse across dashboard refreshes."""
+
+    def test_reused_on_same_network(self):
+        """Test a second lookup on the same network skips the fetch."""
+        toolkit = NetworkTriageToolkitBase()
+        fetch = MagicMock(return_value="203.0.113.7")
+
+        assert toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch) == "203.0.113.7"
+        assert toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch) == "203.0.113.7"
+        fetch.assert_called_once_with()
+
+    def test_refetched_when_network_changes(self):
+        """Test a new internal IP or gateway bypasses the cache."""
+        toolkit = NetworkTriageToolkitBase()
+        fetch = MagicMock(side_effect=["203.0.113.7", "198.51.100.9"])
+
+        toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch)
+        assert toolkit._cached_public_ip("10.0.0.5", "10.0.0.1", fetch) == "198.51.100.9"
+
+    def test_refetched_after_ttl(self):
+        """Test an expired entry triggers a new fetch."""
+        toolkit = NetworkTriageToolkitBase()
+        fetch = MagicMock(side_effect=["203.0.113.7", "198.51.100.9"])
+        toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch)
+        timestamp, network, public_ip = toolkit._public_ip_cache
+        toolkit._public_ip_cache = (timestamp - 901, network, public_ip)
+
+        assert toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch) == "198.51.100.9"
+
+    def test_failure_not_cached(self):
+        """Test a failed fetch raises and the next call tries again."""
+        toolkit = NetworkTriageToolkitBase()
+        fetch = MagicMock(side_effect=[OSError("offline"), "203.0.113.7"])
+
+        with pytest.raises(OSError, match="offline"):
+            toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch)
+        assert toolkit._cached_public_ip("192.168.1.5", "192.168.1.1", fetch) == "203.0.113.7"
+
+
+@pytest.fixture
+def empty_dns_cache():
+    """Start each test with the module-level DNS caches empty."""
+    NetworkTriageToolkitBase().clear_dns_cache()
+
+
+@pytest.mark.usefixtures("empty_dns_cache")
+class TestDNSResolutionAsync:
+    """Test the non-blocking DNS resolution helpers."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_on_running_loop(self, mocker):
+        """Test the address comes from the loop's getaddrinfo."""
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        mocker.patch("asyncio.BaseEventLoop.getaddrinfo", return_value=infos)
+        result = await NetworkTriageToolkitBase().dns_resolution_test_async("example.com")
+        assert result == "DNS resolution for example.com: 93.184.216.34"
+
+    @pytest.mark.asyncio
+    async def test_failure_message(self, mocker):
+        """Test resolver errors map to the same message as the sync method."""
+        mocker.patch("asyncio.BaseEventLoop.getaddrinfo", side_effect=socket.gaierror("no such host"))
+        result = await NetworkTriageToolkitBase().dns_resolution_test_async("nonexistent.invalid")
+        assert result == "DNS resolution failed for nonexistent.invalid. Check your DNS settings."
+
+    @pytest.mark.asyncio
+    async def test_resolve_host_returns_address(self, mocker):
+        """Test a resolvable host comes back as its IPv4 address."""
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        mocker.patch("asyncio.BaseEventLoop.getaddrinfo", return_value=infos)
+        assert await NetworkTriageToolkitBase().resolve_host_async("example.com") == "93.184.216.34"
+
+    @pytest.mark.asyncio
+    async def test_resolve_host_takes_first_answer_of_any_family(self, mocker):
+        """Test the resolver's first answer wins, even when it is IPv6."""
+        infos = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2606:2800:220:1::", 0, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0)),
+        ]
+        getaddrinfo = mocker.patch("asyncio.BaseEventLoop.getaddrinfo", return_value=infos)
+        assert await NetworkTriageToolkitBase().resolve_host_async("example.com") == "2606:2800:220:1::"
+        assert getaddrinfo.call_args.kwargs["family"] == socket.AF_UNSPEC
+
+    @pytest.mark.asyncio
+    async def test_resolve_host_does_not_share_ipv4_cache(self, mocker):
+        """Test an IPv6 answer for ping is not served to the IPv4 DNS check."""
+
+        async def fake_getaddrinfo(host, *args, family: int = 0, **kwargs: object):
+            if family == socket.AF_INET:
+                return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+            return [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2606:2800:220:1::", 0, 0, 0))]
+
+        mocker.patch("asyncio.BaseEventLoop.getaddrinfo", side_effect=fake_getaddrinfo)
+        toolkit = NetworkTriageToolkitBase()
+        assert await toolkit.resolve_host_async("example.com") == "2606:2800:220:1::"
+        assert await toolkit.dns_resolution_test_async("example.com") == "DNS resolution for example.com: 93.184.216.34"
+
+    @pytest.mark.asyncio
+    async def test_resolve_host_falls_back_to_name(self, mocker):
+        """Test an unresolvable host is handed back unchanged."""
+        mocker.patch("asyncio.BaseEventLoop.getaddrinfo", side_effect=socket.gaierror("no such host"))
+        assert await NetworkTriageToolkitBase().resolve_host_async("ipv6only.example") == "ipv6only.example"
+
+
+class TestSystemInfo:
+    """Test the per-toolkit cache around get_system_info."""
+
+    def test_read_once_per_toolkit(self, mocker):
+        """Test repeated calls reuse the first lookup and return independent dicts."""
+        hostname = mocker.patch("socket.gethostname", return_value="triage-host")
+        toolkit = NetworkTriageToolkitBase()
+        first = toolkit.get_system_info()
+        first["Hostname"] = "changed"
+        assert toolkit.get_system_info()["Hostname"] == "triage-host"
+        hostname.assert_called_once()
+
+    def test_failed_read_not_cached(self, mocker):
+        """Test a lookup that raises is retried on the next call."""
+        mocker.patch("socket.gethostname", side_effect=[OSError("uname failed"), "triage-host"])
+        toolkit = NetworkTriageToolkitBase()
+        with pytest.raises(OSError, match="uname failed"):
+            toolkit.get_system_info()
+        assert toolkit.get_system_info()["Hostname"] == "triage-host"
+
+
+@pytest.mark.usefixtures("empty_dns_cache")
+class TestDNSCache:
+    """Test the TTL cache in front of the resolver."""
+
+    def test_answer_reused_within_ttl(self, mocker):
+        """Test a repeated lookup is served from the cache."""
+        lookup = mocker.patch("socket.gethostbyname", return_value="93.184.216.34")
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.dns_resolution_test("example.com")
+        result = toolkit.dns_resolution_test("example.com")
+        assert result == "DNS resolution for example.com: 93.184.216.34"
+        lookup.assert_called_once()
+
+    def test_failure_cached_briefly(self, mocker):
+        """Test failures are cached with the shorter negative TTL."""
+        lookup = mocker.patch("socket.gethostbyname", side_effect=socket.gaierror("no such host"))
+        clock = mocker.patch("network_triage.shared.shared_toolkit.time.monotonic", return_value=1000.0)
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.dns_resolution_test("nonexistent.invalid")
+        result = toolkit.dns_resolution_test("nonexistent.invalid")
+        assert result == "DNS resolution failed for nonexistent.invalid. Check your DNS settings."
+        assert lookup.call_count == 1
+        clock.return_value = 1006.0
+        toolkit.dns_resolution_test("nonexistent.invalid")
+        assert lookup.call_count == 2
+
+    def test_clear_dns_cache(self, mocker):
+        """Test clearing the cache forces a fresh lookup."""
+        lookup = mocker.patch("socket.gethostbyname", return_value="93.184.216.34")
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.dns_resolution_test("example.com")
+        toolkit.clear_dns_cache()
+        toolkit.dns_resolution_test("example.com")
+        assert lookup.call_count == 2
+
+
+@pytest.mark.usefixtures("empty_dns_cache")
+class TestPortScan:
+    """Test the multiplexed TCP port scan."""
+
+    @pytest.fixture
+    def listener(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            yield server.getsockname()[1]
+
+    @pytest.fixture
+    def closed_port(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            return probe.getsockname()[1]
+
+    def test_reports_open_and_closed(self, listener, closed_port):
+        """Test open and refused ports are told apart in one scan."""
+        results = NetworkTriageToolkitBase().port_scan("127.0.0.1", [listener, closed_port], timeout=1.0)
+        assert results == {listener: True, closed_port: False}
+
+    def test_ports_split_into_batches(self, listener, closed_port, monkeypatch):
+        """Test scans larger than one batch still cover every port."""
+        monkeypatch.setattr("network_triage.shared.shared_toolkit._PORT_SCAN_BATCH", 1)
+        results = NetworkTriageToolkitBase().port_scan("127.0.0.1", [closed_port, listener], timeout=1.0)
+        assert results == {closed_port: False, listener: True}
+
+    def test_single_port_test_delegates(self, listener):
+        """Test port_connectivity_test keeps its message format."""
+        result = NetworkTriageToolkitBase().port_connectivity_test("127.0.0.1", str(listener))
+        assert result == f"Port {listener} on 127.0.0.1 is OPEN."
+
+    def test_dual_stack_host_falls_back_to_ipv4(self, listener, mocker):
+        """Test a port only reachable over IPv4 is found when IPv6 is tried alongside."""
+        mocker.patch(
+            "socket.getaddrinfo",
+            return_value=[
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 0)),
+            ],
+        )
+        assert NetworkTriageToolkitBase().port_scan("dual.example", [listener], timeout=1.0) == {listener: True}
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 not available")
+    def test_ipv6_literal(self):
+        """Test IPv6 addresses are scanned over AF_INET6."""
+        try:
+            server = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+            server.bind(("::1", 0))
+        except OSError:
+            pytest.skip("IPv6 loopback not configured")
+        with server:
+            server.listen()
+            port = server.getsockname()[1]
+            assert NetworkTriageToolkitBase().port_scan("::1", [port], timeout=1.0) == {port: True}
+
+    def test_resolution_cached_across_checks(self, listener, closed_port, mocker):
+        """Test checking several ports on one host resolves it only once."""
+        lookup = mocker.patch("socket.getaddrinfo", wraps=socket.getaddrinfo)
+        toolkit = NetworkTriageToolkitBase()
+        toolkit.port_connectivity_test("127.0.0.1", listener)
+        toolkit.port_connectivity_test("127.0.0.1", closed_port)
+        lookup.assert_called_once()
+
+    def test_unresolvable_host(self, mocker):
+        """Test resolver failures keep the existing message."""
+        mocker.patch("socket.getaddrinfo", side_effect=socket.gaierror("no such host"))
+        result = NetworkTriageToolkitBase().port_connectivity_test("nonexistent.invalid", 80)
+        assert result == "Hostname 'nonexistent.invalid' could not be resolved."
+
+    def test_invalid_port(self):
+        """Test a non-numeric port is rejected before scanning."""
+        assert (
+            NetworkTriageToolkitBase().port_connectivity_test("127.0.0.1", "http")
+            == "Invalid port number. Please enter an integer."
+        )
+
+
+class TestDiscoveryCapture:
+    """Test the LLDP/CDP capture loop with a fake sniffer.
+
+    The capture process is replaced by a thread running the same worker
+    function over a real pipe.
+    """
+
+    def _run_capture(self, mocker, packets, toolkit=None):
+        mocker.patch("network_triage.shared.shared_toolkit.os.geteuid", return_value=0, create=True)
+        listen = mocker.patch("network_triage.shared.shared_toolkit.conf")
+        listen.L2listen.return_value.closed = False
+
+        def fake_sniffer(**kwargs: object):
+            sniffer = MagicMock()
+
+            def join():
+                for packet in packets:
+                    if kwargs["stop_filter"](packet):
+                        break
+
+            sniffer.join.side_effect = join
+            return sniffer
+
+        def fake_connection(self):
+            if self._discovery_conn is None:
+                parent_conn, child_conn = multiprocessing.Pipe()
+                worker = threading.Thread(target=_discovery_worker, args=(child_conn,), daemon=True)
+                worker.start()
+                self._discovery_process = MagicMock(is_alive=worker.is_alive)
+                self._discovery_process.join.side_effect = worker.join
+                self._discovery_conn = parent_conn
+            return self._discovery_conn
+
+        mocker.patch.object(NetworkTriageToolkitBase, "_discovery_connection", fake_connection)
+        sniffer_cls = mocker.patch("network_triage.shared.shared_toolkit.AsyncSniffer", side_effect=fake_sniffer)
+        lines: list[str] = []
+        (toolkit or NetworkTriageToolkitBase())._run_discovery_capture(lines.append, timeout=1)
+        return lines, sniffer_cls
+
+    def test_reports_lldp_neighbor(self, mocker):
+        """Test an LLDP frame is decoded and reported once."""
+        packet = Ether(raw(Ether(dst=LLDP_MULTICAST, type=0x88CC) / _lldp_tlvs()))
+        lines, _ = self._run_capture(mocker, [packet, packet])
+        assert len(lines) == 1
+        assert "System Name: core-sw1" in lines[0]
+        assert "Management Address: 10.0.0.1" in lines[0]
+
+    def test_reports_cdp_neighbor(self, mocker):
+        """Test a CDP frame is decoded without Scapy's CDP layers."""
+        packet = _cdp_frame(CDPMsgDeviceID(val=b"access-sw2"), CDPMsgPortID(iface=b"Gi0/1"))
+        lines, _ = self._run_capture(mocker, [packet])
+        assert lines == [
+            "--- CDP Packet Found ---\nDevice ID: access-sw2\nManagement Address: N-A\nPort ID: Gi0/1\nPlatform: N-A"
+        ]
+
+    def test_no_packets_reports_timeout(self, mocker):
+        """Test an empty capture reports that nothing was found."""
+        lines, sniffer_cls = self._run_capture(mocker, [])
+        assert "No LLDP or CDP packets found" in lines[-1]
+        assert sniffer_cls.call_args.kwargs["store"] is False
+
+    def test_stop_interrupts_idle_capture(self, mocker):
+        """Test stopping a scan with no traffic returns at once and kills the capture process."""
+        mocker.patch("network_triage.shared.shared_toolkit.os.geteuid", return_value=0, create=True)
+        toolkit = NetworkTriageToolkitBase()
+        process = MagicMock()
+        process.is_alive.return_value = True
+        parent_conn, child_conn = multiprocessing.Pipe()
+        toolkit._discovery_process, toolkit._discovery_conn = process, parent_conn
+        lines: list[str] = []
+        scan = threading.Thread(target=toolkit._run_discovery_capture, args=(lines.append, 60))
+        scan.start()
+        assert child_conn.recv() == 60
+        toolkit.stop_discovery_capture()
+        scan.join(timeout=1)
+        assert not scan.is_alive()
+        process.terminate.assert_called_once()
+        assert toolkit._discovery_process is None
+        assert lines == []
+        child_conn.close()
+
+    def test_listen_socket_reused_between_scans(self, mocker):
+        """Test the worker opens the filtered L2 socket once and closes it on shutdown."""
+        toolkit = NetworkTriageToolkitBase()
+        _, sniffer_cls = self._run_capture(mocker, [], toolkit)
+        first = sniffer_cls.call_args.kwargs["opened_socket"]
+        toolkit._run_discovery_capture(lambda _line: None, timeout=1)
+        assert sniffer_cls.call_args.kwargs["opened_socket"] is first
+        toolkit.close()
+        first.close.assert_called_once()
+
+
+class TestContinuousPing:
+    """Test line splitting in the binary continuous_ping reader."""
+
+    def _run_ping(self, mocker, output: bytes, toolkit=None):
+        process = MagicMock()
+        process.stdout = io.BytesIO(output)
+        mocker.patch("network_triage.shared.shared_toolkit.subprocess.Popen", return_value=process)
+        lines: list[str] = []
+        (toolkit or NetworkTriageToolkitBase()).continuous_ping("192.0.2.1", lines.append)
+        return lines, process
+
+    def test_lines_split_across_reads(self, mocker, monkeypatch, sample_ping_output_linux):
+        """Test lines straddling buffer boundaries are delivered whole."""
+        monkeypatch.setattr("network_triage.shared.shared_toolkit._PING_READ_SIZE", 16)
+        lines, _ = self._run_ping(mocker, sample_ping_output_linux.encode())
+        assert "".join(lines) == sample_ping_output_linux
+        assert lines[2].startswith("64 bytes from") and lines[2].endswith("ms\n")
+
+    def test_windows_ping_runs_until_stopped(self, mocker, monkeypatch):
+        """Test the platform ping prefix (``-t`` on Windows) is used."""
+        monkeypatch.setattr("network_triage.shared.shared_toolkit._PING_COMMAND", ("ping", "-t"))
+        popen = mocker.patch(
+            "network_triage.shared.shared_toolkit.subprocess.Popen", return_value=MagicMock(stdout=io.BytesIO(b""))
+        )
+        NetworkTriageToolkitBase().continuous_ping("192.0.2.1", lambda _line: None)
+        assert popen.call_args.args[0] == ["ping", "-t", "192.0.2.1"]
+
+    def test_crlf_normalized(self, mocker):
+        """Test Windows line endings reach the callback as plain newlines."""
+        lines, _ = self._run_ping(mocker, b"Reply from 8.8.8.8: time=20ms\r\nReply from 8.8.8.8: time=19ms\r\n")
+        assert lines == ["Reply from 8.8.8.8: time=20ms\n", "Reply from 8.8.8.8: time=19ms\n"]
+
+    def test_trailing_partial_line_flushed(self, mocker):
+        """Test output without a final newline is still delivered."""
+        lines, _ = self._run_ping(mocker, b"first\nsecond")
+        assert lines == ["first\n", "second"]
+
+    def test_stop_terminates_process(self, mocker):
+        """Test a pending stop request terminates ping before more output is delivered."""
+        toolkit = NetworkTriageToolkitBase()
+        mocker.patch.object(toolkit.stop_ping_event, "clear")
+        toolkit.stop_ping_event.set()
+        lines, process = self._run_ping(mocker, b"64 bytes from 192.0.2.1\n", toolkit)
+        assert lines == []
+        process.terminate.assert_called_once()
+
+
+class TestContinuousPingAsync:
+    """Test the event-loop based continuous_ping_async reader."""
+
+    def _fake_process(self, mocker, output: bytes, eof: bool = True):
+        reader = asyncio.StreamReader()
+        reader.feed_data(output)
+        if eof:
+            reader.feed_eof()
+        process = MagicMock(stdout=reader, returncode=None)
+        process.wait = mocker.AsyncMock(return_value=0)
+        mocker.patch("asyncio.create_subprocess_exec", mocker.AsyncMock(return_value=process))
+        return process
+
+    @pytest.mark.asyncio
+    async def test_delivers_lines(self, mocker):
+        """Test each output line reaches the callback with a plain newline."""
+        self._fake_process(mocker, b"Reply from 8.8.8.8: time=20ms\r\nReply from 8.8.8.8: time=19ms\r\n")
+        lines: list[str] = []
+        await NetworkTriageToolkitBase().continuous_ping_async("8.8.8.8", lines.append)
+        assert lines == ["Reply from 8.8.8.8: time=20ms\n", "Reply from 8.8.8.8: time=19ms\n"]
+
+    @pytest.mark.asyncio
+    async def test_stop_ping_terminates_process(self, mocker):
+        """Test stop_ping ends a ping that is waiting for more output."""
+        process = self._fake_process(mocker, b"64 bytes from 192.0.2.1\n", eof=False)
+        toolkit = NetworkTriageToolkitBase()
+        lines: list[str] = []
+
+        def on_line(line: str) -> None:
+            lines.append(line)
+            toolkit.stop_ping()
+
+        await asyncio.wait_for(toolkit.continuous_ping_async("192.0.2.1", on_line), timeout=1)
+        assert lines == ["64 bytes from 192.0.2.1\n"]
+        process.terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stop_ping_stops_every_concurrent_ping(self, mocker):
+        """Test one stop_ping call ends all pings running on the loop, not just the latest."""
+        processes = []
+
+        async def spawn(*args, **kwargs: object):
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"64 bytes from 192.0.2.1\n")
+            process = MagicMock(stdout=reader, returncode=None)
+            process.wait = mocker.AsyncMock(return_value=0)
+            processes.append(process)
+            return process
+
+        mocker.patch("asyncio.create_subprocess_exec", side_effect=spawn)
+        toolkit = NetworkTriageToolkitBase()
+        lines: list[str] = []
+        both_running = asyncio.Event()
+
+        def on_line(line: str) -> None:
+            lines.append(line)
+            if len(lines) == 2:
+                both_running.set()
+
+        pings = asyncio.gather(*(toolkit.continuous_ping_async(host, on_line) for host in ("192.0.2.1", "192.0.2.2")))
+        await asyncio.wait_for(both_running.wait(), timeout=1)
+
+        toolkit.stop_ping()
+        await asyncio.wait_for(pings, timeout=1)
+        for process in processes:
+            process.terminate.assert_called_once()
+        assert not toolkit._ping_stop_events
+
+    @pytest.mark.asyncio
+    async def test_missing_ping_binary(self, mocker):
+        """Test a missing ping executable is reported through the callback."""
+        mocker.patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError)
+        lines: list[str] = []
+        await NetworkTriageToolkitBase().continuous_ping_async("192.0.2.1", lines.append)
+        assert lines == ["Ping command not found. Is it in your system's PATH?"]